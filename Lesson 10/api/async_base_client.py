@@ -0,0 +1,246 @@
+"""Асинхронный базовый класс для API клиентов на aiohttp."""
+
+import asyncio
+from typing import Dict, Any, Mapping, Optional
+
+import aiohttp
+from requests.utils import parse_header_links
+
+from . import json_codec
+
+
+class AsyncAPIResponse:
+    """
+    Прочитанный ответ асинхронного клиента.
+
+    Тело ответа читается внутри ограничения параллелизма, поэтому соединение
+    возвращается в пул сразу, а ответ можно использовать после выхода из запроса.
+    """
+
+    def __init__(self, status: int, headers: Mapping[str, str], content: bytes) -> None:
+        """
+        Инициализация ответа.
+
+        Args:
+            status (int): HTTP статус
+            headers (Mapping[str, str]): Заголовки ответа
+            content (bytes): Тело ответа
+        """
+        self.status = status
+        self.headers = headers
+        self.content = content
+
+    def json(self) -> Any:
+        """
+        Декодировать тело ответа как JSON.
+
+        Returns:
+            Any: Декодированные данные
+        """
+        return json_codec.loads(self.content)
+
+    @property
+    def links(self) -> Dict[str, Dict[str, str]]:
+        """
+        Разобрать заголовок Link так же, как requests.Response.links.
+
+        Returns:
+            Dict[str, Dict[str, str]]: Ссылки по rel (или url, если rel нет)
+        """
+        header = self.headers.get('Link')
+        if not header:
+            return {}
+        return {link.get('rel') or link.get('url'): link for link in parse_header_links(header)}
+
+
+class AsyncBaseAPIClient:
+    """
+    Асинхронный базовый класс для API клиентов.
+
+    Все запросы идут через общий пул соединений aiohttp, а количество
+    одновременных запросов ограничено семафором. Методы не размечены
+    allure.step: шаги Allure привязаны к потоку и перемешиваются
+    при конкурентном выполнении корутин.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30,
+                 connect_timeout: Optional[float] = None,
+                 max_concurrency: int = 100, pool_size: int = 100,
+                 pool_size_per_host: int = 0) -> None:
+        """
+        Инициализация асинхронного API клиента.
+
+        Args:
+            base_url (str): Базовый URL API
+            timeout (float): Таймаут чтения ответа в секундах
+            connect_timeout (Optional[float]): Таймаут установки соединения
+                в секундах. Если не указан, равен timeout.
+            max_concurrency (int): Максимум одновременных запросов
+            pool_size (int): Максимум соединений в пуле
+            pool_size_per_host (int): Максимум соединений на хост, 0 — без ограничения
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency должен быть положительным числом")
+        self.base_url = base_url.rstrip('/')
+        self.timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=connect_timeout if connect_timeout is not None else timeout,
+            sock_read=timeout
+        )
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.headers: Dict[str, str] = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        }
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Получить сессию aiohttp, создав ее в текущем цикле событий.
+
+        Returns:
+            aiohttp.ClientSession: Сессия с общим пулом соединений
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size, limit_per_host=self.pool_size_per_host
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> AsyncAPIResponse:
+        """
+        Выполнить HTTP запрос в пределах ограничения параллелизма.
+
+        Args:
+            method (str): HTTP метод
+            endpoint (str): Эндпоинт для запроса
+            **kwargs (Any): Дополнительные аргументы aiohttp.ClientSession.request
+
+        Returns:
+            AsyncAPIResponse: Прочитанный ответ сервера
+
+        Raises:
+            aiohttp.ClientResponseError: если сервер вернул статус 4xx/5xx
+            asyncio.TimeoutError: если истек таймаут соединения или чтения
+        """
+        session = await self._get_session()
+        async with self._semaphore:
+            async with session.request(method, self._build_url(endpoint),
+                                       headers=self.headers, **kwargs) as response:
+                content = await response.read()
+                response.raise_for_status()
+                return AsyncAPIResponse(response.status, response.headers, content)
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> AsyncAPIResponse:
+        """
+        Выполнить GET запрос к API.
+
+        Args:
+            endpoint (str): Эндпоинт для запроса
+            params (Optional[Dict[str, Any]]): Параметры запроса
+
+        Returns:
+            AsyncAPIResponse: Ответ сервера
+        """
+        return await self._request("GET", endpoint, params=params)
+
+    async def head(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> AsyncAPIResponse:
+        """
+        Выполнить HEAD запрос к API: только статус и заголовки, без тела.
+
+        Args:
+            endpoint (str): Эндпоинт для запроса
+            params (Optional[Dict[str, Any]]): Параметры запроса
+
+        Returns:
+            AsyncAPIResponse: Ответ сервера с пустым телом
+        """
+        return await self._request("HEAD", endpoint, params=params)
+
+    async def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> AsyncAPIResponse:
+        """
+        Выполнить POST запрос к API.
+
+        Args:
+            endpoint (str): Эндпоинт для запроса
+            data (Optional[Dict[str, Any]]): Данные для отправки
+
+        Returns:
+            AsyncAPIResponse: Ответ сервера
+        """
+        return await self._request("POST", endpoint, json=data)
+
+    async def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> AsyncAPIResponse:
+        """
+        Выполнить PUT запрос к API.
+
+        Args:
+            endpoint (str): Эндпоинт для запроса
+            data (Optional[Dict[str, Any]]): Данные для обновления
+
+        Returns:
+            AsyncAPIResponse: Ответ сервера
+        """
+        return await self._request("PUT", endpoint, json=data)
+
+    async def delete(self, endpoint: str) -> AsyncAPIResponse:
+        """
+        Выполнить DELETE запрос к API.
+
+        Args:
+            endpoint (str): Эндпоинт для запроса
+
+        Returns:
+            AsyncAPIResponse: Ответ сервера
+        """
+        return await self._request("DELETE", endpoint)
+
+    def set_auth_token(self, token: str) -> None:
+        """
+        Установить токен авторизации для запросов.
+
+        Args:
+            token (str): JWT токен или другой токен авторизации
+        """
+        self.headers['Authorization'] = f'Bearer {token}'
+
+    def clear_auth_token(self) -> None:
+        """
+        Удалить токен авторизации из заголовков.
+        """
+        self.headers.pop('Authorization', None)
+
+    async def close(self) -> None:
+        """
+        Закрыть сессию и соединения пула.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncBaseAPIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def _build_url(self, endpoint: str) -> str:
+        """
+        Построить полный URL из базового URL и эндпоинта.
+
+        Абсолютный URL (например, из заголовка Link) возвращается как есть.
+
+        Args:
+            endpoint (str): Эндпоинт или абсолютный URL
+
+        Returns:
+            str: Полный URL
+        """
+        if endpoint.startswith(('http://', 'https://')):
+            return endpoint
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
@@ -0,0 +1,200 @@
+"""Асинхронный API клиент для работы с учителями."""
+
+from typing import Dict, Any, AsyncIterator, List, Optional
+
+import aiohttp
+
+from .async_base_client import AsyncBaseAPIClient
+from .pagination import PageRequest, next_link, next_page
+
+
+class AsyncTeacherAPI(AsyncBaseAPIClient):
+    """
+    Асинхронный API клиент для работы с учителями через REST API.
+
+    Повторяет методы TeacherAPI в виде корутин. Вызовы можно запускать
+    тысячами через asyncio.gather: одновременно выполняется не больше
+    max_concurrency запросов.
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8080/api/v1", **client_options: Any) -> None:
+        """
+        Инициализация асинхронного API клиента для учителей.
+
+        Args:
+            base_url (str): Базовый URL API учителей
+            **client_options (Any): Параметры AsyncBaseAPIClient
+                (таймауты, пул соединений, max_concurrency)
+        """
+        super().__init__(base_url, **client_options)
+        self._head_supported = True
+
+    async def get_all_teachers(self) -> List[Dict[str, Any]]:
+        """
+        Получить список всех учителей.
+
+        Returns:
+            List[Dict[str, Any]]: Список словарей с данными учителей
+        """
+        response = await self.get("teachers")
+        return response.json()
+
+    async def iter_teachers(self, page_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Итерироваться по всем учителям страницами.
+
+        Способы пагинации те же, что у TeacherAPI.iter_teachers
+        (см. pagination.next_page): заголовок Link rel="next", курсор или
+        номер страницы в теле ответа и keyset по limit/after_id.
+
+        Args:
+            page_size (int): Размер страницы
+
+        Yields:
+            Dict[str, Any]: Данные учителя
+        """
+        if page_size <= 0:
+            raise ValueError("page_size должен быть положительным числом")
+        request: Optional[PageRequest] = ("teachers", {"limit": page_size})
+        while request is not None:
+            endpoint, params = request
+            response = await self.get(endpoint, params=params)
+            after_id = params.get("after_id") if params else None
+            items, request = next_page(response.json(), next_link(response), page_size, after_id)
+            for teacher in items:
+                yield teacher
+
+    async def get_teacher_by_id(self, teacher_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Получить данные учителя по ID.
+
+        Args:
+            teacher_id (int): ID учителя
+
+        Returns:
+            Optional[Dict[str, Any]]: Данные учителя или None если не найден
+        """
+        try:
+            response = await self.get(f"teachers/{teacher_id}")
+            return response.json()
+        except Exception:
+            return None
+
+    async def create_teacher(self, teacher_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Создать нового учителя.
+
+        Args:
+            teacher_data (Dict[str, Any]): Данные нового учителя
+
+        Returns:
+            Dict[str, Any]: Данные созданного учителя
+        """
+        response = await self.post("teachers", data=teacher_data)
+        return response.json()
+
+    async def update_teacher(self, teacher_id: int, teacher_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Обновить данные учителя.
+
+        Args:
+            teacher_id (int): ID учителя для обновления
+            teacher_data (Dict[str, Any]): Новые данные учителя
+
+        Returns:
+            Dict[str, Any]: Обновленные данные учителя
+        """
+        response = await self.put(f"teachers/{teacher_id}", data=teacher_data)
+        return response.json()
+
+    async def update_teacher_email(self, teacher_id: int, new_email: str) -> Dict[str, Any]:
+        """
+        Обновить email учителя.
+
+        Args:
+            teacher_id (int): ID учителя для обновления
+            new_email (str): Новый email
+
+        Returns:
+            Dict[str, Any]: Обновленные данные учителя
+        """
+        return await self.update_teacher(teacher_id, {"email": new_email})
+
+    async def delete_teacher(self, teacher_id: int) -> bool:
+        """
+        Удалить учителя по ID.
+
+        Args:
+            teacher_id (int): ID учителя для удаления
+
+        Returns:
+            bool: True если удален успешно
+        """
+        try:
+            await self.delete(f"teachers/{teacher_id}")
+            return True
+        except Exception:
+            return False
+
+    async def teacher_exists(self, teacher_id: int) -> bool:
+        """
+        Проверить существование учителя по ID.
+
+        Отправляется HEAD запрос без тела ответа. Если сервер не поддерживает
+        HEAD (405 или 501), выполняется GET, и дальше клиент сразу использует GET.
+
+        Args:
+            teacher_id (int): ID учителя для проверки
+
+        Returns:
+            bool: True если учитель существует, False если сервер вернул 404
+
+        Raises:
+            aiohttp.ClientResponseError: если сервер вернул другой статус 4xx/5xx
+            aiohttp.ClientError: если сервер недоступен
+            asyncio.TimeoutError: если истек таймаут
+        """
+        endpoint = f"teachers/{teacher_id}"
+        if self._head_supported:
+            try:
+                await self.head(endpoint)
+                return True
+            except aiohttp.ClientResponseError as error:
+                if error.status == 404:
+                    return False
+                if error.status not in (405, 501):
+                    raise
+                self._head_supported = False
+        try:
+            await self.get(endpoint)
+            return True
+        except aiohttp.ClientResponseError as error:
+            if error.status == 404:
+                return False
+            raise
+
+    async def get_teachers_by_group(self, group_id: int) -> List[Dict[str, Any]]:
+        """
+        Получить список учителей по ID группы.
+
+        Args:
+            group_id (int): ID группы
+
+        Returns:
+            List[Dict[str, Any]]: Список учителей группы
+        """
+        response = await self.get("teachers", params={"group_id": group_id})
+        return response.json()
+
+    async def search_teachers_by_email(self, email: str) -> List[Dict[str, Any]]:
+        """
+        Поиск учителей по email.
+
+        Args:
+            email (str): Email для поиска
+
+        Returns:
+            List[Dict[str, Any]]: Список найденных учителей
+        """
+        response = await self.get("teachers", params={"email": email})
+        return response.json()
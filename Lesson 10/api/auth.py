@@ -0,0 +1,331 @@
+"""Общий кеш токенов авторизации с обновлением до истечения срока."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - fcntl есть только в Unix
+    fcntl = None
+
+
+# Функция входа: учетные данные → (токен, срок жизни в секундах)
+Login = Callable[[Any], Tuple[str, float]]
+
+
+class CachedToken(NamedTuple):
+    """
+    Токен с моментами истечения и планового обновления (время Unix).
+    """
+
+    token: str
+    expires_at: float
+    refresh_at: float
+
+
+def credential_key(credentials: Any) -> str:
+    """
+    Построить ключ кеша по учетным данным, не раскрывая их.
+
+    Args:
+        credentials (Any): Учетные данные, сериализуемые в JSON (или через repr)
+
+    Returns:
+        str: SHA-256 от учетных данных
+    """
+    raw = json.dumps(credentials, sort_keys=True, default=repr)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class TokenProvider:
+    """
+    Кеш токенов по учетным данным, общий для клиентов и потоков.
+
+    Токен запрашивается функцией login один раз на учетные данные:
+    одновременные запросы одного токена ждут единственный вход. Когда
+    до истечения остается refresh_before секунд (но не раньше середины
+    срока жизни), get_token сразу возвращает текущий токен и запускает
+    обновление в фоновом потоке, так что запросы не ждут повторного входа.
+    Если задан cache_path, токены хранятся еще и в JSON файле под
+    блокировкой fcntl: процессы (например, воркеры pytest-xdist) берут
+    токен из файла, и вход выполняет только первый из них. В файле
+    учетные данные заменены хешем, но сами токены лежат открыто —
+    путь должен быть доступен только текущему пользователю.
+    """
+
+    def __init__(self, login: Login, refresh_before: float = 60.0, skew: float = 5.0,
+                 cache_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.time) -> None:
+        """
+        Инициализация провайдера.
+
+        Args:
+            login (Login): Функция входа: учетные данные → (токен, срок жизни в секундах)
+            refresh_before (float): За сколько секунд до истечения обновлять токен в фоне
+            skew (float): Запас в секундах, с которым токен считается уже истекшим
+            cache_path (Optional[str]): Файл кеша токенов, общий для процессов;
+                None — только кеш в памяти
+            clock (Callable[[], float]): Источник времени Unix (общего для процессов)
+        """
+        self.login = login
+        self.refresh_before = refresh_before
+        self.skew = skew
+        self.cache_path = cache_path
+        self.clock = clock
+        self.stats = {'hits': 0, 'logins': 0, 'shared': 0, 'refreshes': 0, 'failed_refreshes': 0}
+        self._tokens: Dict[str, CachedToken] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._refreshing: Dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, credentials: Any) -> str:
+        """
+        Получить действующий токен для учетных данных.
+
+        Args:
+            credentials (Any): Учетные данные для функции login
+
+        Returns:
+            str: Токен
+
+        Raises:
+            Exception: ошибка функции login, если действующего токена нет
+        """
+        key = credential_key(credentials)
+        now = self.clock()
+        with self._lock:
+            cached = self._tokens.get(key)
+            if cached is not None and cached.expires_at - self.skew > now:
+                self.stats['hits'] += 1
+                if cached.refresh_at <= now:
+                    self._start_refresh(key, credentials)
+                return cached.token
+        return self._obtain(key, credentials, refresh=False).token
+
+    def invalidate(self, credentials: Any, token: Optional[str] = None) -> None:
+        """
+        Забыть токен, отвергнутый сервером (например, после ответа 401).
+
+        Args:
+            credentials (Any): Учетные данные
+            token (Optional[str]): Отвергнутый токен; если кеш уже хранит другой
+                (обновленный), он не удаляется. None — удалить любой.
+        """
+        key = credential_key(credentials)
+        with self._lock:
+            cached = self._tokens.get(key)
+            if cached is not None and token in (None, cached.token):
+                del self._tokens[key]
+        if self.cache_path is not None:
+            with self._file_lock():
+                tokens = self._read_file()
+                if key in tokens and token in (None, tokens[key].token):
+                    del tokens[key]
+                    self._write_file(tokens)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Дождаться завершения запущенных фоновых обновлений.
+
+        Args:
+            timeout (Optional[float]): Максимум ожидания каждого обновления в секундах
+        """
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def _start_refresh(self, key: str, credentials: Any) -> None:
+        """
+        Запустить фоновое обновление токена, если оно еще не идет.
+
+        Вызывается под self._lock.
+
+        Args:
+            key (str): Ключ учетных данных
+            credentials (Any): Учетные данные
+        """
+        if key in self._refreshing:
+            return
+        thread = threading.Thread(target=self._refresh, args=(key, credentials),
+                                  name="token-refresh", daemon=True)
+        self._refreshing[key] = thread
+        thread.start()
+
+    def _refresh(self, key: str, credentials: Any) -> None:
+        """
+        Обновить токен в фоновом потоке.
+
+        Ошибка входа не пробрасывается: текущий токен еще действует,
+        и следующий get_token запустит обновление снова.
+
+        Args:
+            key (str): Ключ учетных данных
+            credentials (Any): Учетные данные
+        """
+        try:
+            self._obtain(key, credentials, refresh=True)
+            self._count('refreshes')
+        except Exception:
+            self._count('failed_refreshes')
+        finally:
+            with self._lock:
+                self._refreshing.pop(key, None)
+
+    def _obtain(self, key: str, credentials: Any, refresh: bool) -> CachedToken:
+        """
+        Получить токен из памяти, файла кеша или входом — по одному входу на ключ.
+
+        Args:
+            key (str): Ключ учетных данных
+            credentials (Any): Учетные данные
+            refresh (bool): Нужен токен, не требующий обновления (фоновое обновление),
+                а не просто действующий
+
+        Returns:
+            CachedToken: Токен
+        """
+        with self._key_lock(key):
+            # Пока ждали блокировку, токен мог получить другой поток
+            cached = self._tokens.get(key)
+            if cached is not None and self._usable(cached, refresh):
+                return cached
+            with self._file_lock():
+                tokens = self._read_file() if self.cache_path is not None else {}
+                cached = tokens.get(key)
+                if cached is not None and self._usable(cached, refresh):
+                    self._count('shared')
+                else:
+                    token, expires_in = self.login(credentials)
+                    now = self.clock()
+                    # Короткоживущий токен обновляется не раньше середины срока жизни
+                    cached = CachedToken(token, now + expires_in,
+                                         now + max(expires_in - self.refresh_before, expires_in / 2))
+                    self._count('logins')
+                    if self.cache_path is not None:
+                        tokens[key] = cached
+                        self._write_file(tokens)
+            with self._lock:
+                self._tokens[key] = cached
+            return cached
+
+    def _usable(self, cached: CachedToken, refresh: bool) -> bool:
+        """
+        Проверить, подходит ли токен из кеша.
+
+        Args:
+            cached (CachedToken): Токен из кеша
+            refresh (bool): Требовать, чтобы токен еще не нуждался в обновлении
+
+        Returns:
+            bool: True, если токен можно использовать
+        """
+        now = self.clock()
+        if refresh:
+            return cached.refresh_at > now
+        return cached.expires_at - self.skew > now
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """
+        Получить блокировку входа для ключа.
+
+        Args:
+            key (str): Ключ учетных данных
+
+        Returns:
+            threading.Lock: Блокировка ключа
+        """
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """
+        Захватить межпроцессную блокировку файла кеша.
+
+        Без cache_path или без fcntl (Windows) блокировки нет: файл
+        все равно заменяется атомарно, но процессы могут войти повторно.
+
+        Yields:
+            None
+        """
+        if self.cache_path is None or fcntl is None:
+            yield
+            return
+        with open(f"{self.cache_path}.lock", 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_file(self) -> Dict[str, CachedToken]:
+        """
+        Прочитать токены из файла кеша; поврежденный файл считается пустым.
+
+        Returns:
+            Dict[str, CachedToken]: Токены по ключам учетных данных
+        """
+        try:
+            with open(self.cache_path, encoding='utf-8') as file:
+                return {key: CachedToken(*value) for key, value in json.load(file).items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def _write_file(self, tokens: Dict[str, CachedToken]) -> None:
+        """
+        Записать токены в файл кеша атомарной заменой, отбросив истекшие.
+
+        Args:
+            tokens (Dict[str, CachedToken]): Токены по ключам учетных данных
+        """
+        now = self.clock()
+        alive = {key: list(cached) for key, cached in tokens.items() if cached.expires_at > now}
+        temp_path = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600),
+                  'w', encoding='utf-8') as file:
+            json.dump(alive, file)
+        os.replace(temp_path, self.cache_path)
+
+    def _count(self, name: str) -> None:
+        """
+        Увеличить счетчик провайдера.
+
+        Args:
+            name (str): Имя счетчика в stats
+        """
+        with self._lock:
+            self.stats[name] += 1
+
+
+_shared: Dict[Tuple[Login, Optional[str]], TokenProvider] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_token_provider(login: Login, cache_path: Optional[str] = None,
+                          **options: Any) -> TokenProvider:
+    """
+    Получить провайдер токенов процесса для функции входа и файла кеша.
+
+    Все клиенты, запросившие провайдер с теми же login и cache_path,
+    получают один экземпляр и общий кеш токенов.
+
+    Args:
+        login (Login): Функция входа
+        cache_path (Optional[str]): Файл кеша токенов, общий для процессов
+        **options (Any): Параметры TokenProvider; учитываются при создании
+
+    Returns:
+        TokenProvider: Общий провайдер
+    """
+    with _shared_lock:
+        provider = _shared.get((login, cache_path))
+        if provider is None:
+            provider = TokenProvider(login, cache_path=cache_path, **options)
+            _shared[(login, cache_path)] = provider
+        return provider
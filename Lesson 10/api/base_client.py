@@ -1,8 +1,27 @@
 """Базовый класс для API клиентов."""
 
-from typing import Dict, Any, Optional
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
 import requests
-import allure
+from requests.adapters import HTTPAdapter
+
+from utils.tracing import traced
+
+from . import json_codec
+from .auth import TokenProvider
+from .cassette import Cassette
+from .compression import ENCODINGS, compress
+from .http_cache import ResponseCache
+from .metrics import ClientMetrics, endpoint_template
+from .rate_limiter import AdaptiveRateLimiter
+from .resilience import (
+    CircuitBreakerRegistry, CircuitOpenError, ProbeToken, RetryPolicy, parse_retry_after
+)
+from .single_flight import SingleFlight
 
 
 class BaseAPIClient:
@@ -13,40 +32,155 @@ class BaseAPIClient:
     обработки ответов и управления сессиями.
     """
     
-    def __init__(self, base_url: str, timeout: int = 30) -> None:
+    def __init__(self, base_url: str, timeout: float = 30,
+                 connect_timeout: Optional[float] = None,
+                 pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, cache_size: int = 0,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 metrics: Optional[ClientMetrics] = None,
+                 json_loads: Optional[Callable[[Any], Any]] = None,
+                 coalesce: bool = False,
+                 cassette: Optional[Cassette] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 token_provider: Optional[TokenProvider] = None,
+                 credentials: Any = None,
+                 compression: Optional[str] = None,
+                 compression_min_size: int = 1024) -> None:
         """
         Инициализация базового API клиента.
         
         Args:
             base_url (str): Базовый URL API
-            timeout (int): Таймаут запросов в секундах
+            timeout (float): Таймаут чтения ответа в секундах
+            connect_timeout (Optional[float]): Таймаут установки соединения
+                в секундах. Если не указан, равен timeout.
+            pool_connections (int): Количество пулов соединений (по хостам)
+            pool_maxsize (int): Максимум keep-alive соединений в пуле хоста;
+                должен быть не меньше числа потоков, использующих клиент
+            pool_block (bool): Ждать свободное соединение вместо открытия
+                нового сверх pool_maxsize
+            cache_size (int): Размер LRU кеша GET ответов с ревалидацией
+                по ETag/Last-Modified; 0 — кеш выключен
+            retry_policy (Optional[RetryPolicy]): Политика повторов идемпотентных
+                запросов; None — без повторов
+            circuit_breakers (Optional[CircuitBreakerRegistry]): Circuit breaker'ы
+                по хостам; реестр можно разделять между клиентами
+            metrics (Optional[ClientMetrics]): Сборщик метрик задержек, статусов
+                и трафика по эндпоинтам; можно разделять между клиентами
+            json_loads (Optional[Callable[[Any], Any]]): Декодер JSON тел ответов;
+                по умолчанию orjson, если установлен, иначе json
+            coalesce (bool): Объединять одновременные одинаковые чтения
+                в один HTTP запрос (single-flight); объединенные вызовы получают
+                общий объект результата, который нельзя изменять
+            cassette (Optional[Cassette]): Кассета: в режиме record ответы сервера
+                записываются в файл, в режиме replay выдаются из файла без сети
+            rate_limiter (Optional[AdaptiveRateLimiter]): Ограничитель частоты запросов,
+                подстраивающийся под 429/Retry-After и задержки; можно разделять
+                между клиентами и потоками
+            token_provider (Optional[TokenProvider]): Общий кеш токенов: каждая попытка
+                отправляется с токеном для credentials, ответ 401 сбрасывает токен
+                и запрос повторяется один раз с новым
+            credentials (Any): Учетные данные для token_provider
+            compression (Optional[str]): Сжатие тел POST/PUT: gzip, deflate или zstd
+                (если установлен zstandard); None — тела не сжимаются
+            compression_min_size (int): Размер JSON тела в байтах, начиная с которого
+                оно сжимается; меньшие тела сжатие почти не уменьшает
+            
+        Raises:
+            ValueError: если сжатие не поддерживается
         """
+        if compression is not None and compression not in ENCODINGS:
+            raise ValueError(f"Неподдерживаемое сжатие: {compression}")
         self.base_url = base_url.rstrip('/')
+        self.timeout: Tuple[float, float] = (
+            connect_timeout if connect_timeout is not None else timeout,
+            timeout
+        )
+        self.pool_maxsize = pool_maxsize
         self.session = requests.Session()
-        self.session.timeout = timeout
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        transport = cassette.adapter(adapter) if cassette is not None else adapter
+        self.session.mount('http://', transport)
+        self.session.mount('https://', transport)
+        self.cassette = cassette
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        self.cache: Optional[ResponseCache] = ResponseCache(cache_size) if cache_size else None
+        self.retry_policy = retry_policy
+        self.circuit_breakers = circuit_breakers
+        self.rate_limiter = rate_limiter
+        self.token_provider = token_provider
+        self.credentials = credentials
+        self.compression = compression
+        self.compression_min_size = compression_min_size
+        self.metrics = metrics
+        self.json_loads = json_loads or json_codec.loads
+        self.single_flight: Optional[SingleFlight] = SingleFlight() if coalesce else None
+        if metrics is not None:
+            metrics.track_adapter(adapter)
+        self.stats = {'requests': 0, 'attempts': 0, 'retries': 0, 'short_circuited': 0,
+                      'reauthenticated': 0}
+        self._stats_lock = threading.Lock()
     
-    @allure.step("Выполнить GET запрос: {endpoint}")
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+    @traced("Выполнить GET запрос: {endpoint}")
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+            stream: bool = False,
+            headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """
         Выполнить GET запрос к API.
         
         Args:
             endpoint (str): Эндпоинт для запроса
             params (Optional[Dict[str, Any]]): Параметры запроса
+            stream (bool): Не читать тело сразу; вызывающий код читает его
+                через iter_content и закрывает ответ. Потоковые ответы не кешируются.
+            headers (Optional[Dict[str, str]]): Дополнительные заголовки запроса.
+                Запросы со своими заголовками (например, If-None-Match) не кешируются,
+                и вызывающий код получает ответ 304 как есть.
             
         Returns:
-            requests.Response: Ответ сервера
+            requests.Response: Ответ сервера (из кеша, если он включен и ответ
+                свежий или не изменился на сервере)
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        response = self.session.get(url, params=params)
-        response.raise_for_status()
+        if stream or headers:
+            return self._request("GET", endpoint, params=params, stream=stream, headers=headers)
+        if self.cache is None:
+            return self._request("GET", endpoint, params=params)
+        
+        url = self._build_url(endpoint)
+        key = ResponseCache.make_key(url, params)
+        entry = self.cache.lookup(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            return entry['response']
+        headers = ResponseCache.conditional_headers(entry) if entry else {}
+        response = self._request("GET", endpoint, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            return self.cache.refresh(entry, response)
+        self.cache.store(key, url, response)
         return response
     
-    @allure.step("Выполнить POST запрос: {endpoint}")
+    @traced("Выполнить HEAD запрос: {endpoint}")
+    def head(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Выполнить HEAD запрос к API: только статус и заголовки, без тела.
+        
+        Args:
+            endpoint (str): Эндпоинт для запроса
+            params (Optional[Dict[str, Any]]): Параметры запроса
+            
+        Returns:
+            requests.Response: Ответ сервера
+        """
+        return self._request("HEAD", endpoint, params=params)
+    
+    @traced("Выполнить POST запрос: {endpoint}")
     def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> requests.Response:
         """
         Выполнить POST запрос к API.
@@ -58,12 +192,9 @@ class BaseAPIClient:
         Returns:
             requests.Response: Ответ сервера
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        response = self.session.post(url, json=data)
-        response.raise_for_status()
-        return response
+        return self._request("POST", endpoint, **self._json_body(data))
     
-    @allure.step("Выполнить PUT запрос: {endpoint}")
+    @traced("Выполнить PUT запрос: {endpoint}")
     def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> requests.Response:
         """
         Выполнить PUT запрос к API.
@@ -75,12 +206,9 @@ class BaseAPIClient:
         Returns:
             requests.Response: Ответ сервера
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        response = self.session.put(url, json=data)
-        response.raise_for_status()
-        return response
+        return self._request("PUT", endpoint, **self._json_body(data))
     
-    @allure.step("Выполнить DELETE запрос: {endpoint}")
+    @traced("Выполнить DELETE запрос: {endpoint}")
     def delete(self, endpoint: str) -> requests.Response:
         """
         Выполнить DELETE запрос к API.
@@ -91,12 +219,9 @@ class BaseAPIClient:
         Returns:
             requests.Response: Ответ сервера
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        response = self.session.delete(url)
-        response.raise_for_status()
-        return response
+        return self._request("DELETE", endpoint)
     
-    @allure.step("Установить токен авторизации")
+    @traced("Установить токен авторизации")
     def set_auth_token(self, token: str) -> None:
         """
         Установить токен авторизации для запросов.
@@ -108,7 +233,7 @@ class BaseAPIClient:
             'Authorization': f'Bearer {token}'
         })
     
-    @allure.step("Очистить токен авторизации")
+    @traced("Очистить токен авторизации")
     def clear_auth_token(self) -> None:
         """
         Удалить токен авторизации из заголовков.
@@ -116,14 +241,269 @@ class BaseAPIClient:
         if 'Authorization' in self.session.headers:
             del self.session.headers['Authorization']
     
+    def _json_body(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Подготовить JSON тело запроса, сжав его, если оно не меньше compression_min_size.
+        
+        Args:
+            data (Optional[Dict[str, Any]]): Данные для отправки
+            
+        Returns:
+            Dict[str, Any]: Аргументы _request: json для несжатого тела или
+                data, headers с Content-Encoding и raw_body_size для сжатого
+        """
+        if self.compression is None or data is None:
+            return {'json': data}
+        body = json.dumps(data, allow_nan=False).encode()
+        if len(body) < self.compression_min_size:
+            return {'data': body}
+        return {
+            'data': compress(body, self.compression),
+            'headers': {'Content-Encoding': self.compression},
+            'raw_body_size': len(body)
+        }
+    
+    def _request(self, method: str, endpoint: str, raw_body_size: Optional[int] = None,
+                 retry: bool = True, **kwargs: Any) -> requests.Response:
+        """
+        Выполнить HTTP запрос с таймаутами клиента и проверить статус ответа.
+        
+        Если задана политика повторов, идемпотентный запрос повторяется
+        после ошибки соединения, таймаута или статуса из retry_statuses.
+        Если задан реестр circuit breaker'ов, запрос к хосту с разомкнутым
+        breaker'ом отклоняется без обращения к серверу. Если задан ограничитель
+        частоты, каждая попытка ждет его разрешения, а ответ меняет его скорость.
+        Если задан провайдер токенов, попытка получает заголовок Authorization,
+        а ответ 401 на закешированный токен приводит к одному повтору с новым.
+        
+        Args:
+            method (str): HTTP метод
+            endpoint (str): Эндпоинт для запроса
+            raw_body_size (Optional[int]): Размер тела до сжатия для метрик
+            retry (bool): Применять политику повторов; False — одна попытка
+                (кроме повтора после 401 с новым токеном), например когда
+                вызывающий код сам реагирует на перегрузку
+            **kwargs (Any): Дополнительные аргументы requests.Session.request
+            
+        Returns:
+            requests.Response: Ответ сервера
+            
+        Raises:
+            requests.HTTPError: если сервер вернул статус 4xx/5xx
+            requests.Timeout: если истек таймаут соединения или чтения
+            CircuitOpenError: если circuit breaker хоста разомкнут
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        url = self._build_url(endpoint)
+        breaker = self.circuit_breakers.get(urlsplit(url).netloc) if self.circuit_breakers else None
+        policy = self.retry_policy if retry else None
+        limiter = self.rate_limiter
+        provider = self.token_provider
+        headers = kwargs.get('headers') or {}
+        reauthenticated = False
+        self._count('requests')
+        attempt = 0
+        try:
+            while True:
+                admitted = breaker.allow_request() if breaker is not None else True
+                if not admitted:
+                    self._count('short_circuited')
+                    raise CircuitOpenError(f"Circuit breaker разомкнут для {urlsplit(url).netloc}")
+                # Токен пробы half-open выдается этой попытке под блокировкой breaker'а:
+                # проба должна закончиться результатом или освободить место
+                probe = admitted if isinstance(admitted, ProbeToken) else None
+                try:
+                    if limiter is not None:
+                        limiter.acquire()
+                    if provider is not None:
+                        token = provider.get_token(self.credentials)
+                        kwargs['headers'] = {**headers, 'Authorization': f'Bearer {token}'}
+                    attempt += 1
+                    self._count('attempts')
+                    started = time.perf_counter()
+                    try:
+                        response = self.session.request(method, url, **kwargs)
+                    except (requests.ConnectionError, requests.Timeout) as error:
+                        self._record_metrics(method, url, started, error=error)
+                        if limiter is not None and isinstance(error, requests.Timeout):
+                            limiter.on_timeout()
+                        if breaker is not None:
+                            breaker.record_failure(probe)
+                            probe = None
+                        if policy is None or not policy.can_retry(method, attempt):
+                            raise
+                        self._wait_before_retry(policy, attempt)
+                        continue
+                    self._record_metrics(method, url, started, response=response,
+                                         raw_body_size=raw_body_size,
+                                         stream=kwargs.get('stream', False))
+                    if limiter is not None:
+                        limiter.on_response(response.status_code, time.perf_counter() - started,
+                                            parse_retry_after(response))
+                    # 401 тоже означает, что хост отвечает: результат учитывается до повтора
+                    if breaker is not None:
+                        if response.status_code >= 500:
+                            breaker.record_failure(probe)
+                        else:
+                            breaker.record_success(probe)
+                        probe = None
+                finally:
+                    if probe is not None:
+                        breaker.release_probe(probe)
+                if provider is not None and response.status_code == 401 and not reauthenticated:
+                    # Токен мог быть отозван раньше срока: берем новый и повторяем один раз.
+                    # Проба этой попытки уже учтена; повтор снова проходит allow_request
+                    provider.invalidate(self.credentials, token)
+                    reauthenticated = True
+                    self._count('reauthenticated')
+                    response.close()
+                    continue
+                if (policy is not None and policy.should_retry_response(response)
+                        and policy.can_retry(method, attempt)):
+                    self._wait_before_retry(policy, attempt, response)
+                    response.close()
+                    continue
+                break
+        finally:
+            # Изменяющий запрос делает кеш ресурса устаревшим, даже если упал
+            if method not in ('GET', 'HEAD'):
+                if self.cache is not None:
+                    self.cache.invalidate(url)
+                if self.single_flight is not None:
+                    self.single_flight.forget()
+        response.raise_for_status()
+        return response
+    
+    def decode_json(self, response: Any) -> Any:
+        """
+        Декодировать JSON тело ответа декодером клиента.
+        
+        Ответы, не являющиеся requests.Response (например, заглушки в тестах),
+        декодируются их собственным методом json().
+        
+        Args:
+            response (Any): Ответ сервера
+            
+        Returns:
+            Any: Декодированные данные
+        """
+        if isinstance(response, requests.Response):
+            return self.json_loads(response.content)
+        return response.json()
+    
+    def _single_flight(self, key: Any, fetch: Callable[[], Any]) -> Any:
+        """
+        Выполнить чтение, объединив его с одновременным таким же чтением.
+        
+        Args:
+            key (Any): Ключ чтения (эндпоинт и параметры)
+            fetch (Callable[[], Any]): Функция запроса и декодирования ответа
+            
+        Returns:
+            Any: Декодированный результат
+        """
+        if self.single_flight is None:
+            return fetch()
+        return self.single_flight.do(key, fetch)
+    
+    def _wait_before_retry(self, policy: RetryPolicy, attempt: int,
+                           response: Optional[requests.Response] = None) -> None:
+        """
+        Подождать перед повтором запроса и учесть повтор в счетчиках.
+        
+        Args:
+            policy (RetryPolicy): Политика повторов
+            attempt (int): Номер выполненной попытки
+            response (Optional[requests.Response]): Ответ сервера, если был
+        """
+        self._count('retries')
+        policy.sleep(policy.backoff(attempt, response))
+    
+    def _record_metrics(self, method: str, url: str, started: float,
+                        response: Optional[requests.Response] = None,
+                        error: Optional[BaseException] = None,
+                        raw_body_size: Optional[int] = None,
+                        stream: bool = False) -> None:
+        """
+        Учесть попытку запроса в метриках клиента, если они включены.
+        
+        Args:
+            method (str): HTTP метод
+            url (str): Полный URL запроса
+            started (float): Время начала попытки по time.perf_counter
+            response (Optional[requests.Response]): Ответ сервера
+            error (Optional[BaseException]): Исключение, если ответа нет
+            raw_body_size (Optional[int]): Размер тела запроса до сжатия
+            stream (bool): Ответ потоковый, тело еще не прочитано
+        """
+        if self.metrics is not None:
+            self.metrics.record(method, endpoint_template(url, self.base_url),
+                                time.perf_counter() - started, response=response, error=error,
+                                raw_bytes_out=raw_body_size, stream=stream)
+    
+    def _count(self, name: str) -> None:
+        """
+        Увеличить счетчик клиента; клиент может использоваться из нескольких потоков.
+        
+        Args:
+            name (str): Имя счетчика в stats
+        """
+        with self._stats_lock:
+            self.stats[name] += 1
+    
+    def _fan_out(self, func: Callable[[Any], Any], items: Sequence[Any],
+                 max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Выполнить func для каждого элемента в пуле потоков.
+        
+        Потоки используют общий пул соединений сессии, поэтому по умолчанию
+        их число равно pool_maxsize. Ошибка одного элемента не прерывает
+        остальные, а попадает в список errors.
+        
+        Args:
+            func (Callable[[Any], Any]): Функция обработки одного элемента
+            items (Sequence[Any]): Элементы для обработки
+            max_workers (Optional[int]): Количество потоков
+            
+        Returns:
+            Dict[str, Any]: results в порядке items (None для ошибок),
+                errors с индексом, элементом и текстом ошибки,
+                succeeded, failed, elapsed и throughput (операций/сек)
+        """
+        results: List[Any] = [None] * len(items)
+        errors: List[Dict[str, Any]] = []
+        started = time.perf_counter()
+        if items:
+            workers = min(max_workers or self.pool_maxsize, len(items))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(func, item) for item in items]
+                for index, future in enumerate(futures):
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        errors.append({'index': index, 'item': items[index], 'error': str(e)})
+        elapsed = time.perf_counter() - started
+        return {
+            'results': results,
+            'errors': errors,
+            'succeeded': len(items) - len(errors),
+            'failed': len(errors),
+            'elapsed': elapsed,
+            'throughput': len(items) / elapsed if elapsed else 0.0
+        }
+    
     def _build_url(self, endpoint: str) -> str:
         """
         Построить полный URL из базового URL и эндпоинта.
         
+        Абсолютный URL (например, из заголовка Link) возвращается как есть.
+        
         Args:
-            endpoint (str): Эндпоинт
+            endpoint (str): Эндпоинт или абсолютный URL
             
         Returns:
             str: Полный URL
         """
+        if endpoint.startswith(('http://', 'https://')):
+            return endpoint
         return f"{self.base_url}/{endpoint.lstrip('/')}"
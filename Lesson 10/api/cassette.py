@@ -0,0 +1,248 @@
+"""Запись и воспроизведение HTTP обменов API клиентов (кассеты)."""
+
+import hashlib
+import json
+import mmap
+import struct
+import threading
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Заголовок файла кассеты с версией формата
+MAGIC = b'APICAS1\n'
+
+# Длины ключа, метаданных и тела ответа перед каждой записью
+_RECORD = struct.Struct('<III')
+
+
+class CassetteMissError(requests.ConnectionError):
+    """
+    Исключение, выбрасываемое при воспроизведении запроса, которого нет в кассете.
+    """
+
+
+def request_key(method: str, url: str, body: Any) -> str:
+    """
+    Построить ключ запроса: метод, URL и хеш тела.
+
+    Args:
+        method (str): HTTP метод
+        url (str): Полный URL с параметрами
+        body (Any): Тело подготовленного запроса
+
+    Returns:
+        str: Ключ записи в кассете
+    """
+    if isinstance(body, str):
+        body = body.encode()
+    digest = hashlib.sha1(body).hexdigest() if isinstance(body, bytes) and body else '-'
+    return f'{method} {url} {digest}'
+
+
+class Cassette:
+    """
+    Файл записанных HTTP обменов.
+
+    В режиме record ответы настоящего сервера дописываются в файл.
+    Запись: длины ключа, метаданных и тела (struct '<III'), ключ запроса,
+    JSON со статусом и заголовками и тело ответа как есть.
+    В режиме replay файл отображается в память (mmap), при открытии
+    строится словарь ключ → смещения, а тело копируется из отображения
+    только при выдаче ответа. Одинаковые запросы воспроизводятся в порядке
+    записи, после последней записи повторяется последний ответ.
+    """
+
+    def __init__(self, path: str, mode: str = 'replay') -> None:
+        """
+        Открыть кассету.
+
+        Args:
+            path (str): Путь к файлу кассеты
+            mode (str): 'record' — перезаписать файл ответами сервера,
+                'replay' — отвечать из файла без сети
+
+        Raises:
+            ValueError: если режим неизвестен или файл не является кассетой
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Неизвестный режим кассеты: {mode}")
+        self.path = path
+        self.mode = mode
+        self.stats = {'recorded': 0, 'replayed': 0, 'missed': 0}
+        self._lock = threading.Lock()
+        self._index: Dict[str, List[Tuple[int, int, int]]] = {}
+        self._positions: Dict[str, int] = {}
+        self._mmap: Optional[mmap.mmap] = None
+        if mode == 'record':
+            self._file = open(path, 'wb')
+            self._file.write(MAGIC)
+        else:
+            self._file = open(path, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._load_index()
+
+    def adapter(self, transport: HTTPAdapter) -> 'CassetteAdapter':
+        """
+        Создать транспортный адаптер сессии, работающий через кассету.
+
+        Args:
+            transport (HTTPAdapter): Настоящий адаптер для режима записи
+
+        Returns:
+            CassetteAdapter: Адаптер для session.mount
+        """
+        return CassetteAdapter(self, transport)
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        """
+        Дописать обмен в кассету; тело ответа читается целиком.
+
+        Args:
+            request (requests.PreparedRequest): Отправленный запрос
+            response (requests.Response): Ответ сервера
+        """
+        key = request_key(request.method, request.url, request.body).encode()
+        body = response.content or b''
+        # Тело уже распаковано requests, поэтому заголовки описывают его как есть
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')
+        }
+        headers['Content-Length'] = str(len(body))
+        meta = json.dumps({
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': headers
+        }, ensure_ascii=False).encode()
+        with self._lock:
+            self._file.write(_RECORD.pack(len(key), len(meta), len(body)))
+            self._file.write(key)
+            self._file.write(meta)
+            self._file.write(body)
+            self.stats['recorded'] += 1
+
+    def play(self, request: requests.PreparedRequest) -> requests.Response:
+        """
+        Построить ответ на запрос из кассеты.
+
+        Args:
+            request (requests.PreparedRequest): Запрос
+
+        Returns:
+            requests.Response: Записанный ответ
+
+        Raises:
+            CassetteMissError: если такой запрос не записан
+        """
+        key = request_key(request.method, request.url, request.body)
+        with self._lock:
+            entries = self._index.get(key)
+            if not entries:
+                self.stats['missed'] += 1
+                raise CassetteMissError(f"Запрос не записан в кассете {self.path}: {key}", request=request)
+            position = self._positions.get(key, 0)
+            self._positions[key] = min(position + 1, len(entries) - 1)
+            self.stats['replayed'] += 1
+        meta_start, body_start, body_end = entries[position]
+        meta = json.loads(self._mmap[meta_start:body_start])
+
+        response = requests.Response()
+        response.status_code = meta['status']
+        response.reason = meta['reason']
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self._mmap[body_start:body_end]
+        # Тело уже в памяти: iter_content и close не обращаются к raw
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(0)
+        return response
+
+    def close(self) -> None:
+        """
+        Закрыть файл кассеты.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._index.values())
+
+    def __enter__(self) -> 'Cassette':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _load_index(self) -> None:
+        """
+        Построить словарь ключ → смещения записей по отображенному файлу.
+
+        Raises:
+            ValueError: если заголовок или запись повреждены
+        """
+        data = self._mmap
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Файл не является кассетой: {self.path}")
+        offset = len(MAGIC)
+        while offset < len(data):
+            if offset + _RECORD.size > len(data):
+                raise ValueError(f"Кассета оборвана: {self.path}")
+            key_len, meta_len, body_len = _RECORD.unpack_from(data, offset)
+            key_start = offset + _RECORD.size
+            meta_start = key_start + key_len
+            body_start = meta_start + meta_len
+            offset = body_start + body_len
+            if offset > len(data):
+                raise ValueError(f"Кассета оборвана: {self.path}")
+            key = data[key_start:meta_start].decode()
+            self._index.setdefault(key, []).append((meta_start, body_start, offset))
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    Транспортный адаптер requests, записывающий или воспроизводящий обмены кассеты.
+    """
+
+    def __init__(self, cassette: Cassette, transport: HTTPAdapter) -> None:
+        """
+        Инициализация адаптера.
+
+        Args:
+            cassette (Cassette): Кассета
+            transport (HTTPAdapter): Настоящий адаптер для режима записи
+        """
+        super().__init__()
+        self.cassette = cassette
+        self.transport = transport
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        """
+        Отправить запрос: в режиме replay ответ берется из кассеты без сокетов.
+
+        Args:
+            request (requests.PreparedRequest): Запрос
+            **kwargs (Any): Параметры HTTPAdapter.send (timeout, stream и др.)
+
+        Returns:
+            requests.Response: Ответ
+        """
+        if self.cassette.mode == 'replay':
+            return self.cassette.play(request)
+        response = self.transport.send(request, **kwargs)
+        self.cassette.record(request, response)
+        return response
+
+    def close(self) -> None:
+        """
+        Закрыть соединения настоящего адаптера.
+        """
+        self.transport.close()
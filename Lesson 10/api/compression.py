@@ -0,0 +1,84 @@
+"""Сжатие тел HTTP сообщений: gzip, deflate и zstd (если установлен zstandard)."""
+
+import gzip
+import zlib
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard необязательная зависимость
+    zstandard = None
+
+
+# Поддерживаемые значения Content-Encoding в порядке предпочтения
+ENCODINGS = (('zstd',) if zstandard is not None else ()) + ('gzip', 'deflate')
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Сжать тело для заголовка Content-Encoding.
+
+    Args:
+        data (bytes): Исходное тело
+        encoding (str): gzip, deflate или zstd
+        level (Optional[int]): Уровень сжатия; None — умолчание алгоритма
+
+    Returns:
+        bytes: Сжатое тело
+
+    Raises:
+        ValueError: если сжатие не поддерживается
+    """
+    if encoding == 'gzip':
+        # mtime=0: одинаковое тело дает одинаковые байты (ключи кассет, ETag)
+        return gzip.compress(data, compresslevel=6 if level is None else level, mtime=0)
+    if encoding == 'deflate':
+        # HTTP deflate — поток zlib с заголовком, а не «сырой» deflate
+        return zlib.compress(data, 6 if level is None else level)
+    if encoding == 'zstd' and zstandard is not None:
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress(data)
+    raise ValueError(f"Неподдерживаемое сжатие: {encoding}")
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """
+    Распаковать тело по значению Content-Encoding.
+
+    Args:
+        data (bytes): Сжатое тело
+        encoding (str): gzip, deflate, zstd или identity
+
+    Returns:
+        bytes: Исходное тело
+
+    Raises:
+        ValueError: если сжатие не поддерживается
+    """
+    encoding = encoding.strip().lower()
+    if encoding in ('', 'identity'):
+        return data
+    if encoding == 'gzip':
+        return gzip.decompress(data)
+    if encoding == 'deflate':
+        return zlib.decompress(data)
+    if encoding == 'zstd' and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    raise ValueError(f"Неподдерживаемое сжатие: {encoding}")
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Выбрать сжатие ответа по заголовку Accept-Encoding.
+
+    Args:
+        accept_encoding (Optional[str]): Значение Accept-Encoding запроса
+
+    Returns:
+        Optional[str]: Первое из ENCODINGS, принимаемое клиентом, или None
+    """
+    accepted = set()
+    for item in (accept_encoding or '').split(','):
+        name, _, params = item.strip().lower().partition(';')
+        if params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            accepted.add(name.strip())
+    return next((encoding for encoding in ENCODINGS if encoding in accepted), None)
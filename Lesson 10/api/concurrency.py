@@ -0,0 +1,129 @@
+"""Адаптивное ограничение числа одновременных запросов по задержкам и перегрузкам."""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Окно одновременных запросов, подстраивающееся под сервер.
+
+    По градиенту задержек min_rtt / rtt оценивается очередь на сервере:
+    limit * (1 - min_rtt / rtt) запросов ждут обработки (как в TCP Vegas).
+    Пока очередь меньше min_queue, окно растет примерно на 1 за окно
+    ответов, а когда больше max_queue — так же уменьшается, поэтому
+    окно держится чуть выше числа запросов, которые сервер обрабатывает
+    параллельно. Базовая задержка — минимальная наблюдаемая; она
+    поднимается на долю drift за ответ, чтобы окно восстановилось,
+    если сервер стал медленнее насовсем, а не из-за очереди. Перегрузка
+    (429/503, таймаут, ошибка соединения) уменьшает окно в decrease раз —
+    не чаще раза за базовую задержку, чтобы пачка ошибок одного всплеска
+    не обрушила окно (AIMD). Окно не растет, пока занято меньше половины:
+    такая нагрузка ничего не говорит о пределе сервера.
+    """
+
+    def __init__(self, initial: float = 4.0, min_limit: int = 1, max_limit: int = 64,
+                 min_queue: float = 2.0, max_queue: float = 4.0, decrease: float = 0.5,
+                 drift: float = 0.001,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Инициализация ограничителя.
+
+        Args:
+            initial (float): Начальное окно
+            min_limit (int): Нижняя граница окна
+            max_limit (int): Верхняя граница окна; столько потоков может понадобиться
+            min_queue (float): Оценка очереди на сервере, ниже которой окно растет
+            max_queue (float): Оценка очереди на сервере, выше которой окно уменьшается
+            decrease (float): Множитель окна при перегрузке
+            drift (float): Доля, на которую базовая задержка поднимается за ответ
+            clock (Callable[[], float]): Источник монотонного времени
+        """
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.min_queue = min_queue
+        self.max_queue = max_queue
+        self.decrease = decrease
+        self.clock = clock
+        self.inflight = 0
+        self.drift = drift
+        self.min_rtt: Optional[float] = None
+        self.stats = {'acquired': 0, 'samples': 0, 'overloads': 0, 'decreases': 0, 'peak_inflight': 0}
+        self._last_decrease = float('-inf')
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """
+        Занять место в окне, дождавшись освобождения, если окно заполнено.
+        """
+        with self._condition:
+            while self.inflight >= int(self.limit):
+                self._condition.wait()
+            self.inflight += 1
+            self.stats['acquired'] += 1
+            self.stats['peak_inflight'] = max(self.stats['peak_inflight'], self.inflight)
+
+    def release(self, rtt: Optional[float] = None, overloaded: bool = False) -> None:
+        """
+        Освободить место и учесть результат запроса в окне.
+
+        Args:
+            rtt (Optional[float]): Задержка ответа в секундах; None — без замера
+                (например, запрос упал по причине, не связанной с нагрузкой)
+            overloaded (bool): Сервер перегружен: 429/503, таймаут или ошибка соединения
+        """
+        with self._condition:
+            inflight = self.inflight
+            self.inflight -= 1
+            if overloaded:
+                self._on_overload()
+            elif rtt is not None:
+                self._on_sample(rtt, inflight)
+            self._condition.notify_all()
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Получить текущее окно, базовую задержку и счетчики.
+
+        Returns:
+            Dict[str, float]: limit, inflight, min_rtt и счетчики stats
+        """
+        with self._condition:
+            return {'limit': self.limit, 'inflight': self.inflight,
+                    'min_rtt': self.min_rtt or 0.0, **self.stats}
+
+    def _on_sample(self, rtt: float, inflight: int) -> None:
+        """
+        Пересчитать окно по задержке ответа (градиент задержек).
+
+        Args:
+            rtt (float): Задержка ответа в секундах
+            inflight (int): Занятость окна в момент ответа, включая этот запрос
+        """
+        self.stats['samples'] += 1
+        rtt = max(rtt, 1e-6)
+        if self.min_rtt is None or rtt < self.min_rtt:
+            self.min_rtt = rtt
+        else:
+            self.min_rtt = min(rtt, self.min_rtt * (1 + self.drift))
+        if inflight < self.limit / 2:
+            return
+        queue = self.limit * (1 - self.min_rtt / rtt)
+        if queue < self.min_queue:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        elif queue > self.max_queue:
+            self.limit = max(self.min_limit, self.limit - 1 / self.limit)
+
+    def _on_overload(self) -> None:
+        """
+        Мультипликативно уменьшить окно, если с прошлого уменьшения прошла базовая задержка.
+        """
+        self.stats['overloads'] += 1
+        now = self.clock()
+        if now - self._last_decrease < (self.min_rtt or 0.0):
+            return
+        self.limit = max(self.min_limit, self.limit * self.decrease)
+        self._last_decrease = now
+        self.stats['decreases'] += 1
@@ -0,0 +1,213 @@
+"""LRU кеш GET ответов с условной ревалидацией по ETag/Last-Modified."""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+import requests
+
+
+def _parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """
+    Разобрать заголовок Cache-Control.
+
+    Args:
+        value (str): Значение заголовка
+
+    Returns:
+        Dict[str, Optional[str]]: Директивы в нижнем регистре и их значения
+    """
+    directives: Dict[str, Optional[str]] = {}
+    for part in value.split(','):
+        name, _, arg = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = arg.strip('"') or None
+    return directives
+
+
+class ResponseCache:
+    """
+    Ограниченный LRU кеш GET ответов.
+
+    Ответ хранится, если у него есть ETag, Last-Modified или max-age.
+    Свежий по max-age ответ отдается без запроса, устаревший
+    ревалидируется условным запросом (If-None-Match / If-Modified-Since):
+    на 304 сервер не передает тело, и клиент отдает сохраненный ответ.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """
+        Инициализация кеша.
+
+        Args:
+            max_entries (int): Максимум хранимых ответов
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries должен быть положительным числом")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'invalidated': 0}
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Построить ключ кеша из URL и параметров запроса.
+
+        Args:
+            url (str): URL без параметров
+            params (Optional[Dict[str, Any]]): Параметры запроса
+
+        Returns:
+            str: Ключ кеша
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Найти запись и отметить ее как недавно использованную.
+
+        Args:
+            key (str): Ключ кеша
+
+        Returns:
+            Optional[Dict[str, Any]]: Запись с ответом и валидаторами или None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """
+        Проверить что запись свежая по max-age.
+
+        Args:
+            entry (Dict[str, Any]): Запись кеша
+
+        Returns:
+            bool: True если ответ можно отдать без ревалидации
+        """
+        if time.monotonic() < entry['expires']:
+            with self._lock:
+                self.stats['hits'] += 1
+            return True
+        return False
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Построить заголовки условного запроса для записи.
+
+        Args:
+            entry (Dict[str, Any]): Запись кеша
+
+        Returns:
+            Dict[str, str]: If-None-Match и/или If-Modified-Since
+        """
+        headers = {}
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, key: str, path: str, response: requests.Response) -> None:
+        """
+        Сохранить ответ, если он кешируемый.
+
+        Args:
+            key (str): Ключ кеша
+            path (str): URL ресурса без параметров, для инвалидации
+            response (requests.Response): Ответ со статусом 200
+        """
+        directives = _parse_cache_control(response.headers.get('Cache-Control', ''))
+        if response.status_code != 200 or 'no-store' in directives:
+            return
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        max_age = self._max_age(directives)
+        if not (etag or last_modified or max_age):
+            return
+        entry = {
+            'response': response,
+            'path': path,
+            'etag': etag,
+            'last_modified': last_modified,
+            'expires': time.monotonic() + max_age
+        }
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, entry: Dict[str, Any], response: requests.Response) -> requests.Response:
+        """
+        Обновить срок жизни записи по ответу 304 и вернуть сохраненный ответ.
+
+        Args:
+            entry (Dict[str, Any]): Запись кеша
+            response (requests.Response): Ответ 304 Not Modified
+
+        Returns:
+            requests.Response: Сохраненный ответ
+        """
+        directives = _parse_cache_control(response.headers.get('Cache-Control', ''))
+        with self._lock:
+            entry['expires'] = time.monotonic() + self._max_age(directives)
+            entry['etag'] = response.headers.get('ETag', entry['etag'])
+            self.stats['revalidated'] += 1
+        return entry['response']
+
+    def invalidate(self, path: str) -> None:
+        """
+        Удалить записи ресурса и его родительской коллекции.
+
+        Изменение teachers/5 делает устаревшими и teachers/5,
+        и списки teachers с любыми параметрами.
+
+        Args:
+            path (str): URL измененного ресурса без параметров
+        """
+        path = path.rstrip('/')
+        targets = {path, path.rsplit('/', 1)[0]}
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry['path'] in targets]
+            for key in stale:
+                del self._entries[key]
+            self.stats['invalidated'] += len(stale)
+
+    def clear(self) -> None:
+        """
+        Очистить кеш.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _max_age(directives: Dict[str, Optional[str]]) -> int:
+        """
+        Получить max-age из директив Cache-Control.
+
+        Args:
+            directives (Dict[str, Optional[str]]): Разобранный Cache-Control
+
+        Returns:
+            int: Время свежести в секундах, 0 если ответ требует ревалидации
+        """
+        if 'no-cache' in directives:
+            return 0
+        value = directives.get('max-age') or ''
+        return int(value) if re.fullmatch(r'\d+', value) else 0
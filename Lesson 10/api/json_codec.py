@@ -0,0 +1,195 @@
+"""Декодирование JSON ответов: быстрый декодер и потоковый разбор массивов."""
+
+import json
+import re
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson необязательная зависимость
+    orjson = None
+
+
+# Ключи, под которыми API может вернуть список в теле-объекте
+LIST_KEYS = ('items', 'teachers', 'data', 'results')
+
+# Символы, меняющие состояние разбора вне строки и внутри строки
+_STRUCTURAL = re.compile(rb'["\[\]{},]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+# Сколько запятых и попыток декодирования проверяет быстрый путь на кусок
+_FAST_PATH_COMMAS = 64
+_FAST_PATH_ATTEMPTS = 4
+
+_WHITESPACE = b' \t\r\n'
+
+
+def _stdlib_loads(data: Any) -> Any:
+    """
+    Декодировать JSON стандартной библиотекой.
+
+    Args:
+        data (Any): JSON в bytes или str
+
+    Returns:
+        Any: Декодированные данные
+    """
+    return json.loads(data)
+
+
+# Декодер по умолчанию: orjson, если установлен, иначе json из стандартной библиотеки
+loads: Callable[[Any], Any] = orjson.loads if orjson is not None else _stdlib_loads
+
+
+def _split_fast(buffer: bytearray, decode: Callable[[Any], Any]) -> Optional[Tuple[Any, int]]:
+    """
+    Быстро отделить завершенные элементы-объекты или элементы-массивы.
+
+    Кандидат на границу — последние запятые после } или ]. Префикс до
+    кандидата декодируется целиком как массив: разрез внутри строки или
+    на вложенном уровне дает некорректный JSON, поэтому успешное
+    декодирование означает настоящую границу элемента верхнего уровня.
+
+    Args:
+        buffer (bytearray): Недоразобранные элементы без открывающей скобки
+        decode (Callable[[Any], Any]): Декодер JSON
+
+    Returns:
+        Optional[Tuple[Any, int]]: Декодированные элементы и длина разобранного
+            префикса с запятой или None, если граница не найдена
+    """
+    end = len(buffer)
+    attempts = 0
+    for _ in range(_FAST_PATH_COMMAS):
+        end = buffer.rfind(b',', 0, end)
+        if end <= 0:
+            return None
+        index = end - 1
+        while index > 0 and buffer[index] in _WHITESPACE:
+            index -= 1
+        if buffer[index] in (0x7D, 0x5D):  # } ]
+            attempts += 1
+            try:
+                return decode(b'[' + bytes(buffer[:end]) + b']'), end + 1
+            except ValueError:
+                if attempts == _FAST_PATH_ATTEMPTS:
+                    return None
+    return None
+
+
+def iter_json_array(chunks: Iterable[bytes],
+                    decoder: Optional[Callable[[Any], Any]] = None) -> Iterator[Any]:
+    """
+    Потоково разобрать JSON массив, выдавая элементы по мере прихода байтов.
+
+    Завершенные элементы каждого куска декодируются одним вызовом декодера.
+    Граница сначала ищется быстрым путем (_split_fast), а если он не
+    сработал на двух кусках подряд — точным разбором с учетом вложенности
+    и строк до конца потока.
+    В памяти хранится только недоразобранный хвост, а первые элементы
+    доступны до получения всего тела.
+    Если тело — объект, он декодируется целиком и выдается список
+    из ключей LIST_KEYS.
+
+    Args:
+        chunks (Iterable[bytes]): Куски тела ответа
+        decoder (Optional[Callable[[Any], Any]]): Декодер JSON, по умолчанию loads;
+            ошибки разбора должны быть ValueError
+
+    Yields:
+        Any: Элементы массива
+
+    Raises:
+        ValueError: если тело не массив и не объект со списком или обрывается
+    """
+    decode = decoder or loads
+    buffer = bytearray()
+    started = whole_object = finished = False
+    # Точный разбор: позиция, глубина и признак строки продолжаются между кусками
+    exact = False
+    fast_misses = 0
+    scan_pos, depth, in_string = 0, 1, False
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        if not started:
+            stripped = buffer.lstrip()
+            if not stripped:
+                buffer.clear()
+                continue
+            if stripped[:1] == b'{':
+                whole_object = started = True
+            elif stripped[:1] == b'[':
+                del buffer[:len(buffer) - len(stripped) + 1]
+                started = True
+            else:
+                raise ValueError("Ожидался JSON массив или объект")
+        if whole_object or finished:
+            continue
+
+        if not exact:
+            split = _split_fast(buffer, decode)
+            if split is not None:
+                items, consumed = split
+                del buffer[:consumed]
+                fast_misses = 0
+                yield from items
+                continue
+            # Один промах бывает, когда кусок меньше элемента; два подряд —
+            # данные не подходят быстрому пути, и хвост не должен расти
+            fast_misses += 1
+            if fast_misses < 2:
+                continue
+            exact = True
+
+        boundary = closed = -1
+        while True:
+            match = (_STRING_SPECIAL if in_string else _STRUCTURAL).search(buffer, scan_pos)
+            if match is None:
+                scan_pos = len(buffer)
+                break
+            index = match.start()
+            char = buffer[index]
+            if in_string:
+                if char == 0x5C:  # обратный слеш экранирует следующий символ
+                    if index + 1 >= len(buffer):
+                        scan_pos = index
+                        break
+                    scan_pos = index + 2
+                    continue
+                in_string = False
+            elif char == 0x22:  # "
+                in_string = True
+            elif char in (0x7B, 0x5B):  # { [
+                depth += 1
+            elif char in (0x7D, 0x5D):  # } ]
+                depth -= 1
+                if depth == 0:
+                    closed = index
+                    break
+            elif depth == 1:  # , между элементами верхнего уровня
+                boundary = index
+            scan_pos = index + 1
+
+        if closed >= 0:
+            yield from decode(b'[' + bytes(buffer[:closed + 1]))
+            finished = True
+        elif boundary >= 0:
+            items = decode(b'[' + bytes(buffer[:boundary]) + b']')
+            del buffer[:boundary + 1]
+            scan_pos -= boundary + 1
+            yield from items
+
+    if whole_object:
+        body = decode(bytes(buffer))
+        items = next((body[key] for key in LIST_KEYS if key in body), None)
+        if not isinstance(items, list):
+            raise ValueError("Объект ответа не содержит списка")
+        yield from items
+    elif not finished:
+        if not started or exact or not buffer.strip():
+            raise ValueError("JSON массив оборван")
+        # Остаток после быстрого пути: последние элементы и закрывающая скобка
+        yield from decode(b'[' + bytes(buffer))
@@ -0,0 +1,334 @@
+"""Метрики HTTP запросов API клиентов: задержки, статусы, трафик, сжатие и переиспользование соединений."""
+
+import bisect
+import json
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Границы корзин гистограммы задержек в секундах, как у клиентов Prometheus
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+_ID_SEGMENT = re.compile(r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F-]{27})$')
+
+
+def endpoint_template(url: str, base_url: str = '') -> str:
+    """
+    Построить шаблон эндпоинта: путь относительно base_url с {id} вместо идентификаторов.
+
+    Args:
+        url (str): Полный URL запроса
+        base_url (str): Базовый URL клиента
+
+    Returns:
+        str: Шаблон вида teachers/{id}
+    """
+    path = urlsplit(url).path
+    base_path = urlsplit(base_url).path.rstrip('/')
+    if base_path and path.startswith(base_path + '/'):
+        path = path[len(base_path):]
+    segments = [
+        '{id}' if _ID_SEGMENT.match(segment) else segment
+        for segment in path.strip('/').split('/')
+    ]
+    return '/'.join(segments)
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек с фиксированными корзинами.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """
+        Инициализация гистограммы.
+
+        Args:
+            buckets (Tuple[float, ...]): Возрастающие верхние границы корзин в секундах
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """
+        Учесть одно значение задержки.
+
+        Args:
+            seconds (float): Задержка в секундах
+        """
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """
+        Оценить квантиль линейной интерполяцией внутри корзины.
+
+        Args:
+            q (float): Квантиль от 0 до 1
+
+        Returns:
+            float: Оценка задержки в секундах
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / bucket_count, self.max)
+            seen += bucket_count
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Представить гистограмму словарем.
+
+        Returns:
+            Dict[str, Any]: Количество, сумма, максимум, квантили и корзины
+        """
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': dict(zip([*map(str, self.buckets), '+Inf'], self.counts))
+        }
+
+
+class ClientMetrics:
+    """
+    Метрики запросов по методу и шаблону эндпоинта.
+
+    Один объект можно передать нескольким клиентам; учет потокобезопасен.
+    Трафик считается в байтах по сети (bytes_out/bytes_in) и до сжатия
+    (bytes_out_raw/bytes_in_raw); их отношение — степень сжатия эндпоинта.
+    Переиспользование соединений считается по счетчикам пулов urllib3
+    адаптеров, зарегистрированных через track_adapter.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация пустых метрик.
+        """
+        self._endpoints: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._adapters: List[HTTPAdapter] = []
+        self._lock = threading.Lock()
+
+    def track_adapter(self, adapter: HTTPAdapter) -> None:
+        """
+        Зарегистрировать адаптер для подсчета переиспользования соединений.
+
+        Args:
+            adapter (HTTPAdapter): Адаптер сессии клиента
+        """
+        with self._lock:
+            if adapter not in self._adapters:
+                self._adapters.append(adapter)
+
+    def record(self, method: str, template: str, elapsed: float,
+               response: Optional[requests.Response] = None,
+               error: Optional[BaseException] = None,
+               raw_bytes_out: Optional[int] = None,
+               stream: bool = False) -> None:
+        """
+        Учесть одну попытку запроса.
+
+        Args:
+            method (str): HTTP метод
+            template (str): Шаблон эндпоинта
+            elapsed (float): Время запроса в секундах
+            response (Optional[requests.Response]): Ответ сервера
+            error (Optional[BaseException]): Исключение, если ответа нет
+            raw_bytes_out (Optional[int]): Размер тела запроса до сжатия;
+                None — тело не сжималось
+            stream (bool): Ответ потоковый: тело еще не прочитано, и
+                входящий трафик берется только из Content-Length
+        """
+        status = str(response.status_code) if response is not None else type(error).__name__
+        bytes_out = bytes_in = raw_in = 0
+        if response is not None:
+            bytes_out = self._body_size(response.request.body if response.request else None)
+            length = response.headers.get('Content-Length')
+            wire = int(length) if length and length.isdigit() else None
+            if stream:
+                # Тело потокового ответа не читается ради метрик; размер до сжатия неизвестен
+                bytes_in = raw_in = wire or 0
+            else:
+                # Прочитанное тело уже распаковано; по сети пришло столько, сколько
+                # прочитано из raw (для сжатого ответа без Content-Length)
+                raw_in = len(response.content or b'')
+                if wire is None:
+                    tell = getattr(response.raw, 'tell', None)
+                    wire = tell() if callable(tell) else raw_in
+                bytes_in = wire
+        raw_out = raw_bytes_out if raw_bytes_out is not None else bytes_out
+        with self._lock:
+            stats = self._endpoints.setdefault((method, template), {
+                'latency': LatencyHistogram(),
+                'statuses': Counter(),
+                'bytes_out': 0,
+                'bytes_in': 0,
+                'bytes_out_raw': 0,
+                'bytes_in_raw': 0
+            })
+            stats['latency'].observe(elapsed)
+            stats['statuses'][status] += 1
+            stats['bytes_out'] += bytes_out
+            stats['bytes_in'] += bytes_in
+            stats['bytes_out_raw'] += raw_out
+            stats['bytes_in_raw'] += raw_in
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """
+        Посчитать переиспользование соединений по пулам зарегистрированных адаптеров.
+
+        Returns:
+            Dict[str, Any]: Количество запросов, новых соединений и доля
+                запросов, выполненных на уже открытых соединениях
+        """
+        requests_total = connections = 0
+        with self._lock:
+            adapters = list(self._adapters)
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    requests_total += pool.num_requests
+                    connections += pool.num_connections
+        reuse = 1 - connections / requests_total if requests_total else 0.0
+        return {'requests': requests_total, 'connections': connections, 'reuse_ratio': max(reuse, 0.0)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Представить метрики словарем.
+
+        Returns:
+            Dict[str, Any]: Метрики эндпоинтов и соединений
+        """
+        with self._lock:
+            endpoints = [
+                {
+                    'method': method,
+                    'endpoint': template,
+                    'latency': stats['latency'].to_dict(),
+                    'statuses': dict(stats['statuses']),
+                    'bytes_out': stats['bytes_out'],
+                    'bytes_in': stats['bytes_in'],
+                    'bytes_out_raw': stats['bytes_out_raw'],
+                    'bytes_in_raw': stats['bytes_in_raw'],
+                    'compression': self._compression(stats)
+                }
+                for (method, template), stats in sorted(self._endpoints.items())
+            ]
+        return {'endpoints': endpoints, 'connections': self.connection_stats()}
+
+    def to_json(self) -> str:
+        """
+        Экспортировать метрики в JSON.
+
+        Returns:
+            str: JSON с метриками
+        """
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Экспортировать метрики в текстовом формате Prometheus.
+
+        Returns:
+            str: Метрики в формате exposition
+        """
+        data = self.to_dict()
+        lines = [
+            '# TYPE api_client_request_duration_seconds histogram',
+        ]
+        for item in data['endpoints']:
+            labels = f'method="{item["method"]}",endpoint="{item["endpoint"]}"'
+            cumulative = 0
+            for bound, bucket_count in item['latency']['buckets'].items():
+                cumulative += bucket_count
+                lines.append(f'api_client_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'api_client_request_duration_seconds_sum{{{labels}}} {item["latency"]["sum"]}')
+            lines.append(f'api_client_request_duration_seconds_count{{{labels}}} {item["latency"]["count"]}')
+        lines.append('# TYPE api_client_responses_total counter')
+        for item in data['endpoints']:
+            labels = f'method="{item["method"]}",endpoint="{item["endpoint"]}"'
+            for status, count in sorted(item['statuses'].items()):
+                lines.append(f'api_client_responses_total{{{labels},status="{status}"}} {count}')
+        for direction in ('out', 'in'):
+            lines.append(f'# TYPE api_client_bytes_{direction}_total counter')
+            for item in data['endpoints']:
+                labels = f'method="{item["method"]}",endpoint="{item["endpoint"]}"'
+                lines.append(f'api_client_bytes_{direction}_total{{{labels}}} {item["bytes_" + direction]}')
+        lines.append('# TYPE api_client_bytes_saved_total counter')
+        for item in data['endpoints']:
+            labels = f'method="{item["method"]}",endpoint="{item["endpoint"]}"'
+            for direction in ('out', 'in'):
+                saved = item['compression'][f'{direction}_saved']
+                lines.append(f'api_client_bytes_saved_total{{{labels},direction="{direction}"}} {saved}')
+        lines.append('# TYPE api_client_compression_ratio gauge')
+        for item in data['endpoints']:
+            labels = f'method="{item["method"]}",endpoint="{item["endpoint"]}"'
+            for direction in ('out', 'in'):
+                ratio = item['compression'][f'{direction}_ratio']
+                lines.append(f'api_client_compression_ratio{{{labels},direction="{direction}"}} {ratio}')
+        lines.append('# TYPE api_client_connection_reuse_ratio gauge')
+        lines.append(f'api_client_connection_reuse_ratio {data["connections"]["reuse_ratio"]}')
+        return '\n'.join(lines) + '\n'
+
+    def __bool__(self) -> bool:
+        return bool(self._endpoints)
+
+    @staticmethod
+    def _compression(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Посчитать степень сжатия и сэкономленные байты эндпоинта.
+
+        Args:
+            stats (Dict[str, Any]): Счетчики эндпоинта
+
+        Returns:
+            Dict[str, Any]: out_ratio/in_ratio (размер до сжатия к размеру по сети,
+                1.0 без сжатия), out_saved/in_saved и bytes_saved в байтах
+        """
+        result: Dict[str, Any] = {}
+        for direction in ('out', 'in'):
+            wire, raw = stats[f'bytes_{direction}'], stats[f'bytes_{direction}_raw']
+            result[f'{direction}_ratio'] = raw / wire if wire else 1.0
+            result[f'{direction}_saved'] = raw - wire
+        result['bytes_saved'] = result['out_saved'] + result['in_saved']
+        return result
+
+    @staticmethod
+    def _body_size(body: Any) -> int:
+        """
+        Получить размер тела запроса в байтах.
+
+        Args:
+            body (Any): Тело подготовленного запроса
+
+        Returns:
+            int: Размер в байтах, 0 для потоковых тел
+        """
+        if isinstance(body, bytes):
+            return len(body)
+        if isinstance(body, str):
+            return len(body.encode())
+        return 0
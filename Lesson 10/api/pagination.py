@@ -0,0 +1,69 @@
+"""Разбор страниц списка учителей, общий для синхронного и асинхронного клиентов."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# Запрос следующей страницы: эндпоинт или абсолютный URL и параметры
+PageRequest = Tuple[str, Optional[Dict[str, Any]]]
+
+
+def next_link(response: Any) -> Optional[str]:
+    """
+    Получить URL из заголовка Link с rel="next".
+
+    Args:
+        response (Any): Ответ с атрибутом links в формате requests.Response.links
+
+    Returns:
+        Optional[str]: URL следующей страницы или None
+    """
+    links = getattr(response, 'links', None)
+    return links.get('next', {}).get('url') if isinstance(links, dict) else None
+
+
+def next_page(body: Any, link: Optional[str], page_size: int,
+              after_id: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Optional[PageRequest]]:
+    """
+    Извлечь учителей страницы и запрос следующей страницы.
+
+    Порядок определения следующей страницы:
+    1. заголовок Link с rel="next";
+    2. тело-объект: список в items/teachers/data/results, далее
+       next (URL), next_cursor/cursor или page с total_pages;
+    3. тело-список: keyset по after_id, если страница заполнена.
+       Если сервер не продвинулся дальше after_id текущего запроса
+       (игнорирует limit/after_id), уже выданные учителя отбрасываются
+       и обход заканчивается, чтобы не запрашивать ту же страницу бесконечно.
+
+    Args:
+        body (Any): Декодированное тело ответа
+        link (Optional[str]): URL из заголовка Link rel="next" (см. next_link)
+        page_size (int): Размер страницы
+        after_id (Optional[int]): after_id запроса этой страницы
+
+    Returns:
+        Tuple: Учителя страницы и пара (эндпоинт или URL, параметры)
+            следующего запроса либо None, если страница последняя
+    """
+    if isinstance(body, dict):
+        items = next(
+            (body[key] for key in ('items', 'teachers', 'data', 'results') if key in body), []
+        )
+        cursor = body.get('next_cursor') or body.get('cursor')
+        if link:
+            return items, (link, None)
+        if isinstance(body.get('next'), str):
+            return items, (body['next'], None)
+        if cursor and items:
+            return items, ("teachers", {"limit": page_size, "cursor": cursor})
+        page, total_pages = body.get('page'), body.get('total_pages')
+        if page is not None and total_pages is not None and page < total_pages:
+            return items, ("teachers", {"limit": page_size, "page": page + 1})
+        return items, None
+
+    if link:
+        return body, (link, None)
+    if after_id is not None and body and body[0]["teacher_id"] <= after_id:
+        return [teacher for teacher in body if teacher["teacher_id"] > after_id], None
+    if len(body) < page_size:
+        return body, None
+    return body, ("teachers", {"limit": page_size, "after_id": body[-1]["teacher_id"]})
@@ -0,0 +1,159 @@
+"""Клиентское ограничение частоты запросов с адаптацией по 429 и задержкам (AIMD)."""
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket с адаптивной скоростью, общий для потоков и клиентов.
+
+    Каждый запрос забирает токен; если токенов нет, поток резервирует
+    следующий и спит до его появления, так что очередь обслуживается
+    в порядке прихода без холостых пробуждений. Скорость меняется по AIMD:
+    успешный ответ добавляет increase / rate запросов/сек (около increase
+    в секунду при полной загрузке), а 429/503, превышение latency_target
+    или таймаут умножают скорость на decrease — не чаще раза в cooldown
+    секунд, чтобы пачка ответов одного перегруза не обрушила скорость.
+    Retry-After останавливает выдачу токенов до указанного момента.
+    """
+
+    def __init__(self, rate: float = 50.0, burst: Optional[float] = None,
+                 min_rate: float = 1.0, max_rate: float = 1000.0,
+                 increase: float = 1.0, decrease: float = 0.5,
+                 latency_target: Optional[float] = None, cooldown: float = 1.0,
+                 throttle_statuses: Iterable[int] = (429, 503),
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        """
+        Инициализация ограничителя.
+
+        Args:
+            rate (float): Начальная скорость в запросах/сек
+            burst (Optional[float]): Емкость корзины; по умолчанию скорость за секунду, но не меньше 1
+            min_rate (float): Нижняя граница скорости
+            max_rate (float): Верхняя граница скорости
+            increase (float): Аддитивный прирост скорости за секунду успешных запросов
+            decrease (float): Множитель скорости при перегрузке
+            latency_target (Optional[float]): Задержка ответа в секундах, выше которой
+                сервер считается перегруженным; None — задержка не учитывается
+            cooldown (float): Минимальный интервал между снижениями скорости в секундах
+            throttle_statuses (Iterable[int]): Статусы перегрузки
+            clock (Callable[[], float]): Источник монотонного времени
+            sleep (Callable[[float], None]): Функция ожидания
+        """
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self.throttle_statuses = frozenset(throttle_statuses)
+        self.clock = clock
+        self.sleep = sleep
+        self.stats = {'acquired': 0, 'waited': 0.0, 'throttled': 0, 'decreases': 0}
+        self._tokens = self._capacity()
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._last_decrease = float('-inf')
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Получить разрешение на один запрос, при необходимости подождав.
+
+        Returns:
+            float: Время ожидания в секундах
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self._tokens -= 1
+            # Во время паузы Retry-After токены начисляются только после ее конца
+            wait = max(0.0, self._blocked_until - now) + max(0.0, -self._tokens) / self.rate
+            self.stats['acquired'] += 1
+            self.stats['waited'] += wait
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def on_response(self, status_code: int, elapsed: float,
+                    retry_after: Optional[float] = None) -> None:
+        """
+        Учесть ответ сервера в скорости.
+
+        Args:
+            status_code (int): HTTP статус
+            elapsed (float): Задержка ответа в секундах
+            retry_after (Optional[float]): Значение Retry-After в секундах
+        """
+        with self._lock:
+            now = self.clock()
+            if status_code in self.throttle_statuses:
+                self.stats['throttled'] += 1
+                if retry_after is not None:
+                    self._refill(now)
+                    self._blocked_until = max(self._blocked_until, now + retry_after)
+                    self._tokens = min(self._tokens, 0.0)
+                self._back_off(now)
+            elif self.latency_target is not None and elapsed > self.latency_target:
+                self._back_off(now)
+            elif status_code < 500:
+                self._refill(now)
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def on_timeout(self) -> None:
+        """
+        Учесть таймаут запроса как признак перегрузки.
+        """
+        with self._lock:
+            self._back_off(self.clock())
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Получить текущую скорость и счетчики.
+
+        Returns:
+            Dict[str, float]: rate и счетчики stats
+        """
+        with self._lock:
+            return {'rate': self.rate, **self.stats}
+
+    def _capacity(self) -> float:
+        """
+        Вычислить емкость корзины для текущей скорости.
+
+        Returns:
+            float: Максимум накопленных токенов
+        """
+        return self.burst if self.burst is not None else max(1.0, self.rate)
+
+    def _refill(self, now: float) -> None:
+        """
+        Начислить токены за прошедшее время по текущей скорости.
+
+        Args:
+            now (float): Текущее время
+        """
+        start = max(self._updated, self._blocked_until)
+        if now > start:
+            self._tokens = min(self._capacity(), self._tokens + (now - start) * self.rate)
+        self._updated = max(self._updated, now)
+
+    def _back_off(self, now: float) -> None:
+        """
+        Мультипликативно снизить скорость, если с прошлого снижения прошло cooldown секунд.
+
+        Args:
+            now (float): Текущее время
+        """
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self._tokens = min(self._tokens, self._capacity())
+        self._last_decrease = now
+        self.stats['decreases'] += 1
@@ -0,0 +1,313 @@
+"""Повторы запросов с экспоненциальной задержкой и circuit breaker по хостам."""
+
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, Union
+
+import requests
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Запрос отклонен без обращения к серверу: circuit breaker хоста разомкнут.
+    """
+
+
+def parse_retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Разобрать заголовок Retry-After (секунды или HTTP дата).
+
+    Args:
+        response (requests.Response): Ответ сервера
+
+    Returns:
+        Optional[float]: Задержка в секундах или None
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Политика повторов для идемпотентных запросов.
+
+    Повторяются ошибки соединения, таймауты и статусы из retry_statuses.
+    Задержка растет экспоненциально (backoff_factor * 2 ** попытка) с полным
+    джиттером и ограничена max_backoff; заголовок Retry-After имеет приоритет.
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff_factor: float = 0.2,
+                 max_backoff: float = 10.0, jitter: bool = True,
+                 retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+                 methods: Iterable[str] = ('GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'),
+                 max_retry_after: float = 60.0,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        """
+        Инициализация политики повторов.
+
+        Args:
+            max_attempts (int): Максимум попыток, включая первую
+            backoff_factor (float): Базовая задержка в секундах
+            max_backoff (float): Максимальная задержка в секундах
+            jitter (bool): Случайная задержка в [0, backoff] вместо фиксированной
+            retry_statuses (Iterable[int]): Статусы ответа для повтора
+            methods (Iterable[str]): HTTP методы, которые можно повторять
+            max_retry_after (float): Верхняя граница для Retry-After в секундах
+            sleep (Callable[[float], None]): Функция ожидания
+        """
+        if max_attempts <= 0:
+            raise ValueError("max_attempts должен быть положительным числом")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.max_retry_after = max_retry_after
+        self.sleep = sleep
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """
+        Проверить можно ли повторить запрос.
+
+        Args:
+            method (str): HTTP метод
+            attempt (int): Номер выполненной попытки, начиная с 1
+
+        Returns:
+            bool: True если метод идемпотентный и попытки не исчерпаны
+        """
+        return method.upper() in self.methods and attempt < self.max_attempts
+
+    def should_retry_response(self, response: requests.Response) -> bool:
+        """
+        Проверить нужно ли повторять запрос по статусу ответа.
+
+        Args:
+            response (requests.Response): Ответ сервера
+
+        Returns:
+            bool: True если статус в retry_statuses
+        """
+        return response.status_code in self.retry_statuses
+
+    def backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Вычислить задержку перед следующей попыткой.
+
+        Args:
+            attempt (int): Номер выполненной попытки, начиная с 1
+            response (Optional[requests.Response]): Ответ сервера, если был
+
+        Returns:
+            float: Задержка в секундах
+        """
+        retry_after = parse_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class ProbeToken:
+    """
+    Право на пробный запрос half-open, выданное CircuitBreaker.allow_request.
+
+    Только владелец действующего токена может освободить место пробы
+    или своим результатом замкнуть или снова разомкнуть breaker.
+    """
+
+    __slots__ = ()
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker одного хоста.
+
+    Считает результаты последних window_size запросов. Когда доля ошибок
+    (ошибки соединения и 5xx) превышает failure_rate_threshold при не менее
+    min_requests запросах, breaker размыкается и отклоняет запросы
+    open_duration секунд. Затем пропускает пробный запрос (half-open) и выдает
+    ему ProbeToken: успех с этим токеном замыкает breaker, ошибка снова
+    размыкает. Результаты запросов, пропущенных до размыкания, состояние
+    half-open не меняют. Пробный запрос, завершившийся без результата,
+    освобождает место через release_probe; если и этого не случилось, через
+    probe_timeout секунд выдается новый токен, а старый перестает действовать,
+    так что потерянная проба не блокирует хост навсегда.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_rate_threshold: float = 0.5, min_requests: int = 10,
+                 window_size: int = 20, open_duration: float = 10.0,
+                 probe_timeout: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Инициализация circuit breaker.
+
+        Args:
+            failure_rate_threshold (float): Доля ошибок для размыкания
+            min_requests (int): Минимум запросов в окне для оценки доли ошибок
+            window_size (int): Размер окна последних результатов
+            open_duration (float): Время в разомкнутом состоянии в секундах
+            probe_timeout (Optional[float]): Через сколько секунд пробный запрос без
+                результата считается потерянным; по умолчанию open_duration
+            clock (Callable[[], float]): Источник монотонного времени
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_requests = min_requests
+        self.open_duration = open_duration
+        self.probe_timeout = probe_timeout if probe_timeout is not None else open_duration
+        self.clock = clock
+        self.state = self.CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probe: Optional[ProbeToken] = None
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+        self.stats = {'successes': 0, 'failures': 0, 'rejected': 0, 'opened': 0}
+
+    def allow_request(self) -> Union[bool, ProbeToken]:
+        """
+        Проверить можно ли выполнить запрос.
+
+        Returns:
+            Union[bool, ProbeToken]: True в замкнутом состоянии, ProbeToken для
+                пробного запроса half-open, False если breaker разомкнут или
+                пробный запрос уже выполняется
+        """
+        with self._lock:
+            now = self.clock()
+            if self.state == self.OPEN and now - self._opened_at >= self.open_duration:
+                self.state = self.HALF_OPEN
+                self._probe = None
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and (
+                self._probe is None or now - self._probe_started >= self.probe_timeout
+            ):
+                self._probe = ProbeToken()
+                self._probe_started = now
+                return self._probe
+            self.stats['rejected'] += 1
+            return False
+
+    def release_probe(self, probe: Optional[ProbeToken]) -> None:
+        """
+        Освободить место пробного запроса, завершившегося без результата
+        (например, исключением до ответа сервера); состояние не меняется.
+
+        Args:
+            probe (Optional[ProbeToken]): Токен из allow_request; чужой или
+                истекший токен ничего не освобождает
+        """
+        with self._lock:
+            if probe is not None and probe is self._probe:
+                self._probe = None
+
+    def record_success(self, probe: Optional[ProbeToken] = None) -> None:
+        """
+        Учесть успешный запрос.
+
+        Args:
+            probe (Optional[ProbeToken]): Токен пробного запроса; только успех
+                действующей пробы замыкает breaker из half-open
+        """
+        with self._lock:
+            self.stats['successes'] += 1
+            if probe is not None and probe is self._probe:
+                self._probe = None
+                self.state = self.CLOSED
+                self._outcomes.clear()
+            if self.state == self.CLOSED:
+                self._outcomes.append(True)
+
+    def record_failure(self, probe: Optional[ProbeToken] = None) -> None:
+        """
+        Учесть неуспешный запрос и при необходимости разомкнуть breaker.
+
+        Args:
+            probe (Optional[ProbeToken]): Токен пробного запроса; только ошибка
+                действующей пробы снова размыкает breaker из half-open
+        """
+        with self._lock:
+            self.stats['failures'] += 1
+            if probe is not None and probe is self._probe:
+                self._probe = None
+                self._open()
+                return
+            if self.state != self.CLOSED:
+                return
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if (len(self._outcomes) >= self.min_requests
+                    and failures / len(self._outcomes) >= self.failure_rate_threshold):
+                self._open()
+
+    def _open(self) -> None:
+        """
+        Разомкнуть breaker; вызывается под блокировкой.
+        """
+        self.state = self.OPEN
+        self._opened_at = self.clock()
+        self.stats['opened'] += 1
+
+
+class CircuitBreakerRegistry:
+    """
+    Набор circuit breaker'ов по хостам.
+
+    Один реестр можно передать нескольким клиентам, чтобы они разделяли
+    состояние хоста.
+    """
+
+    def __init__(self, **breaker_options: Any) -> None:
+        """
+        Инициализация реестра.
+
+        Args:
+            **breaker_options (Any): Параметры CircuitBreaker для новых хостов
+        """
+        self.breaker_options = breaker_options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> CircuitBreaker:
+        """
+        Получить breaker хоста, создав его при первом обращении.
+
+        Args:
+            host (str): Хост с портом
+
+        Returns:
+            CircuitBreaker: Breaker хоста
+        """
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(**self.breaker_options)
+            return self._breakers[host]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Получить состояние и счетчики всех хостов.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Состояние и счетчики по хостам
+        """
+        with self._lock:
+            return {
+                host: dict(breaker.stats, state=breaker.state)
+                for host, breaker in self._breakers.items()
+            }
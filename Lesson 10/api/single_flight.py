@@ -0,0 +1,86 @@
+"""Объединение одновременных одинаковых запросов (single-flight)."""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """
+    Выполняющийся вызов и его результат.
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Группа вызовов, в которой одинаковые одновременные вызовы выполняются один раз.
+
+    Первый поток с ключом выполняет функцию, остальные потоки с тем же
+    ключом ждут его результата. Все вызывающие получают один и тот же
+    объект результата без копирования: он только для чтения, а код,
+    которому нужно его изменить, сначала делает свою копию.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация пустой группы.
+        """
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.stats = {'executed': 0, 'shared': 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Выполнить функцию или дождаться уже выполняющегося вызова с тем же ключом.
+
+        Args:
+            key (Hashable): Ключ вызова
+            fn (Callable[[], Any]): Функция без аргументов
+
+        Returns:
+            Any: Результат функции, общий для всех объединенных вызовов (только для чтения)
+
+        Raises:
+            Exception: исключение функции, в том числе ожидающим потокам
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats['executed'] += 1
+            else:
+                self.stats['shared'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def forget(self) -> None:
+        """
+        Перестать присоединять новые вызовы к уже выполняющимся.
+
+        Вызывается после изменяющего запроса: начатые до него вызовы
+        могут вернуть устаревшие данные, поэтому последующие вызовы
+        выполняются заново. Ожидающие потоки получают свой результат.
+        """
+        with self._lock:
+            self._calls.clear()
@@ -1,9 +1,18 @@
 """API клиент для работы с учителями."""
 
-from typing import Dict, Any, List, Optional
-import allure
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+import time
+import requests
+
+from utils.tracing import traced
 
 from .base_client import BaseAPIClient
+from .concurrency import AdaptiveConcurrencyLimiter
+from .json_codec import iter_json_array
+from .pagination import PageRequest, next_link, next_page
+from .teacher_batch import TeacherBatch
+from .teacher_index import TeacherIndex
 
 
 class TeacherAPI(BaseAPIClient):
@@ -14,16 +23,38 @@ class TeacherAPI(BaseAPIClient):
     а также дополнительные методы для работы с данными.
     """
     
-    def __init__(self, base_url: str = "http://localhost:8080/api/v1") -> None:
+    def __init__(self, base_url: str = "http://localhost:8080/api/v1",
+                 index_max_age: Optional[float] = None,
+                 concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+                 stream_lists: bool = False, **client_options: Any) -> None:
         """
         Инициализация API клиента для учителей.
         
         Args:
             base_url (str): Базовый URL API учителей
+            index_max_age (Optional[float]): Включить локальную копию учителей (TeacherIndex):
+                get_teachers_by_group и search_teachers_by_email обслуживаются из памяти,
+                а копия синхронизируется, если старше index_max_age секунд; None — выключена
+            concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Окно одновременных
+                запросов get_teachers_by_ids; по умолчанию до pool_maxsize запросов.
+                Окно запоминается между вызовами и может разделяться между клиентами
+            stream_lists (bool): get_all_teachers, get_teachers_by_group и
+                search_teachers_by_email читают ответ потоком (stream_teachers)
+                без загрузки всего тела в память; такие ответы не кешируются
+            **client_options (Any): Параметры BaseAPIClient (таймауты, пул соединений)
         """
-        super().__init__(base_url)
+        super().__init__(base_url, **client_options)
+        self.index: Optional[TeacherIndex] = (
+            TeacherIndex(self, index_max_age) if index_max_age is not None else None
+        )
+        self.stream_lists = stream_lists
+        self.concurrency_limiter = concurrency_limiter or AdaptiveConcurrencyLimiter(
+            max_limit=self.pool_maxsize
+        )
+        # Сбрасывается после первого 405/501 на HEAD
+        self._head_supported = True
     
-    @allure.step("Получить всех учителей")
+    @traced("Получить всех учителей")
     def get_all_teachers(self) -> List[Dict[str, Any]]:
         """
         Получить список всех учителей.
@@ -31,10 +62,119 @@ class TeacherAPI(BaseAPIClient):
         Returns:
             List[Dict[str, Any]]: Список словарей с данными учителей
         """
-        response = self.get("teachers")
-        return response.json()
+        return self._single_flight(("teachers", None), lambda: self._list_teachers(None))
+    
+    def iter_teachers(self, page_size: int = 100,
+                      prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Лениво итерироваться по всем учителям страницами.
+        
+        Поддерживаются способы пагинации сервера (см. pagination.next_page):
+        заголовок Link rel="next", курсор или номер страницы в теле ответа
+        и keyset пагинация по limit/after_id для ответа-списка.
+        Пока вызывающий код обрабатывает текущую страницу, следующая
+        загружается в фоновом потоке, так что в памяти не больше двух страниц.
+        
+        Args:
+            page_size (int): Размер страницы
+            prefetch (bool): Загружать следующую страницу в фоне
+            
+        Yields:
+            Dict[str, Any]: Данные учителя
+        """
+        if page_size <= 0:
+            raise ValueError("page_size должен быть положительным числом")
+        
+        def fetch(request: PageRequest) -> Any:
+            return self.get(request[0], params=request[1])
+        
+        request: Optional[PageRequest] = ("teachers", {"limit": page_size})
+        pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            response = fetch(request)
+            while True:
+                after_id = request[1].get("after_id") if request[1] else None
+                items, request = self._next_page(response, page_size, after_id)
+                pending = pool.submit(fetch, request) if pool and request else None
+                yield from items
+                if request is None:
+                    return
+                response = pending.result() if pending else fetch(request)
+        finally:
+            if pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _next_page(self, response: Any, page_size: int, after_id: Optional[int] = None
+                   ) -> Tuple[List[Dict[str, Any]], Optional[PageRequest]]:
+        """
+        Извлечь учителей страницы и запрос следующей страницы (см. pagination.next_page).
+        
+        Args:
+            response (Any): Ответ сервера
+            page_size (int): Размер страницы
+            after_id (Optional[int]): after_id запроса этой страницы
+            
+        Returns:
+            Tuple: Учителя страницы и пара (эндпоинт или URL, параметры)
+                следующего запроса либо None, если страница последняя
+        """
+        return next_page(self.decode_json(response), next_link(response), page_size, after_id)
+    
+    def stream_teachers(self, params: Optional[Dict[str, Any]] = None,
+                        chunk_size: int = 64 * 1024) -> Iterator[Dict[str, Any]]:
+        """
+        Потоково получить список учителей одним запросом.
+        
+        Тело ответа читается кусками по chunk_size и разбирается по мере
+        прихода: первый учитель доступен до загрузки всего списка, а в памяти
+        не хранится ни полное тело, ни полный список словарей.
+        
+        Args:
+            params (Optional[Dict[str, Any]]): Параметры запроса (group_id, email)
+            chunk_size (int): Размер куска чтения в байтах
+            
+        Yields:
+            Dict[str, Any]: Данные учителя
+        """
+        response = self.get("teachers", params=params, stream=True)
+        try:
+            yield from iter_json_array(response.iter_content(chunk_size), self.json_loads)
+        finally:
+            response.close()
     
-    @allure.step("Получить учителя по ID: {teacher_id}")
+    def _list_teachers(self, params: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Получить список учителей целиком: потоком при stream_lists, иначе одним телом.
+        
+        Args:
+            params (Optional[Dict[str, Any]]): Параметры запроса (group_id, email)
+            
+        Returns:
+            List[Dict[str, Any]]: Список учителей
+        """
+        if self.stream_lists:
+            return list(self.stream_teachers(params))
+        return self.decode_json(self.get("teachers", params=params))
+    
+    @traced("Получить учителей в колоночном виде")
+    def get_teachers_batch(self, params: Optional[Dict[str, Any]] = None,
+                           chunk_size: int = 64 * 1024) -> TeacherBatch:
+        """
+        Получить список учителей в компактном колоночном виде (TeacherBatch).
+        
+        Ответ разбирается потоково, и каждый учитель сразу переносится в колонки,
+        так что список словарей целиком в памяти не создается.
+        
+        Args:
+            params (Optional[Dict[str, Any]]): Параметры запроса (group_id, email)
+            chunk_size (int): Размер куска чтения в байтах
+            
+        Returns:
+            TeacherBatch: Учителя с ленивым созданием словарей строк
+        """
+        return TeacherBatch.from_dicts(self.stream_teachers(params, chunk_size))
+    
+    @traced("Получить учителя по ID: {teacher_id}")
     def get_teacher_by_id(self, teacher_id: int) -> Optional[Dict[str, Any]]:
         """
         Получить данные учителя по ID.
@@ -45,13 +185,16 @@ class TeacherAPI(BaseAPIClient):
         Returns:
             Optional[Dict[str, Any]]: Данные учителя или None если не найден
         """
-        try:
-            response = self.get(f"teachers/{teacher_id}")
-            return response.json()
-        except Exception:
-            return None
+        def fetch() -> Optional[Dict[str, Any]]:
+            try:
+                response = self.get(f"teachers/{teacher_id}")
+                return self.decode_json(response)
+            except Exception:
+                return None
+        
+        return self._single_flight((f"teachers/{teacher_id}", None), fetch)
     
-    @allure.step("Создать учителя")
+    @traced("Создать учителя")
     def create_teacher(self, teacher_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Создать нового учителя.
@@ -63,9 +206,12 @@ class TeacherAPI(BaseAPIClient):
             Dict[str, Any]: Данные созданного учителя
         """
         response = self.post("teachers", data=teacher_data)
-        return response.json()
+        teacher = self.decode_json(response)
+        if self.index is not None:
+            self.index.upsert(teacher)
+        return teacher
     
-    @allure.step("Обновить учителя: ID={teacher_id}")
+    @traced("Обновить учителя: ID={teacher_id}")
     def update_teacher(self, teacher_id: int, teacher_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Обновить данные учителя.
@@ -78,9 +224,12 @@ class TeacherAPI(BaseAPIClient):
             Dict[str, Any]: Обновленные данные учителя
         """
         response = self.put(f"teachers/{teacher_id}", data=teacher_data)
-        return response.json()
+        teacher = self.decode_json(response)
+        if self.index is not None:
+            self.index.upsert(teacher)
+        return teacher
     
-    @allure.step("Обновить email учителя: ID={teacher_id}, new_email={new_email}")
+    @traced("Обновить email учителя: ID={teacher_id}, new_email={new_email}")
     def update_teacher_email(self, teacher_id: int, new_email: str) -> Dict[str, Any]:
         """
         Обновить email учителя.
@@ -94,7 +243,7 @@ class TeacherAPI(BaseAPIClient):
         """
         return self.update_teacher(teacher_id, {"email": new_email})
     
-    @allure.step("Удалить учителя: ID={teacher_id}")
+    @traced("Удалить учителя: ID={teacher_id}")
     def delete_teacher(self, teacher_id: int) -> bool:
         """
         Удалить учителя по ID.
@@ -107,25 +256,139 @@ class TeacherAPI(BaseAPIClient):
         """
         try:
             self.delete(f"teachers/{teacher_id}")
-            return True
         except Exception:
             return False
+        if self.index is not None:
+            self.index.remove(teacher_id)
+        return True
     
-    @allure.step("Проверить существование учителя: ID={teacher_id}")
+    @traced("Проверить существование учителя: ID={teacher_id}")
     def teacher_exists(self, teacher_id: int) -> bool:
         """
         Проверить существование учителя по ID.
         
+        Отправляется HEAD запрос без тела ответа. Если сервер не поддерживает
+        HEAD (405 или 501), выполняется GET, и дальше клиент сразу использует GET.
+        
         Args:
             teacher_id (int): ID учителя для проверки
             
         Returns:
-            bool: True если учитель существует
+            bool: True если учитель существует, False если сервер вернул 404
+            
+        Raises:
+            requests.HTTPError: если сервер вернул другой статус 4xx/5xx
+            requests.ConnectionError: если сервер недоступен
+            requests.Timeout: если истек таймаут
+        """
+        endpoint = f"teachers/{teacher_id}"
+        if self._head_supported:
+            try:
+                self.head(endpoint)
+                return True
+            except requests.HTTPError as error:
+                status = error.response.status_code if error.response is not None else None
+                if status == 404:
+                    return False
+                if status not in (405, 501):
+                    raise
+                self._head_supported = False
+        try:
+            self.get(endpoint)
+            return True
+        except requests.HTTPError as error:
+            if error.response is not None and error.response.status_code == 404:
+                return False
+            raise
+    
+    @traced("Проверить существование учителей пачкой")
+    def teachers_exist(self, teacher_ids: Sequence[int],
+                       max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Проверить существование нескольких учителей параллельными HEAD запросами.
+        
+        Запросы идут по keep-alive соединениям общего пула сессии.
+        Ошибки соединения и статусы кроме 404 не считаются отсутствием
+        учителя, а попадают в errors.
+        
+        Args:
+            teacher_ids (Sequence[int]): ID учителей для проверки
+            max_workers (Optional[int]): Количество потоков, по умолчанию pool_maxsize
+            
+        Returns:
+            Dict[str, Any]: results с True/False в порядке входных данных,
+                errors по элементам, счетчики и throughput
         """
-        teacher = self.get_teacher_by_id(teacher_id)
-        return teacher is not None
+        return self._fan_out(self.teacher_exists, teacher_ids, max_workers)
     
-    @allure.step("Получить учителей по группе: {group_id}")
+    @traced("Получить учителей по списку ID")
+    def get_teachers_by_ids(self, teacher_ids: Sequence[int]) -> Dict[str, Any]:
+        """
+        Получить несколько учителей параллельными запросами в адаптивном окне.
+        
+        Число одновременных запросов задает concurrency_limiter: оно растет,
+        пока задержка ответов близка к базовой, и уменьшается при росте
+        задержки, 429/502/503/504, таймаутах и ошибках соединения. Новый запрос
+        отправляется, как только в окне освобождается место. Каждый ID
+        запрашивается одной попыткой без retry_policy, а задержка берется
+        из ответа (response.elapsed): паузы повторов и ожидание ограничителя
+        частоты не искажают замер окна.
+        
+        Args:
+            teacher_ids (Sequence[int]): ID учителей; повторы запрашиваются один раз
+            
+        Returns:
+            Dict[str, Any]: teachers — найденные учителя по ID, missing — ID с ответом 404
+                в порядке входных данных, errors — текст ошибки по ID, elapsed,
+                throughput (запросов/сек) и concurrency — окно после вызова
+        """
+        limiter = self.concurrency_limiter
+        unique_ids = list(dict.fromkeys(teacher_ids))
+        found: Dict[int, Dict[str, Any]] = {}
+        missing = set()
+        errors: Dict[int, str] = {}
+        
+        def fetch(teacher_id: int) -> None:
+            rtt: Optional[float] = None
+            overloaded = False
+            try:
+                response = self._request("GET", f"teachers/{teacher_id}", retry=False)
+                rtt = response.elapsed.total_seconds()
+                found[teacher_id] = self.decode_json(response)
+            except requests.HTTPError as error:
+                status = error.response.status_code if error.response is not None else None
+                if status == 404:
+                    rtt = error.response.elapsed.total_seconds()
+                    missing.add(teacher_id)
+                else:
+                    overloaded = status in (429, 502, 503, 504)
+                    errors[teacher_id] = str(error)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                overloaded = True
+                errors[teacher_id] = str(error)
+            except Exception as error:
+                errors[teacher_id] = str(error)
+            finally:
+                limiter.release(rtt, overloaded)
+        
+        started = time.perf_counter()
+        if unique_ids:
+            with ThreadPoolExecutor(max_workers=min(limiter.max_limit, len(unique_ids))) as pool:
+                for teacher_id in unique_ids:
+                    limiter.acquire()
+                    pool.submit(fetch, teacher_id)
+        elapsed = time.perf_counter() - started
+        return {
+            'teachers': {teacher_id: found[teacher_id] for teacher_id in unique_ids
+                         if teacher_id in found},
+            'missing': [teacher_id for teacher_id in unique_ids if teacher_id in missing],
+            'errors': errors,
+            'elapsed': elapsed,
+            'throughput': len(unique_ids) / elapsed if elapsed else 0.0,
+            'concurrency': limiter.limit
+        }
+    
+    @traced("Получить учителей по группе: {group_id}")
     def get_teachers_by_group(self, group_id: int) -> List[Dict[str, Any]]:
         """
         Получить список учителей по ID группы.
@@ -136,10 +399,14 @@ class TeacherAPI(BaseAPIClient):
         Returns:
             List[Dict[str, Any]]: Список учителей группы
         """
-        response = self.get("teachers", params={"group_id": group_id})
-        return response.json()
+        if self.index is not None:
+            return self.index.by_group(group_id)
+        return self._single_flight(
+            ("teachers", ("group_id", group_id)),
+            lambda: self._list_teachers({"group_id": group_id})
+        )
     
-    @allure.step("Поиск учителей по email: {email}")
+    @traced("Поиск учителей по email: {email}")
     def search_teachers_by_email(self, email: str) -> List[Dict[str, Any]]:
         """
         Поиск учителей по email.
@@ -150,5 +417,87 @@ class TeacherAPI(BaseAPIClient):
         Returns:
             List[Dict[str, Any]]: Список найденных учителей
         """
-        response = self.get("teachers", params={"email": email})
-        return response.json()
+        if self.index is not None:
+            return self.index.by_email(email)
+        return self._single_flight(
+            ("teachers", ("email", email)),
+            lambda: self._list_teachers({"email": email})
+        )
+    
+    @traced("Поиск учителей по началу email: {prefix}")
+    def search_teachers_by_email_prefix(self, prefix: str) -> List[Dict[str, Any]]:
+        """
+        Поиск учителей по началу email без учета регистра.
+        
+        С локальной копией (index_max_age) поиск идет по отсортированному индексу,
+        без нее фильтруется полный список учителей.
+        
+        Args:
+            prefix (str): Начало email
+            
+        Returns:
+            List[Dict[str, Any]]: Список найденных учителей в порядке email
+        """
+        if self.index is not None:
+            return self.index.by_email_prefix(prefix)
+        prefix = prefix.lower()
+        return sorted(
+            (t for t in self.get_all_teachers() if str(t.get('email', '')).lower().startswith(prefix)),
+            key=lambda t: (str(t.get('email', '')).lower(), t.get('teacher_id'))
+        )
+    
+    @traced("Создать учителей пачкой")
+    def create_teachers(self, teachers_data: Sequence[Dict[str, Any]],
+                        max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Создать несколько учителей параллельными запросами.
+        
+        Args:
+            teachers_data (Sequence[Dict[str, Any]]): Данные новых учителей
+            max_workers (Optional[int]): Количество потоков, по умолчанию pool_maxsize
+            
+        Returns:
+            Dict[str, Any]: results с созданными учителями в порядке входных данных,
+                errors по элементам, счетчики и throughput
+        """
+        return self._fan_out(self.create_teacher, teachers_data, max_workers)
+    
+    @traced("Обновить учителей пачкой")
+    def update_teachers(self, updates: Sequence[Tuple[int, Dict[str, Any]]],
+                        max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Обновить несколько учителей параллельными запросами.
+        
+        Args:
+            updates (Sequence[Tuple[int, Dict[str, Any]]]): Пары (ID учителя, новые данные)
+            max_workers (Optional[int]): Количество потоков, по умолчанию pool_maxsize
+            
+        Returns:
+            Dict[str, Any]: results с обновленными учителями в порядке входных данных,
+                errors по элементам, счетчики и throughput
+        """
+        return self._fan_out(lambda update: self.update_teacher(*update), updates, max_workers)
+    
+    @traced("Удалить учителей пачкой")
+    def delete_teachers(self, teacher_ids: Sequence[int],
+                        max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Удалить несколько учителей параллельными запросами.
+        
+        В отличие от delete_teacher, ошибки не подавляются, а попадают в errors.
+        
+        Args:
+            teacher_ids (Sequence[int]): ID учителей для удаления
+            max_workers (Optional[int]): Количество потоков, по умолчанию pool_maxsize
+            
+        Returns:
+            Dict[str, Any]: results с True для удаленных учителей в порядке входных
+                данных, errors по элементам, счетчики и throughput
+        """
+        def delete_one(teacher_id: int) -> bool:
+            self.delete(f"teachers/{teacher_id}")
+            if self.index is not None:
+                self.index.remove(teacher_id)
+            return True
+        
+        return self._fan_out(delete_one, teacher_ids, max_workers)
@@ -0,0 +1,209 @@
+"""Компактное колоночное представление больших списков учителей."""
+
+import bisect
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+
+class TeacherBatch:
+    """
+    Список учителей в колонках вместо списка словарей.
+
+    teacher_id и group_id хранятся в array('q') (8 байт на значение),
+    email — одним буфером UTF-8 со смещениями, поэтому учитель занимает
+    около 60 байт вместо сотен в словаре. Словарь строки создается только
+    при обращении к ней. Хранятся поля teacher_id, email и group_id;
+    остальные поля ответа отбрасываются. Номера строк группы вычисляются
+    при первом filter_by_group и запоминаются до изменения списка.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация пустого списка.
+        """
+        self.ids = array('q')
+        self.group_ids = array('q')
+        self._emails = bytearray()
+        self._offsets = array('q', [0])
+        self._sorted = True
+        self._groups: Optional[Dict[int, array]] = None
+        self._positions: Optional[Dict[int, int]] = None
+
+    @classmethod
+    def from_dicts(cls, teachers: Iterable[Dict[str, Any]]) -> 'TeacherBatch':
+        """
+        Построить список из словарей учителей, не держа их все в памяти.
+
+        Args:
+            teachers (Iterable[Dict[str, Any]]): Словари с teacher_id, email и group_id;
+                может быть генератором (например, stream_teachers)
+
+        Returns:
+            TeacherBatch: Колоночный список
+        """
+        batch = cls()
+        for teacher in teachers:
+            batch.append(teacher)
+        return batch
+
+    def append(self, teacher: Dict[str, Any]) -> None:
+        """
+        Добавить учителя в конец списка.
+
+        Args:
+            teacher (Dict[str, Any]): Словарь с teacher_id, email и group_id
+        """
+        teacher_id = teacher['teacher_id']
+        if self.ids and teacher_id <= self.ids[-1]:
+            self._sorted = False
+        self.ids.append(teacher_id)
+        self.group_ids.append(teacher['group_id'])
+        self._emails += teacher['email'].encode()
+        self._offsets.append(len(self._emails))
+        self._groups = None
+        self._positions = None
+
+    def email(self, index: int) -> str:
+        """
+        Получить email строки без создания словаря.
+
+        Args:
+            index (int): Номер строки
+
+        Returns:
+            str: Email
+        """
+        index = range(len(self))[index]
+        return self._emails[self._offsets[index]:self._offsets[index + 1]].decode()
+
+    def get(self, teacher_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Найти учителя по ID: бинарным поиском, если ID возрастают, иначе по словарю позиций.
+
+        Args:
+            teacher_id (int): ID учителя
+
+        Returns:
+            Optional[Dict[str, Any]]: Данные учителя или None
+        """
+        if self._sorted:
+            position = bisect.bisect_left(self.ids, teacher_id)
+            found = position < len(self.ids) and self.ids[position] == teacher_id
+            return self[position] if found else None
+        if self._positions is None:
+            self._positions = {value: position for position, value in enumerate(self.ids)}
+        position = self._positions.get(teacher_id)
+        return self[position] if position is not None else None
+
+    def filter_by_group(self, group_id: int) -> 'TeacherBatch':
+        """
+        Получить учителей группы.
+
+        Args:
+            group_id (int): ID группы
+
+        Returns:
+            TeacherBatch: Учителя группы в исходном порядке
+        """
+        return self._take(self.group_positions(group_id))
+
+    def group_positions(self, group_id: int) -> array:
+        """
+        Получить номера строк группы.
+
+        Args:
+            group_id (int): ID группы
+
+        Returns:
+            array: Номера строк в array('q')
+        """
+        if self._groups is None:
+            self._groups = {}
+        positions = self._groups.get(group_id)
+        if positions is None:
+            # Сравнение и отбор выполняются в C без цикла Python по строкам
+            positions = array('q', compress(range(len(self)), map(group_id.__eq__, self.group_ids)))
+            self._groups[group_id] = positions
+        return positions
+
+    def group_counts(self) -> Dict[int, int]:
+        """
+        Посчитать учителей по группам.
+
+        Returns:
+            Dict[int, int]: ID группы → количество учителей
+        """
+        return dict(Counter(self.group_ids))
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Материализовать все строки словарями.
+
+        Returns:
+            List[Dict[str, Any]]: Список словарей учителей
+        """
+        return list(self)
+
+    def nbytes(self) -> int:
+        """
+        Посчитать память под данные колонок.
+
+        Returns:
+            int: Размер буферов в байтах
+        """
+        return sum(
+            column.itemsize * len(column) for column in (self.ids, self.group_ids, self._offsets)
+        ) + len(self._emails)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            positions = range(len(self))[index]
+            batch = self._take(positions)
+            batch._sorted = self._sorted and (positions.step > 0 or len(positions) < 2)
+            return batch
+        index = range(len(self))[index]
+        return {
+            'teacher_id': self.ids[index],
+            'email': self._emails[self._offsets[index]:self._offsets[index + 1]].decode(),
+            'group_id': self.group_ids[index]
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TeacherBatch):
+            return (self.ids == other.ids and self.group_ids == other.group_ids
+                    and self._emails == other._emails and self._offsets == other._offsets)
+        if isinstance(other, list):
+            return self.to_dicts() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TeacherBatch({len(self)} учителей, {self.nbytes()} байт)"
+
+    def _take(self, positions: Iterable[int]) -> 'TeacherBatch':
+        """
+        Скопировать выбранные строки в новый список.
+
+        Args:
+            positions (Iterable[int]): Номера строк по возрастанию
+
+        Returns:
+            TeacherBatch: Новый список
+        """
+        batch = TeacherBatch()
+        emails, offsets = self._emails, self._offsets
+        for position in positions:
+            batch.ids.append(self.ids[position])
+            batch.group_ids.append(self.group_ids[position])
+            batch._emails += emails[offsets[position]:offsets[position + 1]]
+            batch._offsets.append(len(batch._emails))
+        batch._sorted = self._sorted
+        return batch
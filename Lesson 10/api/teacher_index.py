@@ -0,0 +1,262 @@
+"""Локальная копия учителей с индексами по группе и email."""
+
+import bisect
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .json_codec import iter_json_array
+
+
+# Доля измененных учителей, после которой индексы строятся заново, а не правятся
+_REBUILD_RATIO = 0.25
+
+
+class TeacherIndex:
+    """
+    Копия списка учителей в памяти для запросов по группе и email без обращения к серверу.
+
+    Первая синхронизация загружает список потоково. Следующие отправляют
+    условный GET с If-None-Match: если список не изменился, сервер отвечает
+    304 без тела. Если изменился, индексы обновляются только для добавленных,
+    измененных и удаленных учителей. Индексы: словарь группа → ID,
+    словарь email → ID и отсортированный список email для поиска по префиксу.
+    Все методы потокобезопасны.
+    """
+
+    def __init__(self, api: Any, max_age: float = 0.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Инициализация пустой копии.
+
+        Args:
+            api (Any): Клиент TeacherAPI
+            max_age (float): Сколько секунд запросы обслуживаются без синхронизации;
+                0 — условный GET перед каждым запросом
+            clock (Callable[[], float]): Источник монотонного времени
+        """
+        self.api = api
+        self.max_age = max_age
+        self.clock = clock
+        self.etag: Optional[str] = None
+        self.synced_at: Optional[float] = None
+        self.stats = {'syncs': 0, 'not_modified': 0, 'added': 0, 'updated': 0, 'removed': 0}
+        self._teachers: Dict[int, Dict[str, Any]] = {}
+        self._by_group: Dict[int, Set[int]] = {}
+        self._by_email: Dict[str, Set[int]] = {}
+        self._emails: List[Tuple[str, int]] = []
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+
+    def sync(self) -> Dict[str, int]:
+        """
+        Синхронизировать копию с сервером.
+
+        Returns:
+            Dict[str, int]: Количество добавленных, измененных и удаленных учителей
+        """
+        headers = {'If-None-Match': self.etag} if self.etag else None
+        response = self.api.get("teachers", stream=True, headers=headers)
+        try:
+            if response.status_code == 304:
+                with self._lock:
+                    self.synced_at = self.clock()
+                    self.stats['syncs'] += 1
+                    self.stats['not_modified'] += 1
+                return {'added': 0, 'updated': 0, 'removed': 0}
+            fresh = {
+                teacher['teacher_id']: teacher
+                for teacher in iter_json_array(response.iter_content(64 * 1024), self.api.json_loads)
+            }
+            etag = response.headers.get('ETag')
+        finally:
+            response.close()
+
+        with self._lock:
+            changed = [
+                teacher for teacher_id, teacher in fresh.items()
+                if self._teachers.get(teacher_id) != teacher
+            ]
+            removed = [teacher_id for teacher_id in self._teachers if teacher_id not in fresh]
+            added = sum(1 for teacher in changed if teacher['teacher_id'] not in self._teachers)
+            if len(changed) + len(removed) > _REBUILD_RATIO * max(len(self._teachers), 1):
+                self._teachers = fresh
+                self._rebuild()
+            else:
+                for teacher_id in removed:
+                    self._remove(teacher_id)
+                for teacher in changed:
+                    self._upsert(teacher)
+            self.etag = etag
+            self.synced_at = self.clock()
+            delta = {'added': added, 'updated': len(changed) - added, 'removed': len(removed)}
+            self.stats['syncs'] += 1
+            for key, count in delta.items():
+                self.stats[key] += count
+        return delta
+
+    def ensure_fresh(self) -> None:
+        """
+        Синхронизировать копию, если она старше max_age или еще не загружена.
+        """
+        if not self._stale():
+            return
+        # Одновременные запросы ждут одну синхронизацию, а не отправляют свою
+        with self._sync_lock:
+            if self._stale():
+                self.sync()
+
+    def _stale(self) -> bool:
+        """
+        Проверить, нужна ли синхронизация.
+
+        Returns:
+            bool: True если копия не загружена или старше max_age
+        """
+        synced_at = self.synced_at
+        return synced_at is None or self.clock() - synced_at >= self.max_age
+
+    def upsert(self, teacher: Dict[str, Any]) -> None:
+        """
+        Добавить или заменить учителя после изменяющего запроса клиента.
+
+        Args:
+            teacher (Dict[str, Any]): Данные учителя с teacher_id
+        """
+        with self._lock:
+            self._upsert(dict(teacher))
+
+    def remove(self, teacher_id: int) -> None:
+        """
+        Удалить учителя после изменяющего запроса клиента.
+
+        Args:
+            teacher_id (int): ID учителя
+        """
+        with self._lock:
+            self._remove(teacher_id)
+
+    def get(self, teacher_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Получить учителя по ID.
+
+        Args:
+            teacher_id (int): ID учителя
+
+        Returns:
+            Optional[Dict[str, Any]]: Копия данных учителя или None
+        """
+        self.ensure_fresh()
+        with self._lock:
+            teacher = self._teachers.get(teacher_id)
+            return dict(teacher) if teacher is not None else None
+
+    def by_group(self, group_id: int) -> List[Dict[str, Any]]:
+        """
+        Получить учителей группы.
+
+        Args:
+            group_id (int): ID группы
+
+        Returns:
+            List[Dict[str, Any]]: Копии данных учителей в порядке teacher_id
+        """
+        self.ensure_fresh()
+        with self._lock:
+            return self._copies(self._by_group.get(group_id, ()))
+
+    def by_email(self, email: str) -> List[Dict[str, Any]]:
+        """
+        Получить учителей с email.
+
+        Args:
+            email (str): Email
+
+        Returns:
+            List[Dict[str, Any]]: Копии данных учителей в порядке teacher_id
+        """
+        self.ensure_fresh()
+        with self._lock:
+            return self._copies(self._by_email.get(email, ()))
+
+    def by_email_prefix(self, prefix: str) -> List[Dict[str, Any]]:
+        """
+        Получить учителей, email которых начинается с prefix, без учета регистра.
+
+        Args:
+            prefix (str): Начало email
+
+        Returns:
+            List[Dict[str, Any]]: Копии данных учителей в порядке email
+        """
+        self.ensure_fresh()
+        prefix = prefix.lower()
+        with self._lock:
+            start = bisect.bisect_left(self._emails, (prefix,))
+            end = bisect.bisect_left(self._emails, (prefix + '\uffff',))
+            return [dict(self._teachers[teacher_id]) for _, teacher_id in self._emails[start:end]]
+
+    def __len__(self) -> int:
+        return len(self._teachers)
+
+    def _copies(self, teacher_ids: Any) -> List[Dict[str, Any]]:
+        """
+        Скопировать учителей по набору ID.
+
+        Args:
+            teacher_ids (Any): ID учителей
+
+        Returns:
+            List[Dict[str, Any]]: Копии данных учителей в порядке teacher_id
+        """
+        return [dict(self._teachers[teacher_id]) for teacher_id in sorted(teacher_ids)]
+
+    def _rebuild(self) -> None:
+        """
+        Построить индексы заново по всем учителям.
+        """
+        self._by_group = {}
+        self._by_email = {}
+        for teacher_id, teacher in self._teachers.items():
+            self._by_group.setdefault(teacher.get('group_id'), set()).add(teacher_id)
+            self._by_email.setdefault(teacher.get('email'), set()).add(teacher_id)
+        self._emails = sorted(
+            (str(teacher.get('email', '')).lower(), teacher_id)
+            for teacher_id, teacher in self._teachers.items()
+        )
+
+    def _upsert(self, teacher: Dict[str, Any]) -> None:
+        """
+        Добавить или заменить учителя в данных и индексах.
+
+        Args:
+            teacher (Dict[str, Any]): Данные учителя с teacher_id
+        """
+        teacher_id = teacher['teacher_id']
+        self._remove(teacher_id)
+        self._teachers[teacher_id] = teacher
+        self._by_group.setdefault(teacher.get('group_id'), set()).add(teacher_id)
+        self._by_email.setdefault(teacher.get('email'), set()).add(teacher_id)
+        bisect.insort(self._emails, (str(teacher.get('email', '')).lower(), teacher_id))
+
+    def _remove(self, teacher_id: int) -> None:
+        """
+        Удалить учителя из данных и индексов, если он есть.
+
+        Args:
+            teacher_id (int): ID учителя
+        """
+        teacher = self._teachers.pop(teacher_id, None)
+        if teacher is None:
+            return
+        for index, key in ((self._by_group, teacher.get('group_id')),
+                           (self._by_email, teacher.get('email'))):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(teacher_id)
+                if not ids:
+                    del index[key]
+        entry = (str(teacher.get('email', '')).lower(), teacher_id)
+        position = bisect.bisect_left(self._emails, entry)
+        if position < len(self._emails) and self._emails[position] == entry:
+            del self._emails[position]
@@ -37,3 +37,6 @@ DB_PORT = int(get_env_var("DB_PORT", "5432"))
 DB_NAME = get_env_var("DB_NAME", "postgres")
 DB_USER = get_env_var("DB_USER", "postgres")
 DB_PASSWORD = get_env_var("DB_PASSWORD", "")
+
+# Драйвер PostgreSQL: psycopg2, psycopg (v3) или asyncpg
+DB_DRIVER = get_env_var("DB_DRIVER", "psycopg2")
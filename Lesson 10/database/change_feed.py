@@ -0,0 +1,218 @@
+"""Лента изменений таблицы учителей: LISTEN/NOTIFY в PostgreSQL и локальные хуки."""
+
+import abc
+import json
+import queue
+import select
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from sqlalchemy.engine import Engine
+
+
+# Канал NOTIFY, в который триггер публикует изменения таблицы teacher
+CHANGE_CHANNEL = 'teacher_changes'
+
+# Имя строкового триггера ленты (на секциях — клоны с тем же именем)
+CHANGE_TRIGGER = 'teacher_change_feed'
+
+# Функция и триггер, публикующие изменения строк teacher через pg_notify
+INSTALL_TRIGGER_SQL = (
+    "CREATE OR REPLACE FUNCTION teacher_notify_change() RETURNS trigger AS $$ "
+    "DECLARE row_data RECORD; "
+    "BEGIN "
+    "IF TG_OP = 'DELETE' THEN row_data := OLD; ELSE row_data := NEW; END IF; "
+    f"PERFORM pg_notify('{CHANGE_CHANNEL}', json_build_object("
+    "'op', TG_OP, 'teacher_id', row_data.teacher_id, "
+    "'email', row_data.email, 'group_id', row_data.group_id)::text); "
+    "RETURN NULL; "
+    "END; $$ LANGUAGE plpgsql",
+    f"DROP TRIGGER IF EXISTS {CHANGE_TRIGGER} ON teacher",
+    f"CREATE TRIGGER {CHANGE_TRIGGER} AFTER INSERT OR UPDATE OR DELETE ON teacher "
+    "FOR EACH ROW EXECUTE FUNCTION teacher_notify_change()",
+)
+
+# События DELETE для всех строк таблицы {table} в формате триггера ленты.
+# TRUNCATE не вызывает строковые триггеры, поэтому перед ним события
+# публикуются этим запросом в той же транзакции
+NOTIFY_DELETES_SQL = (
+    f"SELECT pg_notify('{CHANGE_CHANNEL}', json_build_object("
+    "'op', 'DELETE', 'teacher_id', teacher_id, "
+    "'email', email, 'group_id', group_id)::text) FROM {table}"
+)
+
+_subscribers: Dict[str, List["queue.Queue[Dict[str, Any]]"]] = {}
+_subscribers_lock = threading.Lock()
+
+
+def has_subscribers(key: str) -> bool:
+    """
+    Проверить есть ли локальные подписчики на изменения базы.
+
+    Args:
+        key (str): Ключ базы данных (URL движка)
+
+    Returns:
+        bool: True если есть хотя бы одна открытая лента
+    """
+    with _subscribers_lock:
+        return bool(_subscribers.get(key))
+
+
+def publish(key: str, event: Dict[str, Any]) -> None:
+    """
+    Опубликовать событие изменения всем локальным подписчикам базы.
+
+    Args:
+        key (str): Ключ базы данных (URL движка)
+        event (Dict[str, Any]): Событие с ключами op, teacher_id, email, group_id
+    """
+    with _subscribers_lock:
+        targets = list(_subscribers.get(key, []))
+    for target in targets:
+        target.put(event)
+
+
+class ChangeFeed(abc.ABC):
+    """
+    Базовый класс ленты изменений таблицы учителей.
+
+    Лента возвращает события вида
+    {'op': 'INSERT' | 'UPDATE' | 'DELETE', 'teacher_id': ..., 'email': ..., 'group_id': ...}.
+    """
+
+    @abc.abstractmethod
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Дождаться следующего события.
+
+        Args:
+            timeout (Optional[float]): Максимальное время ожидания в секундах,
+                None — ждать бесконечно
+
+        Returns:
+            Optional[Dict[str, Any]]: Событие или None по истечении таймаута
+        """
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """
+        Закрыть ленту и освободить ресурсы.
+        """
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        Итерироваться по событиям, блокируясь до появления следующего.
+
+        Yields:
+            Dict[str, Any]: Событие изменения
+        """
+        while True:
+            event = self.get()
+            if event is None:
+                return
+            yield event
+
+    def __enter__(self) -> "ChangeFeed":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class LocalChangeFeed(ChangeFeed):
+    """
+    Лента изменений на основе внутрипроцессных хуков TeacherTable.
+
+    Используется для SQLite и других БД без LISTEN/NOTIFY: события публикуют
+    методы записи TeacherTable после фиксации транзакции.
+    """
+
+    def __init__(self, key: str) -> None:
+        """
+        Подписаться на изменения базы.
+
+        Args:
+            key (str): Ключ базы данных (URL движка)
+        """
+        self.key = key
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        with _subscribers_lock:
+            _subscribers.setdefault(key, []).append(self._queue)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        with _subscribers_lock:
+            targets = _subscribers.get(self.key, [])
+            if self._queue in targets:
+                targets.remove(self._queue)
+            if not targets:
+                _subscribers.pop(self.key, None)
+
+
+class PostgresChangeFeed(ChangeFeed):
+    """
+    Лента изменений на основе LISTEN/NOTIFY в PostgreSQL.
+
+    Держит выделенное соединение в режиме autocommit и ждет уведомлений
+    через select() по сокету, не выполняя запросов к таблице.
+    Поддерживаются драйверы psycopg2 и psycopg 3.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        """
+        Открыть выделенное соединение и подписаться на канал изменений.
+
+        Args:
+            engine (Engine): Движок SQLAlchemy
+        """
+        # Соединение отсоединяется от пула: после LISTEN и autocommit
+        # его нельзя возвращать для обычных запросов
+        self._raw = engine.raw_connection()
+        self._raw.detach()
+        self._conn = self._raw.driver_connection
+        self._conn.autocommit = True
+        self._pending: Deque[str] = deque()
+        if hasattr(self._conn, 'add_notify_handler'):
+            # psycopg 3 доставляет уведомления в обработчики во время запросов
+            self._conn.add_notify_handler(lambda notify: self._pending.append(notify.payload))
+        cursor = self._conn.cursor()
+        cursor.execute(f"LISTEN {CHANGE_CHANNEL}")
+        cursor.close()
+
+    def _drain(self) -> None:
+        """
+        Забрать уведомления, уже полученные соединением.
+        """
+        if hasattr(self._conn, 'add_notify_handler'):
+            self._conn.execute("SELECT 1")
+        else:
+            self._conn.poll()
+            while self._conn.notifies:
+                self._pending.append(self._conn.notifies.pop(0).payload)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._conn], [], [], remaining)
+            if ready:
+                self._drain()
+            elif deadline is not None:
+                return None
+        return json.loads(self._pending.popleft())
+
+    def close(self) -> None:
+        try:
+            cursor = self._conn.cursor()
+            cursor.execute(f"UNLISTEN {CHANGE_CHANNEL}")
+            cursor.close()
+        finally:
+            self._raw.close()
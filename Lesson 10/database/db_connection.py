@@ -2,23 +2,21 @@
 
 from typing import Optional
 from .teacher_table import TeacherTable
-from config.db_config import DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
 
 
-def get_db_connection(connection_string: Optional[str] = None) -> TeacherTable:
+def get_db_connection(connection_string: Optional[str] = None,
+                      driver: Optional[str] = None) -> TeacherTable:
     """
     Создать подключение к базе данных.
     
     Args:
         connection_string (Optional[str]): Строка подключения к БД.
             Если не указана, используется конфигурация по умолчанию.
+        driver (Optional[str]): Драйвер PostgreSQL (psycopg2, psycopg; для asyncpg
+            используется его синхронная замена psycopg2).
+            Если не указан, берется DB_DRIVER из конфигурации.
             
     Returns:
         TeacherTable: Экземпляр класса для работы с таблицей учителей
     """
-    if not connection_string:
-        connection_string = (
-            f"postgresql://{DB_USER}:{DB_PASSWORD}@"
-            f"{DB_HOST}:{DB_PORT}/{DB_NAME}"
-        )
-    return TeacherTable(connection_string)
+    return TeacherTable(connection_string, driver)
@@ -0,0 +1,139 @@
+"""Поддерживаемые драйверы PostgreSQL и фабрики движков SQLAlchemy."""
+
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+
+from config.db_config import DB_DRIVER, DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
+
+
+# Описание драйверов: диалект SQLAlchemy, асинхронность и параметры connect();
+# у асинхронного драйвера sync_driver — драйвер синхронных вызовов (TeacherTable)
+SUPPORTED_DRIVERS: Dict[str, Dict[str, Any]] = {
+    "psycopg2": {
+        "dialect": "postgresql+psycopg2",
+        "is_async": False,
+        "connect_args": {},
+    },
+    # psycopg 3: prepare_threshold=0 включает серверные prepared statements
+    # с первого выполнения, executemany работает в pipeline режиме
+    "psycopg": {
+        "dialect": "postgresql+psycopg",
+        "is_async": False,
+        "connect_args": {"prepare_threshold": 0},
+    },
+    "asyncpg": {
+        "dialect": "postgresql+asyncpg",
+        "is_async": True,
+        "connect_args": {},
+        "sync_driver": "psycopg2",
+    },
+}
+
+
+def get_driver(driver: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Получить описание драйвера по имени.
+
+    Args:
+        driver (Optional[str]): Имя драйвера. Если не указано, берется DB_DRIVER
+
+    Returns:
+        Dict[str, Any]: Описание драйвера из SUPPORTED_DRIVERS
+
+    Raises:
+        ValueError: если драйвер не поддерживается
+    """
+    name = (driver or DB_DRIVER).lower()
+    if name not in SUPPORTED_DRIVERS:
+        raise ValueError(
+            f"Неподдерживаемый драйвер БД: {name}. "
+            f"Доступны: {', '.join(SUPPORTED_DRIVERS)}"
+        )
+    return SUPPORTED_DRIVERS[name]
+
+
+def build_connection_string(driver: Optional[str] = None) -> str:
+    """
+    Построить строку подключения из конфигурации для указанного драйвера.
+
+    Args:
+        driver (Optional[str]): Имя драйвера. Если не указано, берется DB_DRIVER
+
+    Returns:
+        str: Строка подключения SQLAlchemy
+    """
+    dialect = get_driver(driver)["dialect"]
+    return (
+        f"{dialect}://{DB_USER}:{DB_PASSWORD}@"
+        f"{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    )
+
+
+def _engine_kwargs(connection_string: str, driver: Optional[str]) -> Dict[str, Any]:
+    """
+    Подобрать параметры движка для строки подключения.
+
+    connect_args драйвера применяются, только если диалект строки
+    подключения совпадает с диалектом драйвера.
+
+    Args:
+        connection_string (str): Строка подключения SQLAlchemy
+        driver (Optional[str]): Имя драйвера
+
+    Returns:
+        Dict[str, Any]: Именованные аргументы для create_engine
+    """
+    spec = get_driver(driver)
+    if make_url(connection_string).drivername == spec["dialect"] and spec["connect_args"]:
+        return {"connect_args": dict(spec["connect_args"])}
+    return {}
+
+
+def create_db_engine(connection_string: Optional[str] = None,
+                     driver: Optional[str] = None) -> Engine:
+    """
+    Создать синхронный движок SQLAlchemy для выбранного драйвера.
+
+    Для асинхронного драйвера (DB_DRIVER=asyncpg) синхронный движок
+    создается на его sync_driver, в том числе если диалект asyncpg указан
+    в строке подключения: асинхронный код использует create_async_db_engine.
+
+    Args:
+        connection_string (Optional[str]): Строка подключения к БД.
+            Если не указана, строится из конфигурации.
+        driver (Optional[str]): Имя драйвера. Если не указано, берется DB_DRIVER
+
+    Returns:
+        Engine: Движок SQLAlchemy
+    """
+    spec = get_driver(driver)
+    if spec["is_async"]:
+        driver = spec["sync_driver"]
+        if connection_string and make_url(connection_string).drivername == spec["dialect"]:
+            connection_string = make_url(connection_string).set(
+                drivername=get_driver(driver)["dialect"]
+            ).render_as_string(hide_password=False)
+    if not connection_string:
+        connection_string = build_connection_string(driver)
+    return create_engine(connection_string, **_engine_kwargs(connection_string, driver))
+
+
+def create_async_db_engine(connection_string: Optional[str] = None,
+                           driver: str = "asyncpg") -> Any:
+    """
+    Создать асинхронный движок SQLAlchemy (asyncpg или psycopg).
+
+    Args:
+        connection_string (Optional[str]): Строка подключения к БД.
+            Если не указана, строится из конфигурации.
+        driver (str): Имя драйвера
+
+    Returns:
+        AsyncEngine: Асинхронный движок SQLAlchemy
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    if not connection_string:
+        connection_string = build_connection_string(driver)
+    return create_async_engine(connection_string, **_engine_kwargs(connection_string, driver))
@@ -0,0 +1,209 @@
+"""Многопроцессная загрузка и проверка учителей с шардированием по teacher_id."""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from .teacher_table import TeacherTable
+
+
+def shard_by_id_range(teachers: Iterable[Dict[str, Any]],
+                      shards: int) -> List[List[Dict[str, Any]]]:
+    """
+    Разбить учителей на непересекающиеся диапазоны teacher_id.
+
+    Args:
+        teachers (Iterable[Dict[str, Any]]): Данные учителей
+        shards (int): Количество шардов
+
+    Returns:
+        List[List[Dict[str, Any]]]: Непустые шарды, отсортированные по teacher_id
+    """
+    if shards <= 0:
+        raise ValueError("Количество шардов должно быть положительным числом")
+    rows = sorted(teachers, key=lambda teacher: teacher['teacher_id'])
+    size = -(-len(rows) // shards) if rows else 0
+    return [rows[i:i + size] for i in range(0, len(rows), size)] if size else []
+
+
+def _ingest_shard(connection_string: Optional[str], driver: Optional[str],
+                  rows: List[Dict[str, Any]], batch_size: int) -> Dict[str, Any]:
+    """
+    Загрузить шард в БД в отдельном процессе со своим движком.
+
+    Некорректные строки пропускаются с ошибкой. Если пачка не вставилась
+    целиком, ее строки вставляются по одной, чтобы локализовать ошибки.
+
+    Args:
+        connection_string (Optional[str]): Строка подключения к БД
+        driver (Optional[str]): Драйвер PostgreSQL
+        rows (List[Dict[str, Any]]): Строки шарда
+        batch_size (int): Размер пачки вставки
+
+    Returns:
+        Dict[str, Any]: Счетчики processed/inserted и список ошибок
+    """
+    table = TeacherTable(connection_string, driver)
+    errors: List[Dict[str, Any]] = []
+    valid = []
+    for row in rows:
+        try:
+            if not row['teacher_id'] or row['teacher_id'] <= 0:
+                raise ValueError("teacher_id должен быть положительным числом")
+            TeacherTable.validate_email(row['email'])
+            TeacherTable.validate_group_id(row['group_id'])
+            valid.append(row)
+        except Exception as e:
+            errors.append({'teacher_id': row.get('teacher_id'), 'error': str(e)})
+
+    inserted = 0
+    for start in range(0, len(valid), batch_size):
+        batch = valid[start:start + batch_size]
+        try:
+            inserted += table.add_teachers(batch)
+        except Exception:
+            for row in batch:
+                try:
+                    table.add_teacher(row['teacher_id'], row['email'], row['group_id'])
+                    inserted += 1
+                except Exception as e:
+                    errors.append({'teacher_id': row['teacher_id'], 'error': str(e)})
+    return {'processed': len(rows), 'inserted': inserted, 'errors': errors}
+
+
+def _verify_shard(connection_string: Optional[str], driver: Optional[str],
+                  rows: List[Dict[str, Any]], after_id: Optional[int],
+                  max_id: Optional[int]) -> Dict[str, Any]:
+    """
+    Сверить шард с содержимым БД в отдельном процессе со своим движком.
+
+    Из БД читается диапазон (after_id, max_id], а не только от первого
+    до последнего ожидаемого ID: лишние строки между шардами и за их
+    пределами тоже попадают в сверку.
+
+    Args:
+        connection_string (Optional[str]): Строка подключения к БД
+        driver (Optional[str]): Драйвер PostgreSQL
+        rows (List[Dict[str, Any]]): Ожидаемые строки шарда, отсортированные по ID
+        after_id (Optional[int]): Последний ID предыдущего шарда; None — без нижней границы
+        max_id (Optional[int]): Последний ID шарда; None — без верхней границы
+
+    Returns:
+        Dict[str, Any]: Счетчики processed/matched и список ошибок
+    """
+    table = TeacherTable(connection_string, driver)
+    actual = {
+        teacher_id: (email, group_id)
+        for teacher_id, email, group_id in table.get_teachers_in_range(
+            None if after_id is None else after_id + 1, max_id
+        )
+    }
+    errors: List[Dict[str, Any]] = []
+    matched = 0
+    for row in rows:
+        found = actual.pop(row['teacher_id'], None)
+        if found is None:
+            errors.append({'teacher_id': row['teacher_id'], 'error': "Учитель отсутствует в БД"})
+        elif found != (row['email'], row['group_id']):
+            errors.append({
+                'teacher_id': row['teacher_id'],
+                'error': f"Данные не совпадают: ожидалось {(row['email'], row['group_id'])}, в БД {found}"
+            })
+        else:
+            matched += 1
+    for teacher_id in actual:
+        errors.append({'teacher_id': teacher_id, 'error': "Лишний учитель в БД"})
+    return {'processed': len(rows), 'matched': matched, 'errors': errors}
+
+
+def _run_sharded(worker: Any, teachers: Iterable[Dict[str, Any]], workers: Optional[int],
+                 connection_string: Optional[str], driver: Optional[str],
+                 *extra: Any, bounded: bool = False) -> Dict[str, Any]:
+    """
+    Запустить обработку шардов в пуле процессов и агрегировать результаты.
+
+    Args:
+        worker (Any): Функция обработки шарда
+        teachers (Iterable[Dict[str, Any]]): Данные учителей
+        workers (Optional[int]): Количество процессов, по умолчанию число ядер
+        connection_string (Optional[str]): Строка подключения к БД
+        driver (Optional[str]): Драйвер PostgreSQL
+        *extra (Any): Дополнительные аргументы функции обработки
+        bounded (bool): Передать функции обработки границы шарда (after_id, max_id),
+            покрывающие все ID: от последнего ID предыдущего шарда до своего
+            последнего, у первого и последнего шарда — без внешней границы
+
+    Returns:
+        Dict[str, Any]: Суммарные счетчики, ошибки, время и строк/сек
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = shard_by_id_range(teachers, workers)
+    started = time.perf_counter()
+    totals: Dict[str, Any] = {'shards': len(shards), 'errors': []}
+    if shards:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+            futures = []
+            for index, shard in enumerate(shards):
+                bounds: tuple = ()
+                if bounded:
+                    bounds = (shards[index - 1][-1]['teacher_id'] if index else None,
+                              shard[-1]['teacher_id'] if index < len(shards) - 1 else None)
+                futures.append(
+                    pool.submit(worker, connection_string, driver, shard, *bounds, *extra)
+                )
+            for future in futures:
+                for key, value in future.result().items():
+                    if key == 'errors':
+                        totals['errors'].extend(value)
+                    else:
+                        totals[key] = totals.get(key, 0) + value
+    elapsed = time.perf_counter() - started
+    totals['elapsed'] = elapsed
+    totals['rows_per_sec'] = totals.get('processed', 0) / elapsed if elapsed else 0.0
+    return totals
+
+
+def parallel_ingest(teachers: Iterable[Dict[str, Any]], workers: Optional[int] = None,
+                    connection_string: Optional[str] = None, driver: Optional[str] = None,
+                    batch_size: int = 1000) -> Dict[str, Any]:
+    """
+    Загрузить учителей в БД параллельно в нескольких процессах.
+
+    Данные делятся на диапазоны teacher_id, каждый процесс валидирует
+    и вставляет свой диапазон через собственный движок.
+
+    Args:
+        teachers (Iterable[Dict[str, Any]]): Данные учителей
+        workers (Optional[int]): Количество процессов, по умолчанию число ядер
+        connection_string (Optional[str]): Строка подключения к БД
+        driver (Optional[str]): Драйвер PostgreSQL
+        batch_size (int): Размер пачки вставки
+
+    Returns:
+        Dict[str, Any]: processed, inserted, errors, shards, elapsed, rows_per_sec
+    """
+    return _run_sharded(_ingest_shard, teachers, workers, connection_string, driver, batch_size)
+
+
+def parallel_verify(teachers: Iterable[Dict[str, Any]], workers: Optional[int] = None,
+                    connection_string: Optional[str] = None,
+                    driver: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Сверить учителей с БД параллельно в нескольких процессах.
+
+    Каждый процесс читает из БД только свой диапазон teacher_id и сообщает
+    об отсутствующих, несовпадающих и лишних строках в этом диапазоне.
+    Диапазоны шардов примыкают друг к другу, а первый и последний открыты,
+    поэтому лишние строки в БД находятся при любых ID.
+
+    Args:
+        teachers (Iterable[Dict[str, Any]]): Ожидаемые данные учителей
+        workers (Optional[int]): Количество процессов, по умолчанию число ядер
+        connection_string (Optional[str]): Строка подключения к БД
+        driver (Optional[str]): Драйвер PostgreSQL
+
+    Returns:
+        Dict[str, Any]: processed, matched, errors, shards, elapsed, rows_per_sec
+    """
+    return _run_sharded(_verify_shard, teachers, workers, connection_string, driver, bounded=True)
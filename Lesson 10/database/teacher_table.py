@@ -1,12 +1,52 @@
 """Класс для работы с таблицей учителей в базе данных."""
 
 import re
-from typing import List, Tuple, Optional
-from sqlalchemy import create_engine, text
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Optional
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
-import allure
 
-from config.db_config import DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
+from utils.tracing import traced
+
+from . import change_feed
+from .change_feed import (
+    CHANGE_TRIGGER, INSTALL_TRIGGER_SQL, NOTIFY_DELETES_SQL,
+    ChangeFeed, LocalChangeFeed, PostgresChangeFeed
+)
+from .drivers import create_db_engine
+
+
+# Стратегии партиционирования таблицы teacher по group_id
+PARTITION_STRATEGIES = ('hash', 'list')
+
+# Имя секции по умолчанию для LIST партиционирования
+DEFAULT_PARTITION = 'teacher_default'
+
+
+def _parse_partition_bound(bound: str) -> Dict[str, Any]:
+    """
+    Разобрать границу секции из pg_get_expr(relpartbound).
+    
+    Args:
+        bound (str): Граница секции, например
+            "FOR VALUES WITH (modulus 8, remainder 3)" или "FOR VALUES IN (100, 101)"
+            
+    Returns:
+        Dict[str, Any]: Тип границы и ее параметры
+        
+    Raises:
+        ValueError: если граница не распознана
+    """
+    if bound.strip().upper() == 'DEFAULT':
+        return {'kind': 'default'}
+    match = re.search(r'modulus\s+(\d+),\s*remainder\s+(\d+)', bound, re.IGNORECASE)
+    if match:
+        return {'kind': 'hash', 'modulus': int(match.group(1)), 'remainder': int(match.group(2))}
+    match = re.search(r'IN\s*\((.*)\)', bound, re.IGNORECASE)
+    if match:
+        values = [int(value.strip(" '")) for value in match.group(1).split(',')]
+        return {'kind': 'list', 'values': values}
+    raise ValueError(f"Неподдерживаемая граница секции: {bound}")
 
 
 class TeacherTable:
@@ -17,25 +57,26 @@ class TeacherTable:
     а также методы валидации данных.
     """
     
-    def __init__(self, connection_string: Optional[str] = None) -> None:
+    def __init__(self, connection_string: Optional[str] = None,
+                 driver: Optional[str] = None) -> None:
         """
         Инициализация подключения к базе данных.
         
         Args:
             connection_string (Optional[str]): Строка подключения к БД.
                 Если не указана, используется конфигурация по умолчанию.
+            driver (Optional[str]): Драйвер PostgreSQL (psycopg2, psycopg).
+                Если не указан, берется DB_DRIVER из конфигурации.
         """
-        if not connection_string:
-            connection_string = (
-                f"postgresql://{DB_USER}:{DB_PASSWORD}@"
-                f"{DB_HOST}:{DB_PORT}/{DB_NAME}"
-            )
-        self.__engine = create_engine(connection_string)
+        self.__engine = create_db_engine(connection_string, driver)
         Session = sessionmaker(bind=self.__engine)
         self.__session = Session()
+        self.__partitions: Optional[Dict[str, Any]] = None
+        self.__hash_routes: Dict[int, str] = {}
+        self.__feed_key = str(self.__engine.url)
 
     @staticmethod
-    @allure.step("Валидация email: {email}")
+    @traced("Валидация email: {email}")
     def validate_email(email: str) -> None:
         """
         Проверить корректность email адреса.
@@ -57,7 +98,7 @@ class TeacherTable:
             raise ValueError("Некорректный формат email")
 
     @staticmethod
-    @allure.step("Валидация ID группы: {group_id}")
+    @traced("Валидация ID группы: {group_id}")
     def validate_group_id(group_id: int) -> None:
         """
         Проверить корректность ID группы.
@@ -71,7 +112,7 @@ class TeacherTable:
         if not isinstance(group_id, int) or group_id <= 0:
             raise ValueError("group_id должен быть положительным числом")
     
-    @allure.step("Получить всех учителей")
+    @traced("Получить всех учителей")
     def get_teacher(self) -> List[Tuple]:
         """
         Получить список всех учителей из базы данных.
@@ -82,7 +123,61 @@ class TeacherTable:
         result = self.__session.execute(text("SELECT * FROM teacher"))
         return result.fetchall()
     
-    @allure.step("Добавить учителя: ID={teacher_id}, email={email}, group={group_id}")
+    def iter_teachers(self, page_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Итерироваться по всем учителям в порядке teacher_id страницами.
+        
+        Страницы читаются по ключу (teacher_id > последний прочитанный),
+        поэтому в памяти находится не больше одной страницы.
+        
+        Args:
+            page_size (int): Размер страницы
+            
+        Yields:
+            Tuple: Кортеж (teacher_id, email, group_id)
+        """
+        if page_size <= 0:
+            raise ValueError("page_size должен быть положительным числом")
+        query = text(
+            "SELECT teacher_id, email, group_id FROM teacher "
+            "WHERE teacher_id > :last_id ORDER BY teacher_id LIMIT :page_size"
+        )
+        last_id = 0
+        while True:
+            rows = self.__session.execute(
+                query, {'last_id': last_id, 'page_size': page_size}
+            ).fetchall()
+            self.__session.commit()
+            yield from rows
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
+    
+    @traced("Получить учителей в диапазоне ID: {min_id}..{max_id}")
+    def get_teachers_in_range(self, min_id: Optional[int], max_id: Optional[int]) -> List[Tuple]:
+        """
+        Получить учителей с teacher_id в диапазоне [min_id, max_id].
+        
+        Args:
+            min_id (Optional[int]): Нижняя граница диапазона включительно; None — без границы
+            max_id (Optional[int]): Верхняя граница диапазона включительно; None — без границы
+            
+        Returns:
+            List[Tuple]: Список кортежей с данными учителей, отсортированный по ID
+        """
+        conditions = []
+        if min_id is not None:
+            conditions.append("teacher_id >= :min_id")
+        if max_id is not None:
+            conditions.append("teacher_id <= :max_id")
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        result = self.__session.execute(
+            text(f"SELECT teacher_id, email, group_id FROM teacher {where}ORDER BY teacher_id"),
+            {'min_id': min_id, 'max_id': max_id}
+        )
+        return result.fetchall()
+    
+    @traced("Добавить учителя: ID={teacher_id}, email={email}, group={group_id}")
     def add_teacher(self, teacher_id: int, email: str, group_id: int) -> None:
         """
         Добавить нового учителя в базу данных.
@@ -118,8 +213,62 @@ class TeacherTable:
         except Exception:
             self.__session.rollback()
             raise
+        self._publish_changes('INSERT', [(teacher_id, email, group_id)])
+
+    @traced("Добавить учителей пачкой")
+    def add_teachers(self, teachers: Iterable[Dict[str, Any]]) -> int:
+        """
+        Добавить несколько учителей одной транзакцией.
+        
+        Строки передаются драйверу через executemany: psycopg2 и psycopg 3
+        отправляют их пачкой (psycopg 3 — в pipeline режиме). Если таблица
+        партиционирована, строки пишутся сразу в секции своих групп.
+        
+        Args:
+            teachers (Iterable[Dict[str, Any]]): Данные учителей с ключами
+                teacher_id, email и group_id
+                
+        Returns:
+            int: Количество добавленных учителей
+            
+        Raises:
+            ValueError: если данные какого-либо учителя некорректны
+        """
+        rows = []
+        for teacher in teachers:
+            if not teacher['teacher_id'] or teacher['teacher_id'] <= 0:
+                raise ValueError("teacher_id должен быть положительным числом")
+            self.validate_email(teacher['email'])
+            self.validate_group_id(teacher['group_id'])
+            rows.append({
+                'teacher_id': teacher['teacher_id'],
+                'email': teacher['email'],
+                'group_id': teacher['group_id']
+            })
+        if not rows:
+            return 0
+        
+        # Строки группируются по секциям и вставляются в них напрямую
+        by_table: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_table.setdefault(self._partition_for_group(row['group_id']), []).append(row)
+        try:
+            for table, table_rows in by_table.items():
+                query = text(
+                    f"INSERT INTO {self._quote(table)}(teacher_id, email, group_id) "
+                    "VALUES (:teacher_id, :email, :group_id)"
+                )
+                self.__session.execute(query, table_rows)
+            self.__session.commit()
+        except Exception:
+            self.__session.rollback()
+            raise
+        self._publish_changes(
+            'INSERT', [(row['teacher_id'], row['email'], row['group_id']) for row in rows]
+        )
+        return len(rows)
 
-    @allure.step("Обновить email учителя: ID={teacher_id}, new_email={new_email}")
+    @traced("Обновить email учителя: ID={teacher_id}, new_email={new_email}")
     def update_teacher(self, teacher_id: int, new_email: str) -> None:
         """
         Обновить email учителя по ID.
@@ -154,8 +303,11 @@ class TeacherTable:
         except Exception:
             self.__session.rollback()
             raise
+        self._publish_changes(
+            'UPDATE', self._rows_for_local_feed("teacher_id = :teacher_id", {'teacher_id': teacher_id})
+        )
 
-    @allure.step("Удалить учителя: ID={teacher_id}")
+    @traced("Удалить учителя: ID={teacher_id}")
     def delete(self, teacher_id: int) -> None:
         """
         Удалить учителя по ID.
@@ -169,6 +321,7 @@ class TeacherTable:
         if not teacher_id or teacher_id <= 0:
             raise ValueError("teacher_id должен быть положительным числом")
             
+        deleted = self._rows_for_local_feed("teacher_id = :teacher_id", {'teacher_id': teacher_id})
         query = text("DELETE FROM teacher WHERE teacher_id = :teacher_id")
         try:
             result = self.__session.execute(query, {'teacher_id': teacher_id})
@@ -178,8 +331,9 @@ class TeacherTable:
         except Exception:
             self.__session.rollback()
             raise
+        self._publish_changes('DELETE', deleted)
     
-    @allure.step("Проверить существование учителя: ID={teacher_id}")
+    @traced("Проверить существование учителя: ID={teacher_id}")
     def teacher_exists(self, teacher_id: int) -> bool:
         """
         Проверить существование учителя по ID.
@@ -195,6 +349,419 @@ class TeacherTable:
         count = result.scalar()
         return count > 0
     
+    @traced("Создать партиционированную таблицу: strategy={strategy}")
+    def create_partitioned_table(self, strategy: str = 'hash', partitions: int = 8,
+                                 groups: Optional[Iterable[int]] = None,
+                                 migrate_existing: bool = True) -> None:
+        """
+        Создать таблицу teacher, партиционированную по group_id (только PostgreSQL).
+        
+        Для HASH создается partitions секций teacher_p0..teacher_pN-1.
+        Для LIST создается секция teacher_g<group_id> на каждую группу из groups
+        и секция по умолчанию teacher_default для остальных групп.
+        Первичный ключ становится (teacher_id, group_id): PostgreSQL требует,
+        чтобы ключ партиционирования входил в уникальные ограничения.
+        
+        Args:
+            strategy (str): Стратегия партиционирования: 'hash' или 'list'
+            partitions (int): Количество секций для HASH
+            groups (Optional[Iterable[int]]): Группы с собственными секциями для LIST
+            migrate_existing (bool): Перенести строки из существующей
+                непартиционированной таблицы teacher
+                
+        Raises:
+            ValueError: если параметры некорректны или БД не PostgreSQL
+        """
+        self._require_postgres()
+        if strategy not in PARTITION_STRATEGIES:
+            raise ValueError(f"Неподдерживаемая стратегия: {strategy}")
+        if strategy == 'hash' and (not isinstance(partitions, int) or partitions <= 0):
+            raise ValueError("partitions должен быть положительным числом")
+        
+        statements = []
+        exists = self.__session.execute(text("SELECT to_regclass('teacher')")).scalar()
+        if exists and migrate_existing:
+            statements.append("ALTER TABLE teacher RENAME TO teacher_unpartitioned")
+        statements.append(
+            "CREATE TABLE teacher ("
+            "teacher_id INTEGER NOT NULL, "
+            "email VARCHAR(255) NOT NULL, "
+            "group_id INTEGER NOT NULL, "
+            "PRIMARY KEY (teacher_id, group_id)"
+            f") PARTITION BY {strategy.upper()} (group_id)"
+        )
+        if strategy == 'hash':
+            statements.extend(
+                f"CREATE TABLE teacher_p{remainder} PARTITION OF teacher "
+                f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+                for remainder in range(partitions)
+            )
+        else:
+            for group_id in groups or []:
+                self.validate_group_id(group_id)
+                statements.append(
+                    f"CREATE TABLE teacher_g{group_id} PARTITION OF teacher "
+                    f"FOR VALUES IN ({group_id})"
+                )
+            statements.append(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF teacher DEFAULT")
+        if exists and migrate_existing:
+            statements.append("INSERT INTO teacher SELECT teacher_id, email, group_id "
+                              "FROM teacher_unpartitioned")
+            statements.append("DROP TABLE teacher_unpartitioned")
+        try:
+            for statement in statements:
+                self.__session.execute(text(statement))
+            self.__session.commit()
+        except Exception:
+            self.__session.rollback()
+            raise
+        self.load_partitions()
+    
+    @traced("Добавить секцию для группы: {group_id}")
+    def add_group_partition(self, group_id: int) -> str:
+        """
+        Выделить группе собственную секцию в LIST партиционированной таблице.
+        
+        Строки группы переносятся из секции по умолчанию в новую секцию
+        в той же транзакции, после чего секция подключается к teacher.
+        
+        Args:
+            group_id (int): ID группы
+            
+        Returns:
+            str: Имя секции группы
+            
+        Raises:
+            ValueError: если таблица не партиционирована по LIST
+        """
+        self.validate_group_id(group_id)
+        layout = self.load_partitions()
+        if layout['strategy'] != 'list':
+            raise ValueError("Секции по группам доступны только для LIST партиционирования")
+        if group_id in layout['by_value']:
+            return layout['by_value'][group_id]
+        
+        name = f"teacher_g{group_id}"
+        statements = [f"CREATE TABLE {name} (LIKE teacher INCLUDING ALL)"]
+        if layout['default']:
+            statements.append(
+                f"WITH moved AS (DELETE FROM {self._quote(layout['default'])} "
+                "WHERE group_id = :group_id RETURNING teacher_id, email, group_id) "
+                f"INSERT INTO {name} SELECT teacher_id, email, group_id FROM moved"
+            )
+        statements.append(f"ALTER TABLE teacher ATTACH PARTITION {name} FOR VALUES IN ({group_id})")
+        try:
+            for statement in statements:
+                self.__session.execute(text(statement), {'group_id': group_id})
+            self.__session.commit()
+        except Exception:
+            self.__session.rollback()
+            raise
+        self.load_partitions()
+        return name
+    
+    @traced("Загрузить схему секций таблицы teacher")
+    def load_partitions(self) -> Dict[str, Any]:
+        """
+        Прочитать схему секций таблицы teacher из системного каталога.
+        
+        Результат кешируется и используется для маршрутизации запросов по группам.
+        Для БД, отличной от PostgreSQL, или непартиционированной таблицы
+        стратегия равна None.
+        
+        Returns:
+            Dict[str, Any]: Стратегия, модуль HASH, секции по значениям
+                и остаткам, секция по умолчанию
+        """
+        layout: Dict[str, Any] = {
+            'strategy': None, 'modulus': None,
+            'by_value': {}, 'by_remainder': {}, 'default': None
+        }
+        self.__hash_routes = {}
+        if self.__engine.dialect.name == 'postgresql':
+            strategy = self.__session.execute(text(
+                "SELECT partstrat FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass('teacher')"
+            )).scalar()
+            layout['strategy'] = {'h': 'hash', 'l': 'list'}.get(strategy)
+            if layout['strategy']:
+                rows = self.__session.execute(text(
+                    "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+                    "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = to_regclass('teacher')"
+                )).fetchall()
+                self._apply_partition_bounds(layout, rows)
+            self.__session.commit()
+        self.__partitions = layout
+        return layout
+    
+    @staticmethod
+    def _apply_partition_bounds(layout: Dict[str, Any], rows: Iterable[Tuple[str, str]]) -> None:
+        """
+        Заполнить схему секций по строкам каталога.
+        
+        Args:
+            layout (Dict[str, Any]): Схема секций для заполнения
+            rows (Iterable[Tuple[str, str]]): Пары (имя секции, граница секции)
+        """
+        for name, bound in rows:
+            parsed = _parse_partition_bound(bound)
+            if parsed['kind'] == 'default':
+                layout['default'] = name
+            elif parsed['kind'] == 'hash':
+                layout['modulus'] = parsed['modulus']
+                layout['by_remainder'][parsed['remainder']] = name
+            else:
+                for value in parsed['values']:
+                    layout['by_value'][value] = name
+    
+    def _partition_for_group(self, group_id: int) -> str:
+        """
+        Определить таблицу, в которой хранятся строки группы.
+        
+        Для HASH остаток группы вычисляется сервером через
+        satisfies_hash_partition один раз и кешируется.
+        
+        Args:
+            group_id (int): ID группы
+            
+        Returns:
+            str: Имя секции или 'teacher', если таблица не партиционирована
+        """
+        layout = self.__partitions if self.__partitions is not None else self.load_partitions()
+        if layout['strategy'] == 'list':
+            return layout['by_value'].get(group_id) or layout['default'] or 'teacher'
+        if layout['strategy'] == 'hash':
+            if group_id not in self.__hash_routes:
+                remainder = self.__session.execute(
+                    text(
+                        "SELECT r FROM generate_series(0, :modulus - 1) AS r "
+                        "WHERE satisfies_hash_partition(to_regclass('teacher')::oid, "
+                        ":modulus, r, CAST(:group_id AS integer))"
+                    ),
+                    {'modulus': layout['modulus'], 'group_id': group_id}
+                ).scalar()
+                self.__session.commit()
+                self.__hash_routes[group_id] = layout['by_remainder'].get(remainder, 'teacher')
+            return self.__hash_routes[group_id]
+        return 'teacher'
+    
+    @traced("Получить учителей группы: {group_id}")
+    def get_teachers_by_group(self, group_id: int) -> List[Tuple]:
+        """
+        Получить учителей группы, читая только ее секцию.
+        
+        Args:
+            group_id (int): ID группы
+            
+        Returns:
+            List[Tuple]: Список кортежей с данными учителей группы
+        """
+        self.validate_group_id(group_id)
+        table = self._quote(self._partition_for_group(group_id))
+        result = self.__session.execute(
+            text(f"SELECT teacher_id, email, group_id FROM {table} WHERE group_id = :group_id"),
+            {'group_id': group_id}
+        )
+        return result.fetchall()
+    
+    @traced("Удалить учителей группы: {group_id}")
+    def delete_group(self, group_id: int) -> int:
+        """
+        Удалить всех учителей группы.
+        
+        Если группа занимает собственную LIST секцию, секция очищается
+        через TRUNCATE, иначе выполняется DELETE по секции группы.
+        TRUNCATE не вызывает строковые триггеры, поэтому при установленной
+        ленте изменений события DELETE удаленных строк публикуются через
+        pg_notify в той же транзакции, как их опубликовал бы триггер.
+        
+        Args:
+            group_id (int): ID группы
+            
+        Returns:
+            int: Количество удаленных учителей
+        """
+        self.validate_group_id(group_id)
+        partition = self._partition_for_group(group_id)
+        table = self._quote(partition)
+        deleted = self._rows_for_local_feed("group_id = :group_id", {'group_id': group_id})
+        by_value = self.__partitions['by_value']
+        own_partition = (
+            group_id in by_value
+            and list(by_value.values()).count(partition) == 1
+        )
+        try:
+            if own_partition:
+                count = self.__session.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+                if self._change_trigger_installed(table):
+                    self.__session.execute(text(NOTIFY_DELETES_SQL.format(table=table)))
+                self.__session.execute(text(f"TRUNCATE {table}"))
+            else:
+                result = self.__session.execute(
+                    text(f"DELETE FROM {table} WHERE group_id = :group_id"),
+                    {'group_id': group_id}
+                )
+                count = result.rowcount
+            self.__session.commit()
+        except Exception:
+            self.__session.rollback()
+            raise
+        self._publish_changes('DELETE', deleted)
+        return count
+    
+    @traced("Установить ленту изменений таблицы teacher")
+    def install_change_feed(self) -> None:
+        """
+        Установить триггер, публикующий изменения teacher через pg_notify.
+        
+        Для БД, отличной от PostgreSQL, ничего не делает: события ленты
+        публикуют методы записи TeacherTable внутри процесса.
+        """
+        if self.__engine.dialect.name != 'postgresql':
+            return
+        try:
+            for statement in INSTALL_TRIGGER_SQL:
+                self.__session.execute(text(statement))
+            self.__session.commit()
+        except Exception:
+            self.__session.rollback()
+            raise
+    
+    def change_feed(self) -> ChangeFeed:
+        """
+        Открыть ленту событий INSERT/UPDATE/DELETE таблицы teacher.
+        
+        В PostgreSQL лента слушает канал LISTEN/NOTIFY (нужен триггер из
+        install_change_feed) и видит изменения всех клиентов. Для остальных БД
+        лента получает события от экземпляров TeacherTable этого процесса.
+        
+        Returns:
+            ChangeFeed: Лента изменений; закрывается через close() или with
+        """
+        if self.__engine.dialect.name == 'postgresql':
+            return PostgresChangeFeed(self.__engine)
+        return LocalChangeFeed(self.__feed_key)
+    
+    @traced("Дождаться учителя: ID={teacher_id}, deleted={deleted}")
+    def wait_for_teacher(self, teacher_id: int, timeout: float = 10.0,
+                         deleted: bool = False) -> bool:
+        """
+        Дождаться появления (или удаления) учителя без опроса таблицы.
+        
+        Лента открывается до проверки текущего состояния, поэтому изменение,
+        случившееся между проверкой и ожиданием, не теряется.
+        
+        Args:
+            teacher_id (int): ID учителя
+            timeout (float): Максимальное время ожидания в секундах
+            deleted (bool): Ждать удаления вместо появления
+            
+        Returns:
+            bool: True если ожидаемое состояние достигнуто до таймаута
+        """
+        expected_op = 'DELETE' if deleted else 'INSERT'
+        deadline = time.monotonic() + timeout
+        with self.change_feed() as feed:
+            if self.teacher_exists(teacher_id) != deleted:
+                return True
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                event = feed.get(timeout=remaining)
+                if event is None:
+                    return False
+                if event['teacher_id'] == teacher_id and event['op'] == expected_op:
+                    return True
+    
+    def _rows_for_local_feed(self, condition: str, params: Dict[str, Any]) -> List[Tuple]:
+        """
+        Прочитать строки для событий локальной ленты изменений.
+        
+        Запрос выполняется, только если есть локальные подписчики.
+        
+        Args:
+            condition (str): Условие WHERE
+            params (Dict[str, Any]): Параметры условия
+            
+        Returns:
+            List[Tuple]: Строки (teacher_id, email, group_id)
+        """
+        if not self._local_feed_active():
+            return []
+        result = self.__session.execute(
+            text(f"SELECT teacher_id, email, group_id FROM teacher WHERE {condition}"),
+            params
+        )
+        rows = result.fetchall()
+        self.__session.commit()
+        return rows
+    
+    def _local_feed_active(self) -> bool:
+        """
+        Проверить нужно ли публиковать события во внутрипроцессную ленту.
+        
+        Returns:
+            bool: True если БД не PostgreSQL и есть открытые локальные ленты
+        """
+        return (
+            self.__engine.dialect.name != 'postgresql'
+            and change_feed.has_subscribers(self.__feed_key)
+        )
+    
+    def _publish_changes(self, op: str, rows: Iterable[Tuple]) -> None:
+        """
+        Опубликовать изменения строк во внутрипроцессную ленту.
+        
+        Args:
+            op (str): Операция: INSERT, UPDATE или DELETE
+            rows (Iterable[Tuple]): Строки (teacher_id, email, group_id)
+        """
+        if not self._local_feed_active():
+            return
+        for teacher_id, email, group_id in rows:
+            change_feed.publish(self.__feed_key, {
+                'op': op, 'teacher_id': teacher_id, 'email': email, 'group_id': group_id
+            })
+    
+    def _change_trigger_installed(self, table: str) -> bool:
+        """
+        Проверить установлен ли триггер ленты изменений на таблице (только PostgreSQL).
+        
+        Args:
+            table (str): Экранированное имя таблицы или секции
+            
+        Returns:
+            bool: True если триггер из install_change_feed есть на таблице
+        """
+        return bool(self.__session.execute(
+            text("SELECT 1 FROM pg_trigger WHERE tgname = :name AND tgrelid = to_regclass(:table)"),
+            {'name': CHANGE_TRIGGER, 'table': table}
+        ).scalar())
+    
+    def _quote(self, name: str) -> str:
+        """
+        Экранировать имя таблицы для подстановки в SQL.
+        
+        Args:
+            name (str): Имя таблицы
+            
+        Returns:
+            str: Экранированное имя
+        """
+        return self.__engine.dialect.identifier_preparer.quote(name)
+    
+    def _require_postgres(self) -> None:
+        """
+        Проверить что подключение идет к PostgreSQL.
+        
+        Raises:
+            ValueError: если БД не PostgreSQL
+        """
+        if self.__engine.dialect.name != 'postgresql':
+            raise ValueError("Партиционирование поддерживается только для PostgreSQL")
+    
     def __del__(self) -> None:
         """
         Закрыть сессию при удалении объекта.
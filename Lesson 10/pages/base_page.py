@@ -4,7 +4,8 @@ from typing import Any
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import allure
+
+from utils.tracing import traced
 
 
 class BasePage:
@@ -24,7 +25,7 @@ class BasePage:
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
     
-    @allure.step("Открыть страницу: {url}")
+    @traced("Открыть страницу: {url}")
     def open_page(self, url: str) -> None:
         """
         Открыть указанную страницу.
@@ -34,7 +35,7 @@ class BasePage:
         """
         self.driver.get(url)
     
-    @allure.step("Получить текущий URL")
+    @traced("Получить текущий URL")
     def get_current_url(self) -> str:
         """
         Получить URL текущей страницы.
@@ -44,7 +45,7 @@ class BasePage:
         """
         return self.driver.current_url
     
-    @allure.step("Получить заголовок страницы")
+    @traced("Получить заголовок страницы")
     def get_title(self) -> str:
         """
         Получить заголовок текущей страницы.
@@ -54,7 +55,7 @@ class BasePage:
         """
         return self.driver.title
     
-    @allure.step("Ожидать видимости элемента")
+    @traced("Ожидать видимости элемента")
     def wait_for_element_visible(self, locator: tuple) -> Any:
         """
         Ожидать пока элемент станет видимым.
@@ -67,7 +68,7 @@ class BasePage:
         """
         return self.wait.until(EC.visibility_of_element_located(locator))
     
-    @allure.step("Ожидать кликабельности элемента")
+    @traced("Ожидать кликабельности элемента")
     def wait_for_element_clickable(self, locator: tuple) -> Any:
         """
         Ожидать пока элемент станет кликабельным.
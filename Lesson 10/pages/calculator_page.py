@@ -5,7 +5,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import allure
+
+from utils.tracing import traced
 
 from .base_page import BasePage
 
@@ -32,7 +33,7 @@ class CalculatorPage(BasePage):
         self.operator_locator_template = "//span[contains(@class, 'operator') and text()='{operator}']"
         self.equals_locator = "//span[contains(@class, 'btn-outline-warning') and text()='=']"
     
-    @allure.step("Ввести значение задержки: {delay_value}")
+    @traced("Ввести значение задержки: {delay_value}")
     def enter_delay_value(self, delay_value: str) -> None:
         """
         Ввести значение задержки в поле ввода.
@@ -44,7 +45,7 @@ class CalculatorPage(BasePage):
         delay_input.clear()
         delay_input.send_keys(delay_value)
     
-    @allure.step("Нажать кнопку: {button_text}")
+    @traced("Нажать кнопку: {button_text}")
     def click_button(self, button_text: str) -> None:
         """
         Нажать кнопку с указанным текстом.
@@ -56,7 +57,7 @@ class CalculatorPage(BasePage):
         button = self.wait_for_element_clickable(button_locator)
         button.click()
     
-    @allure.step("Нажать кнопку оператора: {operator}")
+    @traced("Нажать кнопку оператора: {operator}")
     def click_operator_button(self, operator: str) -> None:
         """
         Нажать кнопку оператора (+, -, *, /).
@@ -68,7 +69,7 @@ class CalculatorPage(BasePage):
         operator_button = self.wait_for_element_clickable(operator_locator)
         operator_button.click()
     
-    @allure.step("Нажать кнопку равно")
+    @traced("Нажать кнопку равно")
     def click_equals_button(self) -> None:
         """
         Нажать кнопку равно (=) для вычисления результата.
@@ -77,7 +78,7 @@ class CalculatorPage(BasePage):
         equals_button = self.wait_for_element_clickable(equals_locator)
         equals_button.click()
     
-    @allure.step("Получить текст результата")
+    @traced("Получить текст результата")
     def get_result_text(self) -> str:
         """
         Получить текст из поля результата.
@@ -88,7 +89,7 @@ class CalculatorPage(BasePage):
         result_element = self.wait_for_element_visible(self.screen_locator)
         return result_element.text
     
-    @allure.step("Ожидать появления результата: {expected_result}")
+    @traced("Ожидать появления результата: {expected_result}")
     def wait_for_result(self, expected_result: str, timeout: int = 45) -> str:
         """
         Ожидать появления указанного результата.
@@ -5,7 +5,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import allure
+
+from utils.tracing import traced
 
 from .base_page import BasePage
 
@@ -47,7 +48,7 @@ class FormPage(BasePage):
         self.zip_code_alert_locator = (By.ID, "zip-code")
         self.success_alerts_locator = (By.CSS_SELECTOR, "div.alert.py-2.alert-success")
     
-    @allure.step("Заполнить поле '{field_name}' значением '{value}'")
+    @traced("Заполнить поле '{field_name}' значением '{value}'")
     def fill_form(self, field_name: str, value: str) -> None:
         """
         Заполнить указанное поле формы значением.
@@ -61,7 +62,7 @@ class FormPage(BasePage):
             field_element = self.wait.until(EC.visibility_of_element_located(field_locator))
             field_element.send_keys(value)
     
-    @allure.step("Отправить форму")
+    @traced("Отправить форму")
     def submit_form(self) -> None:
         """
         Отправить форму нажатием кнопки Submit.
@@ -69,7 +70,7 @@ class FormPage(BasePage):
         submit_button = self.wait.until(EC.element_to_be_clickable(self.submit_button_locator))
         submit_button.click()
     
-    @allure.step("Получить цвет подсветки поля zip code")
+    @traced("Получить цвет подсветки поля zip code")
     def get_zip_code_highlight_color(self) -> str:
         """
         Получить цвет фона поля zip code.
@@ -82,7 +83,7 @@ class FormPage(BasePage):
         )
         return zip_code_alert.value_of_css_property("background-color")
     
-    @allure.step("Получить цвет подсветки поля '{field_id}'")
+    @traced("Получить цвет подсветки поля '{field_id}'")
     def get_field_highlight_color(self, field_id: str) -> str:
         """
         Получить цвет фона указанного поля формы.
@@ -100,7 +101,7 @@ class FormPage(BasePage):
         field = self.wait.until(EC.visibility_of_element_located(field_locator))
         return field.value_of_css_property("background-color")
     
-    @allure.step("Заполнить форму тестовыми данными")
+    @traced("Заполнить форму тестовыми данными")
     def fill_form_with_data(self, form_data: Dict[str, str]) -> None:
         """
         Заполнить все поля формы данными из словаря.
@@ -1,7 +1,8 @@
 """Page Object класс для домашней страницы."""
 
 from selenium.webdriver.remote.webdriver import WebDriver
-import allure
+
+from utils.tracing import traced
 
 from .base_page import BasePage
 
@@ -23,7 +24,7 @@ class HomePage(BasePage):
         super().__init__(driver)
         self.url = "https://bonigarcia.dev/selenium-webdriver-java/data-types.html"
     
-    @allure.step("Открыть домашнюю страницу")
+    @traced("Открыть домашнюю страницу")
     def open(self) -> None:
         """
         Открыть домашнюю страницу проекта.
@@ -3,9 +3,10 @@
 from typing import Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-import allure
 import re
 
+from utils.tracing import traced
+
 from .base_page import BasePage
 
 
@@ -29,14 +30,14 @@ class LoginPage(BasePage):
         self.login_button_locator = (By.ID, "login-button")
         self.login_url = "https://www.saucedemo.com/"
     
-    @allure.step("Открыть страницу логина")
+    @traced("Открыть страницу логина")
     def open_login_page(self) -> None:
         """
         Открыть страницу входа в систему.
         """
         self.open_page(self.login_url)
     
-    @allure.step("Выполнить вход как стандартный пользователь")
+    @traced("Выполнить вход как стандартный пользователь")
     def login_as_standard_user(self) -> None:
         """
         Выполнить вход в систему с учетными данными стандартного пользователя.
@@ -75,7 +76,7 @@ class ProductsPage(BasePage):
         }
         self.shopping_cart_link_locator = (By.CLASS_NAME, "shopping_cart_link")
     
-    @allure.step("Добавить товары в корзину: {product_names}")
+    @traced("Добавить товары в корзину: {product_names}")
     def add_products_to_cart(self, *product_names: str) -> None:
         """
         Добавить указанные товары в корзину.
@@ -89,7 +90,7 @@ class ProductsPage(BasePage):
                 add_button = self.wait_for_element_clickable(button_locator)
                 add_button.click()
     
-    @allure.step("Перейти в корзину")
+    @traced("Перейти в корзину")
     def go_to_shopping_cart(self) -> None:
         """
         Перейти на страницу корзины покупок.
@@ -115,7 +116,7 @@ class CheckoutPage(BasePage):
         super().__init__(driver)
         self.checkout_button_locator = (By.ID, "checkout")
     
-    @allure.step("Перейти к оформлению заказа")
+    @traced("Перейти к оформлению заказа")
     def proceed_to_checkout(self) -> None:
         """
         Начать процесс оформления заказа.
@@ -144,7 +145,7 @@ class PersonalInfoPage(BasePage):
         self.postal_code_locator = (By.ID, "postal-code")
         self.continue_button_locator = (By.ID, "continue")
     
-    @allure.step("Заполнить персональную информацию")
+    @traced("Заполнить персональную информацию")
     def fill_personal_info(self, first_name: str, last_name: str, postal_code: str) -> None:
         """
         Заполнить форму персональными данными.
@@ -185,7 +186,7 @@ class OverviewPage(BasePage):
         self.total_locator = (By.XPATH, '//div[@class="summary_info_label summary_total_label" and contains(text(), "Total:")]')
         self.finish_button_locator = (By.ID, "finish")
     
-    @allure.step("Получить итоговую сумму")
+    @traced("Получить итоговую сумму")
     def get_total_amount(self) -> Optional[str]:
         """
         Получить итоговую сумму заказа.
@@ -205,7 +206,7 @@ class OverviewPage(BasePage):
         except Exception:
             return None
     
-    @allure.step("Завершить покупку")
+    @traced("Завершить покупку")
     def complete_purchase(self) -> None:
         """
         Завершить процесс покупки.
@@ -0,0 +1,65 @@
+"""Фикстуры для API тестов."""
+
+from typing import Generator
+
+import pytest
+import allure
+
+from api.metrics import ClientMetrics
+from api.teacher_api import TeacherAPI
+from tools.teacher_server import TeacherServer
+
+
+@pytest.fixture(scope="session")
+def api_metrics() -> Generator[ClientMetrics, None, None]:
+    """
+    Фикстура с общими метриками API клиентов на всю сессию.
+    
+    По завершении сессии метрики прикладываются к Allure отчету
+    в JSON и в текстовом формате Prometheus.
+    
+    Yields:
+        ClientMetrics: Сборщик метрик для передачи в клиенты
+    """
+    metrics = ClientMetrics()
+    yield metrics
+    if metrics:
+        allure.attach(
+            metrics.to_json(),
+            name="Метрики API запросов",
+            attachment_type=allure.attachment_type.JSON
+        )
+        allure.attach(
+            metrics.to_prometheus(),
+            name="Метрики API запросов (Prometheus)",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+
+@pytest.fixture
+def teacher_server() -> Generator[TeacherServer, None, None]:
+    """
+    Фикстура с локальным сервером учителей на свободном порту.
+    
+    Данные хранятся в памяти и не переживают тест.
+    
+    Yields:
+        TeacherServer: Запущенный сервер
+    """
+    with TeacherServer() as server:
+        yield server
+
+
+@pytest.fixture
+def live_teacher_api(teacher_server: TeacherServer, api_metrics: ClientMetrics) -> TeacherAPI:
+    """
+    Фикстура с API клиентом, подключенным к локальному серверу.
+    
+    Args:
+        teacher_server (TeacherServer): Локальный сервер учителей
+        api_metrics (ClientMetrics): Общие метрики API клиентов
+        
+    Returns:
+        TeacherAPI: Клиент локального сервера
+    """
+    return TeacherAPI(teacher_server.url, metrics=api_metrics)
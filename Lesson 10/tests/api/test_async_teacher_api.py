@@ -0,0 +1,217 @@
+"""Тесты асинхронного API клиента учителей."""
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+import aiohttp
+import allure
+from aiohttp import web
+
+from api.async_teacher_api import AsyncTeacherAPI
+
+
+async def _start_server(state: Dict[str, Any]) -> web.AppRunner:
+    """
+    Запустить тестовый сервер учителей на свободном порту.
+
+    Args:
+        state (Dict[str, Any]): Общее состояние: учителя, счетчики параллелизма
+            и необязательные флаги поведения сервера (allow_head, broken, ignore_keyset,
+            paging: 'envelope' — страницы в items с next_cursor, 'link' — заголовок Link)
+
+    Returns:
+        web.AppRunner: Запущенный сервер; порт сохраняется в state['port']
+    """
+    async def get_teacher(request: web.Request) -> web.Response:
+        state['in_flight'] += 1
+        state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        await asyncio.sleep(0.01)
+        state['in_flight'] -= 1
+        state.setdefault('methods', []).append(request.method)
+        teacher_id = int(request.match_info['teacher_id'])
+        if teacher_id in state.get('broken', ()):
+            raise web.HTTPInternalServerError()
+        teacher = state['teachers'].get(teacher_id)
+        if teacher is None:
+            raise web.HTTPNotFound()
+        return web.json_response(teacher)
+
+    async def create_teacher(request: web.Request) -> web.Response:
+        data = await request.json()
+        data['teacher_id'] = max(state['teachers'], default=0) + 1
+        state['teachers'][data['teacher_id']] = data
+        return web.json_response(data, status=201)
+
+    async def list_teachers(request: web.Request) -> web.Response:
+        state['list_calls'] = state.get('list_calls', 0) + 1
+        if state.get('ignore_keyset'):
+            return web.json_response(list(state['teachers'].values()))
+        paging = state.get('paging')
+        if paging:
+            teachers = sorted(state['teachers'].values(), key=lambda teacher: teacher['teacher_id'])
+            limit = int(request.query['limit'])
+            start = int(request.query.get('cursor') or request.query.get('offset') or 0)
+            more = start + limit < len(teachers)
+            page = teachers[start:start + limit]
+            if paging == 'envelope':
+                return web.json_response({'items': page,
+                                          'next_cursor': str(start + limit) if more else None})
+            next_url = (f"http://127.0.0.1:{state['port']}/api/v1/teachers"
+                        f"?limit={limit}&offset={start + limit}")
+            return web.json_response(page, headers={'Link': f'<{next_url}>; rel="next"'} if more else {})
+        group_id = request.query.get('group_id')
+        return web.json_response([
+            teacher for teacher in state['teachers'].values()
+            if group_id is None or teacher['group_id'] == int(group_id)
+        ])
+
+    app = web.Application()
+    app.router.add_get('/api/v1/teachers', list_teachers)
+    app.router.add_post('/api/v1/teachers', create_teacher)
+    app.router.add_get('/api/v1/teachers/{teacher_id}', get_teacher,
+                       allow_head=state.get('allow_head', True))
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    state['port'] = site._server.sockets[0].getsockname()[1]
+    return runner
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Async Teacher API")
+class TestAsyncTeacherAPI:
+    """
+    Класс для тестирования асинхронного клиента на локальном сервере.
+    """
+
+    @allure.title("Тест создания и получения учителей")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "async", "positive")
+    @pytest.mark.api
+    def test_create_and_get(self) -> None:
+        """
+        Тест CRUD вызовов асинхронного клиента.
+        """
+        state = {'teachers': {}, 'in_flight': 0, 'max_in_flight': 0}
+
+        async def scenario() -> None:
+            runner = await _start_server(state)
+            try:
+                async with AsyncTeacherAPI(f"http://127.0.0.1:{state['port']}/api/v1") as api:
+                    created = await api.create_teacher({'email': 'a@test.com', 'group_id': 100})
+                    assert created['teacher_id'] == 1
+                    assert await api.get_teacher_by_id(1) == created
+                    assert await api.get_teacher_by_id(999) is None
+                    assert await api.teacher_exists(1)
+                    assert await api.get_teachers_by_group(100) == [created]
+            finally:
+                await runner.cleanup()
+
+        with allure.step("Выполнить сценарий на локальном сервере"):
+            asyncio.run(scenario())
+
+    @allure.title("Тест ограничения параллелизма")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "async", "concurrency")
+    @pytest.mark.api
+    @pytest.mark.performance
+    def test_concurrency_is_bounded(self) -> None:
+        """
+        Тест что одновременно выполняется не больше max_concurrency запросов.
+        """
+        state = {
+            'teachers': {i: {'teacher_id': i, 'email': f't{i}@test.com', 'group_id': 100}
+                         for i in range(1, 51)},
+            'in_flight': 0, 'max_in_flight': 0
+        }
+
+        async def scenario() -> list:
+            runner = await _start_server(state)
+            try:
+                async with AsyncTeacherAPI(f"http://127.0.0.1:{state['port']}/api/v1",
+                                           max_concurrency=5) as api:
+                    return await asyncio.gather(*(api.get_teacher_by_id(i) for i in range(1, 51)))
+            finally:
+                await runner.cleanup()
+
+        with allure.step("Запросить 50 учителей одновременно"):
+            results = asyncio.run(scenario())
+
+        with allure.step("Проверить результат и параллелизм"):
+            assert [teacher['teacher_id'] for teacher in results] == list(range(1, 51))
+            assert 1 < state['max_in_flight'] <= 5
+
+    @allure.title("Тест проверки существования и обхода на нестандартном сервере")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "async", "head", "pagination")
+    @pytest.mark.api
+    def test_exists_and_iter_fallbacks(self) -> None:
+        """
+        Тест HEAD с переходом на GET при 405, ошибки кроме 404 и обхода,
+        когда сервер игнорирует limit/after_id.
+        """
+        state = {
+            'teachers': {i: {'teacher_id': i, 'email': f't{i}@test.com', 'group_id': 100}
+                         for i in range(1, 6)},
+            'in_flight': 0, 'max_in_flight': 0,
+            'allow_head': False, 'broken': {500}, 'ignore_keyset': True
+        }
+
+        async def scenario() -> list:
+            runner = await _start_server(state)
+            try:
+                async with AsyncTeacherAPI(f"http://127.0.0.1:{state['port']}/api/v1") as api:
+                    assert await api.teacher_exists(1)
+                    assert not await api.teacher_exists(999)
+                    with pytest.raises(aiohttp.ClientResponseError) as error:
+                        await api.teacher_exists(500)
+                    assert error.value.status == 500
+                    return [teacher async for teacher in api.iter_teachers(page_size=2)]
+            finally:
+                await runner.cleanup()
+
+        with allure.step("Выполнить сценарий на локальном сервере"):
+            teachers = asyncio.run(scenario())
+
+        with allure.step("После 405 на HEAD каждая проверка выполняется одним GET"):
+            assert state['methods'] == ['GET', 'GET', 'GET']
+
+        with allure.step("Обход выдал каждого учителя один раз и остановился"):
+            assert [teacher['teacher_id'] for teacher in teachers] == [1, 2, 3, 4, 5]
+            assert state['list_calls'] == 2
+
+    @allure.title("Тест пагинации конвертом и заголовком Link")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "async", "pagination")
+    @pytest.mark.api
+    @pytest.mark.parametrize("paging", ['envelope', 'link'])
+    def test_iter_teachers_paging_styles(self, paging: str) -> None:
+        """
+        Тест что асинхронный обход поддерживает те же способы пагинации, что и синхронный.
+
+        Args:
+            paging (str): Способ пагинации сервера
+        """
+        state = {
+            'teachers': {i: {'teacher_id': i, 'email': f't{i}@test.com', 'group_id': 100}
+                         for i in range(1, 6)},
+            'in_flight': 0, 'max_in_flight': 0, 'paging': paging
+        }
+
+        async def scenario() -> list:
+            runner = await _start_server(state)
+            try:
+                async with AsyncTeacherAPI(f"http://127.0.0.1:{state['port']}/api/v1") as api:
+                    return [teacher async for teacher in api.iter_teachers(page_size=2)]
+            finally:
+                await runner.cleanup()
+
+        with allure.step("Обойти учителей страницами по 2"):
+            teachers = asyncio.run(scenario())
+
+        with allure.step("Проверить учителей и число запросов"):
+            assert [teacher['teacher_id'] for teacher in teachers] == [1, 2, 3, 4, 5]
+            assert state['list_calls'] == 3
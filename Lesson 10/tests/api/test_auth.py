@@ -0,0 +1,267 @@
+"""Тесты общего кеша токенов авторизации."""
+
+import multiprocessing
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+import allure
+import requests
+
+from api import auth
+from api.auth import TokenProvider, shared_token_provider
+from api.resilience import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+from api.teacher_api import TeacherAPI
+
+
+class CountingLogin:
+    """
+    Функция входа, выдающая пронумерованные токены.
+    """
+
+    def __init__(self, expires_in: float = 100.0, delay: float = 0.0) -> None:
+        self.expires_in = expires_in
+        self.delay = delay
+        self.calls: List[Any] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, credentials: Any) -> Tuple[str, float]:
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls.append(credentials)
+            return f"token-{len(self.calls)}", self.expires_in
+
+
+def file_login(credentials: Any) -> Tuple[str, float]:
+    """
+    Функция входа для процессов: записывает каждый вход в журнал.
+
+    Args:
+        credentials (Any): Путь журнала и имя пользователя
+
+    Returns:
+        Tuple[str, float]: Токен и срок жизни
+    """
+    log_path, user = credentials
+    time.sleep(0.2)
+    with open(log_path, 'a') as log:
+        log.write(f"{user}\n")
+    return f"token-{user}", 300.0
+
+
+def worker_token(cache_path: str, log_path: str, queue: Any) -> None:
+    """
+    Получить токен в отдельном процессе.
+
+    Args:
+        cache_path (str): Файл кеша токенов
+        log_path (str): Журнал входов
+        queue (Any): Очередь для результата
+    """
+    queue.put(TokenProvider(file_login, cache_path=cache_path).get_token((log_path, 'alice')))
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Auth Tokens")
+class TestTokenProvider:
+    """
+    Класс для тестирования провайдера токенов.
+    """
+
+    @allure.title("Тест одного входа для потоков")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "auth", "concurrency")
+    @pytest.mark.api
+    @pytest.mark.auth
+    def test_single_login_for_threads(self) -> None:
+        """
+        Тест что одновременные запросы токена выполняют один вход на учетные данные.
+        """
+        login = CountingLogin(delay=0.05)
+        provider = TokenProvider(login)
+        tokens: List[str] = []
+
+        def worker() -> None:
+            tokens.append(provider.get_token({'user': 'alice', 'password': 'secret'}))
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tokens == ['token-1'] * 16
+        assert provider.stats['logins'] == 1
+        assert provider.get_token({'password': 'secret', 'user': 'alice'}) == 'token-1'
+        assert provider.get_token({'user': 'bob', 'password': 'secret'}) == 'token-2'
+
+    @allure.title("Тест фонового обновления до истечения")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "auth")
+    @pytest.mark.api
+    @pytest.mark.auth
+    def test_background_refresh(self) -> None:
+        """
+        Тест что токен обновляется в фоне за refresh_before секунд до истечения.
+        """
+        now = [1000.0]
+        login = CountingLogin(expires_in=100)
+        provider = TokenProvider(login, refresh_before=30, skew=5, clock=lambda: now[0])
+
+        with allure.step("Свежий токен берется из кеша без обновления"):
+            assert provider.get_token('alice') == 'token-1'
+            now[0] += 60
+            assert provider.get_token('alice') == 'token-1'
+            provider.wait()
+            assert len(login.calls) == 1
+
+        with allure.step("Близкий к истечению токен возвращается, а новый приходит в фоне"):
+            now[0] += 15
+            assert provider.get_token('alice') == 'token-1'
+            provider.wait()
+            assert provider.get_token('alice') == 'token-2'
+            assert provider.stats['refreshes'] == 1
+
+        with allure.step("Истекший токен получается синхронно"):
+            now[0] += 200
+            assert provider.get_token('alice') == 'token-3'
+
+        with allure.step("Короткоживущий токен обновляется не раньше середины срока"):
+            login.expires_in = 10
+            assert provider.get_token('bob') == 'token-4'
+            now[0] += 4
+            provider.get_token('bob')
+            provider.wait()
+            assert len(login.calls) == 4
+
+    @allure.title("Тест общего файла кеша для процессов")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "auth", "xdist")
+    @pytest.mark.api
+    @pytest.mark.auth
+    @pytest.mark.skipif(auth.fcntl is None, reason="нужна блокировка fcntl")
+    def test_file_cache_across_processes(self, tmp_path: Path) -> None:
+        """
+        Тест что процессы с общим файлом кеша выполняют один вход.
+
+        Args:
+            tmp_path (Path): Временная директория теста
+        """
+        cache_path, log_path = tmp_path / 'tokens.json', tmp_path / 'logins.log'
+        context = multiprocessing.get_context('fork')
+        queue = context.Queue()
+        processes = [
+            context.Process(target=worker_token, args=(str(cache_path), str(log_path), queue))
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        tokens = [queue.get(timeout=10) for _ in processes]
+        for process in processes:
+            process.join()
+
+        assert tokens == ['token-alice'] * 4
+        assert log_path.read_text().splitlines() == ['alice']
+        assert str(log_path) not in cache_path.read_text()
+
+        provider = TokenProvider(file_login, cache_path=str(cache_path))
+        provider.invalidate((str(log_path), 'alice'), 'token-alice')
+        assert provider.get_token((str(log_path), 'alice')) == 'token-alice'
+        assert provider.stats['logins'] == 1
+
+    @allure.title("Тест провайдера в API клиентах")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "auth")
+    @pytest.mark.api
+    @pytest.mark.auth
+    def test_shared_between_clients(self) -> None:
+        """
+        Тест что клиенты используют общий токен, а 401 приводит к одному повторному входу.
+        """
+        login = CountingLogin()
+        provider = shared_token_provider(login)
+        assert shared_token_provider(login) is provider
+        first = TeacherAPI("http://test-api.local/api/v1", token_provider=provider,
+                           credentials='alice')
+        second = TeacherAPI("http://test-api.local/api/v1",
+                            token_provider=shared_token_provider(login), credentials='alice')
+        ok = Mock(status_code=200, headers={}, **{'json.return_value': {'teacher_id': 1}})
+        unauthorized = Mock(status_code=401, headers={})
+
+        with allure.step("Оба клиента отправляют один токен"):
+            with patch.object(first.session, 'request', return_value=ok) as request:
+                first.get_teacher_by_id(1)
+            with patch.object(second.session, 'request', return_value=ok) as second_request:
+                second.get_teacher_by_id(1)
+            assert request.call_args.kwargs['headers'] == {'Authorization': 'Bearer token-1'}
+            assert second_request.call_args.kwargs['headers'] == {'Authorization': 'Bearer token-1'}
+            assert len(login.calls) == 1
+
+        with allure.step("Отозванный токен заменяется после 401"):
+            with patch.object(second.session, 'request', side_effect=[unauthorized, ok]) as request:
+                assert second.get_teacher_by_id(1) == {'teacher_id': 1}
+            assert request.call_args.kwargs['headers'] == {'Authorization': 'Bearer token-2'}
+            assert second.stats['reauthenticated'] == 1
+            provider.invalidate('alice', 'token-1')
+            assert provider.get_token('alice') == 'token-2'
+
+    @allure.title("Тест 401 на пробном запросе half-open")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "auth", "circuit-breaker")
+    @pytest.mark.api
+    @pytest.mark.auth
+    def test_reauth_during_half_open_probe(self) -> None:
+        """
+        Тест что 401 на пробном запросе замыкает breaker, а повтор с новым токеном проходит.
+        """
+        now = [0.0]
+        breakers = CircuitBreakerRegistry(min_requests=1, window_size=1, open_duration=5,
+                                          clock=lambda: now[0])
+        api = TeacherAPI("http://test-api.local/api/v1", circuit_breakers=breakers,
+                         token_provider=TokenProvider(CountingLogin()), credentials='alice')
+        ok = Mock(status_code=200, headers={}, **{'json.return_value': {'teacher_id': 1}})
+        failed = Mock(status_code=500, headers={},
+                      **{'raise_for_status.side_effect': requests.HTTPError("500")})
+
+        unauthorized = Mock(status_code=401, headers={})
+
+        with patch.object(api.session, 'request', side_effect=[failed, unauthorized, ok]):
+            assert api.get_teacher_by_id(1) is None
+            now[0] = 5.0
+            assert api.get_teacher_by_id(1) == {'teacher_id': 1}
+
+        assert breakers.stats()['test-api.local']['state'] == CircuitBreaker.CLOSED
+
+        with allure.step("401 запроса без пробы не трогает чужую пробу"):
+            breaker = breakers.get('test-api.local')
+            pending = []
+
+            def unauthorized_during_probe(*args: Any, **kwargs: Any) -> Mock:
+                # Пока запрос ждет ответа, breaker размыкается и другой клиент берет пробу
+                breaker.record_failure()
+                now[0] += 5.0
+                pending.append(breaker.allow_request())
+                return unauthorized
+
+            with patch.object(api.session, 'request', side_effect=unauthorized_during_probe):
+                # Повтор с новым токеном упирается в чужую пробу
+                with pytest.raises(CircuitOpenError):
+                    api.get("teachers/1")
+            assert len(pending) == 1 and pending[0]
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert not breaker.allow_request()
+            breaker.record_success(pending[0])
+            assert breaker.state == CircuitBreaker.CLOSED
+
+        with allure.step("Исключение до ответа освобождает место пробы"):
+            breaker.record_failure()
+            now[0] += 5.0
+            with patch.object(api.token_provider, 'get_token', side_effect=RuntimeError("login")):
+                with pytest.raises(RuntimeError):
+                    api.get("teachers/1")
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert breaker.allow_request()
@@ -0,0 +1,130 @@
+"""Тесты записи и воспроизведения HTTP обменов."""
+
+import time
+from pathlib import Path
+
+import pytest
+import allure
+
+from api.cassette import Cassette, CassetteMissError
+from api.teacher_api import TeacherAPI
+from tools.teacher_server import TeacherServer
+
+
+def scenario(api: TeacherAPI) -> list:
+    """
+    Выполнить сценарий с чтениями до и после изменений.
+
+    Args:
+        api (TeacherAPI): Клиент
+
+    Returns:
+        list: Результаты шагов сценария
+    """
+    created = api.create_teacher({'email': 'tape@test.com', 'group_id': 100})
+    teacher_id = created['teacher_id']
+    return [
+        api.get_all_teachers(),
+        api.update_teacher_email(teacher_id, 'new@test.com'),
+        api.get_teacher_by_id(teacher_id),
+        api.teacher_exists(teacher_id + 1),
+        list(api.stream_teachers({'group_id': 100})),
+        api.delete_teacher(teacher_id),
+        api.get_teacher_by_id(teacher_id),
+    ]
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Cassette")
+class TestCassette:
+    """
+    Класс для тестирования кассет API клиента.
+    """
+
+    @allure.title("Тест воспроизведения записанного сценария без сервера")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "cassette")
+    @pytest.mark.api
+    def test_record_and_replay(self, tmp_path: Path) -> None:
+        """
+        Тест что сценарий на кассете дает те же результаты после остановки сервера.
+
+        Args:
+            tmp_path (Path): Временная папка pytest
+        """
+        path = str(tmp_path / 'teachers.cassette')
+
+        with allure.step("Записать сценарий на локальном сервере"):
+            with TeacherServer() as server, Cassette(path, mode='record') as cassette:
+                recorded = scenario(TeacherAPI(server.url, cassette=cassette))
+            assert cassette.stats['recorded'] == 8
+
+        with allure.step("Воспроизвести сценарий без сервера"):
+            with Cassette(path) as cassette:
+                api = TeacherAPI(server.url, cassette=cassette)
+                assert scenario(api) == recorded
+                assert cassette.stats == {'recorded': 0, 'replayed': 8, 'missed': 0}
+                assert len(cassette) == 8
+
+    @allure.title("Тест незаписанного запроса и поврежденной кассеты")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "cassette", "negative")
+    @pytest.mark.api
+    @pytest.mark.negative
+    def test_miss_and_corrupted(self, tmp_path: Path, teacher_server: TeacherServer) -> None:
+        """
+        Тест ошибки для незаписанного запроса и оборванного файла.
+
+        Args:
+            tmp_path (Path): Временная папка pytest
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        path = tmp_path / 'one.cassette'
+        with Cassette(str(path), mode='record') as cassette:
+            TeacherAPI(teacher_server.url, cassette=cassette).get_all_teachers()
+
+        with allure.step("Запрос с другими параметрами не записан"):
+            with Cassette(str(path)) as cassette:
+                api = TeacherAPI(teacher_server.url, cassette=cassette)
+                assert api.get_all_teachers() == []
+                assert api.get_all_teachers() == []
+                with pytest.raises(CassetteMissError):
+                    api.get_teachers_by_group(100)
+
+        with allure.step("Оборванный файл не открывается"):
+            path.write_bytes(path.read_bytes()[:-1])
+            with pytest.raises(ValueError):
+                Cassette(str(path))
+            with pytest.raises(ValueError):
+                Cassette(str(path), mode='append')
+
+    @allure.title("Тест скорости воспроизведения")
+    @allure.severity(allure.severity_level.MINOR)
+    @allure.tag("api", "cassette", "performance")
+    @pytest.mark.api
+    @pytest.mark.performance
+    def test_replay_throughput(self, tmp_path: Path, teacher_server: TeacherServer) -> None:
+        """
+        Тест что тысячи запросов воспроизводятся без сети; скорость прикладывается к отчету.
+
+        Args:
+            tmp_path (Path): Временная папка pytest
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        path = str(tmp_path / 'bulk.cassette')
+        for number in range(100):
+            teacher_server.store.create({'email': f't{number}@test.com', 'group_id': 100})
+        with Cassette(path, mode='record') as cassette:
+            api = TeacherAPI(teacher_server.url, cassette=cassette)
+            expected = [api.get_teacher_by_id(teacher_id) for teacher_id in range(1, 101)]
+
+        with Cassette(path) as cassette:
+            api = TeacherAPI(teacher_server.url, cassette=cassette)
+            started = time.perf_counter()
+            for _ in range(20):
+                assert [api.get_teacher_by_id(teacher_id) for teacher_id in range(1, 101)] == expected
+            elapsed = time.perf_counter() - started
+            allure.attach(f"{2000 / elapsed:.0f} запросов/сек", name="Воспроизведение",
+                          attachment_type=allure.attachment_type.TEXT)
+            assert cassette.stats['replayed'] == 2000
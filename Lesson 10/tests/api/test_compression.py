@@ -0,0 +1,135 @@
+"""Тесты сжатия тел запросов и ответов и потокового чтения списков."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+import allure
+import requests
+
+from api.compression import ENCODINGS, compress, decompress, negotiate
+from api.metrics import ClientMetrics
+from api.teacher_api import TeacherAPI
+from tools.teacher_server import TeacherServer
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Compression")
+class TestCompression:
+    """
+    Класс для тестирования сжатия и потокового чтения списков.
+    """
+
+    @allure.title("Тест сжатия и выбора Content-Encoding")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "compression")
+    @pytest.mark.api
+    @pytest.mark.parametrize("encoding", ENCODINGS)
+    def test_round_trip(self, encoding: str) -> None:
+        """
+        Тест распаковки сжатого тела и согласования сжатия ответа.
+
+        Args:
+            encoding (str): Сжатие
+        """
+        body = json.dumps([{'teacher_id': i, 'email': f't{i}@test.com'} for i in range(200)]).encode()
+
+        packed = compress(body, encoding)
+        assert len(packed) * 4 < len(body)
+        assert decompress(packed, encoding) == body
+        assert compress(body, encoding) == packed
+        assert negotiate(f"br, {encoding};q=0.5") == encoding
+        assert negotiate(f"{encoding};q=0") is None
+        with pytest.raises(ValueError):
+            compress(body, 'br')
+
+    @allure.title("Тест сжатия тела POST")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "post", "compression")
+    @pytest.mark.api
+    def test_client_compresses_large_bodies(self) -> None:
+        """
+        Тест что клиент сжимает тела от compression_min_size, а меньшие отправляет как есть.
+        """
+        api = TeacherAPI("http://test-api.local/api/v1", compression='gzip', compression_min_size=512)
+        large = {'email': 'big@test.com', 'group_id': 100, 'bio': 'учитель ' * 200}
+        small = {'email': 'small@test.com', 'group_id': 100}
+        created = Mock(status_code=201, headers={}, **{'json.return_value': {'teacher_id': 1}})
+
+        with patch.object(api.session, 'request', return_value=created) as request:
+            api.create_teacher(large)
+            api.update_teacher(1, small)
+
+        large_call, small_call = request.call_args_list
+        assert large_call.kwargs['headers'] == {'Content-Encoding': 'gzip'}
+        assert json.loads(decompress(large_call.kwargs['data'], 'gzip')) == large
+        assert 'headers' not in small_call.kwargs
+        assert json.loads(small_call.kwargs['data']) == small
+        with pytest.raises(ValueError):
+            TeacherAPI("http://test-api.local/api/v1", compression='br')
+
+    @allure.title("Тест сжатых обменов с сервером и метрик сжатия")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "compression", "live")
+    @pytest.mark.api
+    def test_live_compression_metrics(self, teacher_server: TeacherServer) -> None:
+        """
+        Тест сжатых тел запросов и ответов через локальный сервер и учета сэкономленных байтов.
+
+        Args:
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        for number in range(300):
+            teacher_server.store.create({'email': f'teacher{number}@test.com', 'group_id': 100 + number % 3})
+        metrics = ClientMetrics()
+        api = TeacherAPI(teacher_server.url, metrics=metrics, compression='gzip',
+                         compression_min_size=0)
+
+        with allure.step("Сервер распаковывает сжатые тела POST и PUT"):
+            created = api.create_teacher({'email': 'zipped@test.com', 'group_id': 105})
+            api.update_teacher_email(created['teacher_id'], 'rezipped@test.com')
+            assert teacher_server.store.get(created['teacher_id'])['email'] == 'rezipped@test.com'
+
+        with allure.step("Большой список приходит сжатым"):
+            assert len(api.get_all_teachers()) == 301
+
+        with allure.step("Метрики показывают степень сжатия по эндпоинтам"):
+            endpoints = {(item['method'], item['endpoint']): item for item in metrics.to_dict()['endpoints']}
+            listing = endpoints[('GET', 'teachers')]
+            assert listing['bytes_in_raw'] > 3 * listing['bytes_in']
+            assert listing['compression']['in_ratio'] > 3
+            assert listing['compression']['bytes_saved'] > 0
+            post = endpoints[('POST', 'teachers')]
+            assert post['bytes_out_raw'] == len(json.dumps({'email': 'zipped@test.com', 'group_id': 105}))
+            assert post['bytes_out'] == len(compress(json.dumps(
+                {'email': 'zipped@test.com', 'group_id': 105}).encode(), 'gzip'))
+            assert ('api_client_bytes_saved_total{method="GET",endpoint="teachers",direction="in"}'
+                    in metrics.to_prometheus())
+
+        with allure.step("Неподдерживаемое сжатие тела отклоняется с 415"):
+            response = requests.post(f"{teacher_server.url}/teachers", data=b'{}',
+                                     headers={'Content-Encoding': 'br'})
+            assert response.status_code == 415
+
+    @allure.title("Тест потокового чтения списков")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "get", "stream", "live")
+    @pytest.mark.api
+    def test_stream_lists(self, teacher_server: TeacherServer) -> None:
+        """
+        Тест что списки с stream_lists совпадают с прочитанными целиком.
+
+        Args:
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        for number in range(200):
+            teacher_server.store.create({'email': f'teacher{number}@test.com', 'group_id': 100 + number % 4})
+        buffered = TeacherAPI(teacher_server.url)
+        streamed = TeacherAPI(teacher_server.url, stream_lists=True)
+
+        assert streamed.get_all_teachers() == buffered.get_all_teachers()
+        assert streamed.get_teachers_by_group(102) == buffered.get_teachers_by_group(102)
+        assert streamed.search_teachers_by_email('teacher7@test.com') == \
+            buffered.search_teachers_by_email('teacher7@test.com')
+        assert len(streamed.get_teachers_by_group(102)) == 50
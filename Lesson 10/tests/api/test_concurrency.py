@@ -0,0 +1,198 @@
+"""Тесты адаптивного окна одновременных запросов."""
+
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+import allure
+import requests
+
+from api.concurrency import AdaptiveConcurrencyLimiter
+from api.resilience import RetryPolicy
+from api.teacher_api import TeacherAPI
+
+
+class OverloadableServer:
+    """
+    Модель сервера: capacity запросов обрабатываются параллельно за base секунд,
+    сверх этого задержка растет пропорционально очереди, а сверх reject_above — 503.
+    """
+
+    def __init__(self, capacity: int, base: float, reject_above: int) -> None:
+        self.capacity = capacity
+        self.base = base
+        self.reject_above = reject_above
+        self.inflight = 0
+        self.peak = 0
+        self.statuses: List[int] = []
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Mock:
+        teacher_id = int(url.rsplit('/', 1)[1])
+        with self._lock:
+            self.inflight += 1
+            current = self.inflight
+            self.peak = max(self.peak, current)
+        try:
+            started = time.perf_counter()
+            status = 200 if teacher_id % 10 else 404
+            if current > self.reject_above:
+                status = 503
+            else:
+                time.sleep(self.base * max(1.0, current / self.capacity))
+            with self._lock:
+                self.statuses.append(status)
+            response = Mock(status_code=status, headers={},
+                            elapsed=timedelta(seconds=time.perf_counter() - started),
+                            **{'json.return_value': {'teacher_id': teacher_id}})
+            if status != 200:
+                response.raise_for_status.side_effect = requests.HTTPError(
+                    f"{status} Error", response=response
+                )
+            return response
+        finally:
+            with self._lock:
+                self.inflight -= 1
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Adaptive Concurrency")
+class TestAdaptiveConcurrency:
+    """
+    Класс для тестирования адаптивного окна и get_teachers_by_ids.
+    """
+
+    @allure.title("Тест изменения окна по задержкам и перегрузке")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "concurrency")
+    @pytest.mark.api
+    def test_limit_follows_latency(self) -> None:
+        """
+        Тест роста окна без очереди на сервере, уменьшения при очереди и AIMD при 503.
+        """
+        now = [0.0]
+        limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=32, clock=lambda: now[0])
+
+        def round_trip(rtt: float) -> None:
+            # Заполнить окно и отпустить все запросы с одной задержкой
+            count = int(limiter.limit)
+            for _ in range(count):
+                limiter.acquire()
+            for _ in range(count):
+                limiter.release(rtt)
+
+        with allure.step("Стабильная задержка при полном окне увеличивает окно"):
+            for _ in range(10):
+                round_trip(0.01)
+            grown = limiter.limit
+            assert grown > 7
+
+        with allure.step("Неполное окно не увеличивает окно"):
+            limiter.acquire()
+            limiter.release(0.01)
+            assert limiter.limit == grown
+
+        with allure.step("Очередь на сервере уменьшает окно"):
+            round_trip(0.05)
+            assert limiter.limit < grown
+
+        with allure.step("Пачка перегрузок уменьшает окно один раз за базовую задержку"):
+            before = limiter.limit
+            for _ in range(3):
+                limiter.acquire()
+            for _ in range(3):
+                limiter.release(overloaded=True)
+            assert limiter.limit == pytest.approx(before / 2)
+            assert limiter.stats['overloads'] == 3 and limiter.stats['decreases'] == 1
+            now[0] += 1.0
+            limiter.acquire()
+            limiter.release(overloaded=True)
+            assert limiter.limit == pytest.approx(before / 4)
+
+    @allure.title("Тест ожидания места в окне")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "concurrency")
+    @pytest.mark.api
+    def test_acquire_blocks_when_full(self) -> None:
+        """
+        Тест что запрос сверх окна ждет освобождения места.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+        limiter.acquire()
+        limiter.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+
+        assert not acquired.wait(0.05)
+        limiter.release(0.01)
+        assert acquired.wait(1)
+        thread.join()
+        assert limiter.inflight == 2
+
+    @allure.title("Тест get_teachers_by_ids на перегружаемом сервере")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "concurrency", "performance")
+    @pytest.mark.api
+    @pytest.mark.performance
+    def test_get_teachers_by_ids_adapts(self) -> None:
+        """
+        Тест что окно выходит на пропускную способность сервера без массовых 503,
+        а отсутствующие учителя и ошибки возвращаются отдельно.
+        """
+        server = OverloadableServer(capacity=6, base=0.004, reject_above=12)
+        sleeps: List[float] = []
+        # Политика повторов клиента не должна повторять запросы окна
+        api = TeacherAPI("http://test-api.local/api/v1", pool_maxsize=32,
+                         retry_policy=RetryPolicy(sleep=sleeps.append))
+        ids = list(range(1, 601)) + [5, 5]
+
+        with patch.object(api.session, 'request', side_effect=server.request):
+            report: Dict[str, Any] = api.get_teachers_by_ids(ids)
+
+        allure.attach(
+            f"{report['throughput']:.0f} запросов/сек, окно {report['concurrency']:.1f}, "
+            f"пик {server.peak}, 503: {server.statuses.count(503)}",
+            name="Адаптивное окно", attachment_type=allure.attachment_type.TEXT
+        )
+        with allure.step("Каждый ID запрошен один раз и попал ровно в одну категорию"):
+            assert len(server.statuses) == 600
+            assert sleeps == []
+            assert report['missing'] == [teacher_id for teacher_id in range(10, 601, 10)
+                                         if teacher_id not in report['errors']]
+            assert set(report['teachers']) | set(report['missing']) | set(report['errors']) == \
+                set(range(1, 601))
+            assert all(teacher['teacher_id'] == teacher_id
+                       for teacher_id, teacher in report['teachers'].items())
+            assert list(report['teachers']) == sorted(report['teachers'])
+
+        with allure.step("Окно держится около пропускной способности сервера"):
+            assert server.statuses.count(503) < 30
+            assert 3 <= report['concurrency'] <= 16
+            # Предел сервера — capacity / base = 1500 запросов/сек
+            assert report['throughput'] > 500
+
+    @allure.title("Тест одной попытки на ID при перегрузке")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "concurrency", "retry")
+    @pytest.mark.api
+    def test_overload_sampled_per_attempt(self) -> None:
+        """
+        Тест что 503 не повторяется политикой клиента, а сразу уменьшает окно.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+        api = TeacherAPI("http://test-api.local/api/v1", concurrency_limiter=limiter,
+                         retry_policy=RetryPolicy(sleep=lambda seconds: None))
+        unavailable = Mock(status_code=503, headers={})
+        unavailable.raise_for_status.side_effect = requests.HTTPError("503 Error", response=unavailable)
+
+        with patch.object(api.session, 'request', return_value=unavailable) as request:
+            report = api.get_teachers_by_ids([1])
+
+        assert request.call_count == 1
+        assert list(report['errors']) == [1]
+        assert limiter.stats['overloads'] == 1 and limiter.limit == 4
@@ -0,0 +1,149 @@
+"""API тесты кеша GET ответов с условной ревалидацией."""
+
+import json
+from typing import Dict, Optional
+from unittest.mock import patch
+
+import pytest
+import allure
+import requests
+
+from api.base_client import BaseAPIClient
+from api.metrics import ClientMetrics
+
+
+def make_response(status: int, body: Optional[object] = None,
+                  headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """
+    Построить ответ requests без сетевого запроса.
+    
+    Args:
+        status (int): HTTP статус
+        body (Optional[object]): Тело ответа для сериализации в JSON
+        headers (Optional[Dict[str, str]]): Заголовки ответа
+        
+    Returns:
+        requests.Response: Ответ
+    """
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode() if body is not None else b''
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("HTTP Cache")
+class TestHttpCache:
+    """
+    Класс для тестирования кеша GET ответов в BaseAPIClient.
+    """
+    
+    @pytest.fixture
+    def client(self, api_metrics: ClientMetrics) -> BaseAPIClient:
+        """
+        Фикстура для создания клиента с включенным кешем.
+        
+        Args:
+            api_metrics (ClientMetrics): Общие метрики API клиентов
+        
+        Returns:
+            BaseAPIClient: Клиент с кешем на 2 ответа
+        """
+        return BaseAPIClient("http://test-api.local", cache_size=2, metrics=api_metrics)
+    
+    @allure.title("Тест свежего ответа по max-age")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "cache")
+    @pytest.mark.api
+    def test_fresh_response_served_from_cache(self, client: BaseAPIClient) -> None:
+        """
+        Тест что свежий ответ отдается без сетевого запроса.
+        
+        Args:
+            client (BaseAPIClient): Клиент с кешем
+        """
+        with allure.step("Дважды запросить ресурс с max-age"):
+            with patch.object(client.session, 'request') as mock_request:
+                mock_request.return_value = make_response(
+                    200, [1], {'Cache-Control': 'max-age=60'}
+                )
+                first = client.get("teachers")
+                second = client.get("teachers")
+        
+        with allure.step("Проверить что запрос был один"):
+            assert mock_request.call_count == 1
+            assert second is first
+            assert client.cache.stats['hits'] == 1
+    
+    @allure.title("Тест ревалидации по ETag")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "cache")
+    @pytest.mark.api
+    def test_revalidation_with_etag(self, client: BaseAPIClient) -> None:
+        """
+        Тест условного запроса и ответа 304.
+        
+        Args:
+            client (BaseAPIClient): Клиент с кешем
+        """
+        with allure.step("Запросить ресурс, затем получить 304"):
+            with patch.object(client.session, 'request') as mock_request:
+                mock_request.side_effect = [
+                    make_response(200, {'teacher_id': 1}, {'ETag': '"v1"'}),
+                    make_response(304, headers={'ETag': '"v1"'}),
+                ]
+                client.get("teachers/1")
+                result = client.get("teachers/1")
+        
+        with allure.step("Проверить условный заголовок и сохраненное тело"):
+            assert mock_request.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+            assert result.json() == {'teacher_id': 1}
+            assert client.cache.stats['revalidated'] == 1
+    
+    @allure.title("Тест инвалидации при изменении ресурса")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "cache")
+    @pytest.mark.api
+    def test_put_invalidates_resource_and_collection(self, client: BaseAPIClient) -> None:
+        """
+        Тест что PUT удаляет из кеша ресурс и списки его коллекции.
+        
+        Args:
+            client (BaseAPIClient): Клиент с кешем
+        """
+        with allure.step("Закешировать ресурс и список, затем выполнить PUT"):
+            with patch.object(client.session, 'request') as mock_request:
+                mock_request.return_value = make_response(200, [], {'ETag': '"v1"'})
+                client.get("teachers/1")
+                client.get("teachers", params={'group_id': 100})
+                assert len(client.cache) == 2
+                client.put("teachers/1", data={'email': 'new@test.com'})
+        
+        with allure.step("Проверить что кеш очищен"):
+            assert len(client.cache) == 0
+    
+    @allure.title("Тест вытеснения по LRU")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "cache")
+    @pytest.mark.api
+    def test_lru_eviction(self, client: BaseAPIClient) -> None:
+        """
+        Тест вытеснения давно неиспользованной записи.
+        
+        Args:
+            client (BaseAPIClient): Клиент с кешем на 2 ответа
+        """
+        with allure.step("Запросить три ресурса, обратившись повторно к первому"):
+            with patch.object(client.session, 'request') as mock_request:
+                mock_request.return_value = make_response(200, {}, {'Cache-Control': 'max-age=60'})
+                client.get("teachers/1")
+                client.get("teachers/2")
+                client.get("teachers/1")
+                client.get("teachers/3")
+                client.get("teachers/2")
+        
+        with allure.step("Проверить что вытеснен teachers/2"):
+            assert mock_request.call_count == 4
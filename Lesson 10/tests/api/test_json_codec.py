@@ -0,0 +1,113 @@
+"""Тесты быстрого и потокового декодирования JSON ответов."""
+
+import json
+from typing import Iterator, List
+
+import pytest
+import allure
+
+from api.json_codec import iter_json_array
+from api.teacher_api import TeacherAPI
+from tools.teacher_server import TeacherServer
+
+
+SAMPLE = [
+    {'teacher_id': 1, 'email': 'a@test.com', 'group_id': 100},
+    {'teacher_id': 2, 'email': 'tricky "quoted", [bracketed] {braced} \\ slash', 'group_id': 101},
+    {'nested': {'list': [1, [2, 3], {'x': ']'}]}, 'unicode': 'Учитель ✓'},
+    42, "строка, с запятой", None, True, [],
+]
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("JSON Decoding")
+class TestJsonCodec:
+    """
+    Класс для тестирования декодирования JSON ответов.
+    """
+
+    @allure.title("Тест потокового разбора при любом разбиении на куски")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "json")
+    @pytest.mark.api
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 100000])
+    def test_iter_json_array_chunking(self, chunk_size: int) -> None:
+        """
+        Тест что результат не зависит от границ кусков.
+
+        Args:
+            chunk_size (int): Размер куска в байтах
+        """
+        body = json.dumps(SAMPLE, ensure_ascii=False, indent=1).encode()
+        chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+        assert list(iter_json_array(chunks)) == SAMPLE
+
+    @allure.title("Тест первого элемента до конца тела")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "json", "performance")
+    @pytest.mark.api
+    @pytest.mark.performance
+    def test_first_item_before_body_end(self) -> None:
+        """
+        Тест что первый элемент выдается до чтения последнего куска.
+        """
+        consumed: List[int] = []
+
+        def chunks() -> Iterator[bytes]:
+            for index, chunk in enumerate([b'[{"teacher_id": 1},', b' {"teacher_id": 2}', b']']):
+                consumed.append(index)
+                yield chunk
+
+        items = iter_json_array(chunks())
+        assert next(items) == {'teacher_id': 1}
+        assert consumed == [0]
+        assert list(items) == [{'teacher_id': 2}]
+
+    @allure.title("Тест особых тел ответа")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "json", "negative")
+    @pytest.mark.api
+    @pytest.mark.negative
+    def test_special_bodies(self) -> None:
+        """
+        Тест пустого массива, объекта со списком и оборванного тела.
+        """
+        assert list(iter_json_array([b' [ ] '])) == []
+        assert list(iter_json_array([b'{"items": [1, ', b'2]}'])) == [1, 2]
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'[{"teacher_id": 1}, ']))
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'"not a list"']))
+
+    @allure.title("Тест потокового списка учителей через HTTP")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "json", "live")
+    @pytest.mark.api
+    def test_stream_teachers(self, teacher_server: TeacherServer) -> None:
+        """
+        Тест что stream_teachers возвращает тот же список, что и get_all_teachers.
+
+        Args:
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        for number in range(500):
+            teacher_server.store.create({'email': f't{number}@test.com', 'group_id': 100 + number % 3})
+        decoded = []
+
+        def json_loads(data: bytes) -> object:
+            decoded.append(len(data))
+            return json.loads(data)
+
+        api = TeacherAPI(teacher_server.url, json_loads=json_loads)
+
+        with allure.step("Сравнить потоковый и обычный список"):
+            streamed = list(api.stream_teachers(chunk_size=1024))
+            assert streamed == api.get_all_teachers()
+            assert len(streamed) == 500
+
+        with allure.step("Проверить фильтр и подключаемый декодер"):
+            assert {t['group_id'] for t in api.stream_teachers({'group_id': 101})} == {101}
+            # Элементы декодируются пачками по кускам тела, а не одним вызовом
+            assert len(decoded) > 2
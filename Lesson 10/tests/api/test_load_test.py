@@ -0,0 +1,89 @@
+"""Тесты нагрузочного теста API учителей по открытой модели."""
+
+import time
+
+import pytest
+import allure
+
+from api.teacher_api import TeacherAPI
+from tools.load_test import HdrHistogram, format_report, run_load, teacher_operations
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Load Testing")
+class TestLoadTest:
+    """
+    Класс для тестирования нагрузочного стенда.
+    """
+
+    @allure.title("Тест точности гистограммы")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("load", "histogram")
+    @pytest.mark.performance
+    def test_histogram_precision(self) -> None:
+        """
+        Тест что перцентили гистограммы точны до 1%.
+        """
+        histogram = HdrHistogram(significant_digits=2)
+        for micros in range(1, 10001):
+            histogram.record(micros / 1e6)
+
+        assert histogram.value_at(50) == pytest.approx(5000 / 1e6, rel=0.01)
+        assert histogram.value_at(99) == pytest.approx(9900 / 1e6, rel=0.01)
+        assert histogram.value_at(100) == pytest.approx(0.01)
+        assert "1/(1-Percentile)" in histogram.percentile_distribution()
+
+    @allure.title("Тест поправки на coordinated omission")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("load", "latency")
+    @pytest.mark.performance
+    def test_coordinated_omission_corrected(self) -> None:
+        """
+        Тест что задержка запросов, ждавших за медленным запросом, учитывается.
+
+        Один поток и одна пауза 0.3 с: запросы, запланированные во время паузы,
+        обслуживаются быстро, но их скорректированная задержка велика.
+        """
+        calls = []
+
+        def operation() -> None:
+            calls.append(None)
+            if len(calls) == 1:
+                time.sleep(0.3)
+
+        with allure.step("Запустить 50 rps на 0.5 с в одном потоке"):
+            report = run_load({"op": operation}, rate=50, duration=0.5,
+                              max_workers=1, arrival="constant")
+
+        with allure.step("Проверить что пауза видна в скорректированных перцентилях"):
+            total = report["total"]
+            assert total["count"] == report["scheduled"] == 25
+            assert total["latency_ms"]["p50"] > 50
+            assert total["service_time_ms"]["p50"] < 10
+
+    @allure.title("Тест нагрузки на локальный сервер")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "load", "live")
+    @pytest.mark.api
+    @pytest.mark.performance
+    def test_load_on_local_server(self, live_teacher_api: TeacherAPI) -> None:
+        """
+        Тест смешанной нагрузки на локальный сервер учителей.
+
+        Args:
+            live_teacher_api (TeacherAPI): Клиент локального сервера
+        """
+        with allure.step("Подготовить учителей и операции"):
+            operations = teacher_operations(live_teacher_api, seed_teachers=10)
+
+        with allure.step("Запустить 100 rps на 0.5 с"):
+            report = run_load(operations, rate=100, duration=0.5, seed=1,
+                              mix={"get": 60, "list": 10, "search": 10, "create": 10, "update": 10})
+
+        with allure.step("Проверить отчет"):
+            assert report["total"]["count"] == report["scheduled"]
+            assert report["total"]["error_rate"] == 0
+            assert set(report["operations"]) <= {"get", "list", "search", "create", "update"}
+            allure.attach(format_report(report), name="Отчет нагрузки",
+                          attachment_type=allure.attachment_type.TEXT)
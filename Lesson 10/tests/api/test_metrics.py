@@ -0,0 +1,112 @@
+"""API тесты метрик HTTP запросов."""
+
+import pytest
+import allure
+
+from api.metrics import ClientMetrics, LatencyHistogram, endpoint_template
+from api.teacher_api import TeacherAPI
+from tools.teacher_server import TeacherServer
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Client Metrics")
+class TestClientMetrics:
+    """
+    Класс для тестирования метрик BaseAPIClient.
+    """
+
+    @allure.title("Тест шаблона эндпоинта")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "metrics")
+    @pytest.mark.api
+    def test_endpoint_template(self) -> None:
+        """
+        Тест замены идентификаторов на {id} и отбрасывания базового пути.
+        """
+        base_url = "http://host/api/v1"
+        assert endpoint_template("http://host/api/v1/teachers/42", base_url) == "teachers/{id}"
+        assert endpoint_template("http://host/api/v1/teachers", base_url) == "teachers"
+        assert endpoint_template("http://host/api/v1/groups/7/teachers", base_url) == "groups/{id}/teachers"
+
+    @allure.title("Тест квантилей гистограммы")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "metrics")
+    @pytest.mark.api
+    def test_histogram_quantiles(self) -> None:
+        """
+        Тест оценки квантилей по корзинам.
+        """
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.observe(0.003)
+        histogram.observe(2.0)
+
+        assert histogram.quantile(0.5) <= 0.005
+        assert 1.0 < histogram.quantile(0.999) <= 2.0
+        assert histogram.to_dict()['count'] == 100
+
+    @allure.title("Тест метрик запросов к живому серверу")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "metrics", "performance")
+    @pytest.mark.api
+    @pytest.mark.performance
+    def test_metrics_recorded(self, teacher_server: TeacherServer) -> None:
+        """
+        Тест учета задержек, статусов, трафика и переиспользования соединений.
+
+        Args:
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        for teacher_id in range(1, 11):
+            teacher_server.store.create({'email': f't{teacher_id}@test.com', 'group_id': 100})
+        metrics = ClientMetrics()
+        api = TeacherAPI(teacher_server.url, metrics=metrics)
+
+        with allure.step("Выполнить 10 успешных запросов и один с 404"):
+            for teacher_id in range(1, 11):
+                assert api.get_teacher_by_id(teacher_id)['teacher_id'] == teacher_id
+            assert api.get_teacher_by_id(101) is None
+
+        with allure.step("Проверить метрики эндпоинта"):
+            data = metrics.to_dict()
+            endpoint = data['endpoints'][0]
+            assert (endpoint['method'], endpoint['endpoint']) == ('GET', 'teachers/{id}')
+            assert endpoint['statuses'] == {'200': 10, '404': 1}
+            assert endpoint['latency']['count'] == 11
+            assert endpoint['bytes_in'] > 0
+            assert data['connections'] == {'requests': 11, 'connections': 1, 'reuse_ratio': pytest.approx(10 / 11)}
+
+        with allure.step("Проверить экспорт в Prometheus"):
+            text = metrics.to_prometheus()
+            assert ('api_client_responses_total{method="GET",endpoint="teachers/{id}",status="404"} 1'
+                    in text)
+            assert ('api_client_request_duration_seconds_count{method="GET",endpoint="teachers/{id}"} 11'
+                    in text)
+
+    @allure.title("Тест метрик потоковых ответов")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "metrics", "stream")
+    @pytest.mark.api
+    def test_metrics_streamed_response(self, teacher_server: TeacherServer) -> None:
+        """
+        Тест что учет трафика не читает тело потокового ответа и совпадает с обычным.
+
+        Args:
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        for teacher_id in range(1, 51):
+            teacher_server.store.create({'email': f't{teacher_id}@test.com', 'group_id': 100})
+        buffered_metrics, streamed_metrics = ClientMetrics(), ClientMetrics()
+        buffered = TeacherAPI(teacher_server.url, metrics=buffered_metrics)
+        streamed = TeacherAPI(teacher_server.url, metrics=streamed_metrics, stream_lists=True)
+
+        with allure.step("Потоковый список читается целиком после учета метрик"):
+            assert streamed.get_all_teachers() == buffered.get_all_teachers()
+
+        with allure.step("Входящий трафик потокового ответа равен обычному"):
+            listing = streamed_metrics.to_dict()['endpoints'][0]
+            expected = buffered_metrics.to_dict()['endpoints'][0]
+            assert listing['bytes_in'] == expected['bytes_in'] > 0
+            # Размер распакованного потокового тела на момент учета неизвестен
+            assert listing['bytes_in_raw'] == listing['bytes_in']
@@ -0,0 +1,178 @@
+"""Тесты адаптивного ограничителя частоты запросов."""
+
+import threading
+import time
+from typing import List, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+import allure
+
+from api.rate_limiter import AdaptiveRateLimiter
+from api.resilience import RetryPolicy
+from api.teacher_api import TeacherAPI
+
+
+class FakeClock:
+    """
+    Управляемое время: sleep сдвигает часы без ожидания.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Rate Limiter")
+class TestAdaptiveRateLimiter:
+    """
+    Класс для тестирования ограничителя частоты запросов.
+    """
+
+    @allure.title("Тест равномерной выдачи токенов")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "rate-limit")
+    @pytest.mark.api
+    def test_token_bucket_pacing(self) -> None:
+        """
+        Тест что после исчерпания корзины запросы идут со скоростью rate.
+        """
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(rate=10, burst=2, clock=clock, sleep=clock.sleep)
+
+        waits = [limiter.acquire() for _ in range(12)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert all(wait == pytest.approx(0.1) for wait in waits[2:])
+        assert clock.now == pytest.approx(1.0)
+
+    @allure.title("Тест AIMD и Retry-After")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "rate-limit")
+    @pytest.mark.api
+    def test_aimd_and_retry_after(self) -> None:
+        """
+        Тест снижения скорости по 429 с паузой Retry-After и роста после успехов.
+        """
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(rate=40, burst=1, cooldown=1.0, clock=clock, sleep=clock.sleep)
+
+        with allure.step("Пачка 429 снижает скорость один раз"):
+            limiter.on_response(429, 0.01, retry_after=2.0)
+            limiter.on_response(429, 0.01, retry_after=2.0)
+            assert limiter.rate == 20
+            assert limiter.stats['decreases'] == 1
+            assert limiter.stats['throttled'] == 2
+
+        with allure.step("Запросы ждут конца Retry-After"):
+            assert limiter.acquire() == pytest.approx(2.0 + 1 / 20)
+
+        with allure.step("Успехи увеличивают скорость аддитивно"):
+            for _ in range(20):
+                limiter.on_response(200, 0.01)
+            assert 20.9 < limiter.rate < 21.1
+
+        with allure.step("Медленный ответ и таймаут — признаки перегрузки"):
+            limiter.latency_target = 0.5
+            clock.now += 1.0
+            limiter.on_response(200, 0.8)
+            assert limiter.rate == pytest.approx(10.5, rel=0.01)
+            clock.now += 1.0
+            limiter.on_timeout()
+            assert limiter.rate == pytest.approx(5.25, rel=0.01)
+
+    @allure.title("Тест схождения к пропускной способности сервера")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "rate-limit", "performance")
+    @pytest.mark.api
+    @pytest.mark.performance
+    def test_converges_to_server_capacity(self) -> None:
+        """
+        Тест на модели сервера с лимитом 100 запросов/сек: ограничитель выходит
+        на пропускную способность без постоянных 429.
+        """
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(rate=20, burst=1, increase=5, clock=clock, sleep=clock.sleep)
+        capacity, server_tokens, server_updated = 100.0, 1.0, 0.0
+        statuses: List[Tuple[float, int]] = []
+
+        while clock.now < 60:
+            limiter.acquire()
+            server_tokens = min(1.0, server_tokens + (clock.now - server_updated) * capacity)
+            server_updated = clock.now
+            if server_tokens >= 1:
+                server_tokens -= 1
+                status = 200
+            else:
+                status = 429
+            statuses.append((clock.now, status))
+            limiter.on_response(status, 0.005)
+
+        # Установившийся режим: вторые 30 секунд
+        steady = [status for moment, status in statuses if moment >= 30]
+        throughput = steady.count(200) / 30
+        allure.attach(f"{throughput:.1f} запросов/сек, 429: {steady.count(429)}",
+                      name="Пропускная способность", attachment_type=allure.attachment_type.TEXT)
+        # Пила AIMD в среднем держит около 3/4 пропускной способности
+        assert throughput > 65
+        assert steady.count(429) / len(steady) < 0.05
+
+    @allure.title("Тест ограничителя в BaseAPIClient")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "rate-limit")
+    @pytest.mark.api
+    def test_client_integration(self) -> None:
+        """
+        Тест что клиент ждет ограничитель перед попыткой и передает ему 429 с Retry-After.
+        """
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(rate=100, burst=1, clock=clock, sleep=clock.sleep)
+        api = TeacherAPI("http://test-api.local/api/v1", rate_limiter=limiter,
+                         retry_policy=RetryPolicy(sleep=clock.sleep))
+        throttled = Mock(status_code=429, headers={'Retry-After': '1'})
+        ok = Mock(status_code=200, headers={}, **{'json.return_value': {'teacher_id': 1}})
+
+        with patch.object(api.session, 'request', side_effect=[throttled, ok]):
+            assert api.get_teacher_by_id(1) == {'teacher_id': 1}
+
+        assert limiter.stats['acquired'] == 2
+        assert limiter.stats['throttled'] == 1
+        assert limiter.rate == pytest.approx(50, rel=0.01)
+
+    @allure.title("Тест общего ограничителя для потоков")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "rate-limit", "concurrency")
+    @pytest.mark.api
+    def test_shared_between_threads(self) -> None:
+        """
+        Тест что потоки вместе не превышают скорость ограничителя.
+        """
+        limiter = AdaptiveRateLimiter(rate=200, burst=1)
+        acquired: List[float] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            for _ in range(10):
+                limiter.acquire()
+                with lock:
+                    acquired.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.monotonic() - started
+        assert len(acquired) == 80
+        assert elapsed >= 79 / 200 * 0.9
@@ -0,0 +1,262 @@
+"""API тесты повторов запросов и circuit breaker."""
+
+from typing import List
+from unittest.mock import Mock, patch
+
+import pytest
+import allure
+import requests
+
+from api.base_client import BaseAPIClient
+from api.resilience import (
+    CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError, ProbeToken, RetryPolicy
+)
+from tests.api.test_http_cache import make_response
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Resilience")
+class TestResilience:
+    """
+    Класс для тестирования повторов и circuit breaker в BaseAPIClient.
+    """
+
+    @pytest.fixture
+    def delays(self) -> List[float]:
+        """
+        Фикстура для сбора задержек вместо реального ожидания.
+
+        Returns:
+            List[float]: Список задержек перед повторами
+        """
+        return []
+
+    @pytest.fixture
+    def client(self, delays: List[float]) -> BaseAPIClient:
+        """
+        Фикстура для создания клиента с политикой повторов.
+
+        Args:
+            delays (List[float]): Список для сбора задержек
+
+        Returns:
+            BaseAPIClient: Клиент с тремя попытками без джиттера
+        """
+        policy = RetryPolicy(max_attempts=3, backoff_factor=0.5, jitter=False, sleep=delays.append)
+        return BaseAPIClient("http://test-api.local", retry_policy=policy)
+
+    @allure.title("Тест повтора GET после 503")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "retry")
+    @pytest.mark.api
+    def test_get_retried_with_backoff(self, client: BaseAPIClient, delays: List[float]) -> None:
+        """
+        Тест что GET повторяется с экспоненциальной задержкой.
+
+        Args:
+            client (BaseAPIClient): Клиент с повторами
+            delays (List[float]): Задержки перед повторами
+        """
+        with allure.step("Сервер дважды отвечает 503, затем 200"):
+            with patch.object(client.session, 'request') as mock_request:
+                mock_request.side_effect = [
+                    make_response(503), make_response(503), make_response(200, {'ok': True})
+                ]
+                response = client.get("teachers/1")
+
+        with allure.step("Проверить ответ, задержки и счетчики"):
+            assert response.json() == {'ok': True}
+            assert delays == [0.5, 1.0]
+            assert client.stats['attempts'] == 3
+            assert client.stats['retries'] == 2
+
+    @allure.title("Тест заголовка Retry-After")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "retry")
+    @pytest.mark.api
+    def test_retry_after_honored(self, client: BaseAPIClient, delays: List[float]) -> None:
+        """
+        Тест что Retry-After имеет приоритет над вычисленной задержкой.
+
+        Args:
+            client (BaseAPIClient): Клиент с повторами
+            delays (List[float]): Задержки перед повторами
+        """
+        with allure.step("Сервер отвечает 429 с Retry-After: 3"):
+            with patch.object(client.session, 'request') as mock_request:
+                mock_request.side_effect = [
+                    make_response(429, headers={'Retry-After': '3'}), make_response(200, [])
+                ]
+                client.get("teachers")
+
+        with allure.step("Проверить задержку"):
+            assert delays == [3.0]
+
+    @allure.title("Тест что POST не повторяется")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "retry", "negative")
+    @pytest.mark.api
+    @pytest.mark.negative
+    def test_post_not_retried(self, client: BaseAPIClient) -> None:
+        """
+        Тест что неидемпотентный POST не повторяется.
+
+        Args:
+            client (BaseAPIClient): Клиент с повторами
+        """
+        with allure.step("Сервер отвечает 503 на POST"):
+            with patch.object(client.session, 'request') as mock_request:
+                mock_request.return_value = make_response(503)
+                with pytest.raises(requests.HTTPError):
+                    client.post("teachers", data={'email': 'a@test.com'})
+
+        with allure.step("Проверить что запрос был один"):
+            assert mock_request.call_count == 1
+
+    @allure.title("Тест повтора после ошибки соединения")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "retry")
+    @pytest.mark.api
+    def test_connection_error_retried(self, client: BaseAPIClient) -> None:
+        """
+        Тест что ошибка соединения повторяется, а после исчерпания попыток пробрасывается.
+
+        Args:
+            client (BaseAPIClient): Клиент с повторами
+        """
+        with allure.step("Соединение сбрасывается на каждой попытке"):
+            with patch.object(client.session, 'request') as mock_request:
+                mock_request.side_effect = requests.ConnectionError("reset")
+                with pytest.raises(requests.ConnectionError):
+                    client.delete("teachers/1")
+
+        with allure.step("Проверить количество попыток"):
+            assert mock_request.call_count == 3
+
+    @allure.title("Тест размыкания circuit breaker")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "circuit-breaker")
+    @pytest.mark.api
+    def test_breaker_opens_and_fails_fast(self) -> None:
+        """
+        Тест что после серии ошибок запросы отклоняются без обращения к серверу.
+        """
+        breakers = CircuitBreakerRegistry(min_requests=4, window_size=4, open_duration=60)
+        client = BaseAPIClient("http://test-api.local", circuit_breakers=breakers)
+
+        with allure.step("Получить четыре ответа 500, затем попробовать еще раз"):
+            with patch.object(client.session, 'request') as mock_request:
+                mock_request.return_value = make_response(500)
+                for _ in range(4):
+                    with pytest.raises(requests.HTTPError):
+                        client.get("teachers")
+                with pytest.raises(CircuitOpenError):
+                    client.get("teachers")
+
+        with allure.step("Проверить счетчики"):
+            assert mock_request.call_count == 4
+            assert client.stats['short_circuited'] == 1
+            stats = breakers.stats()['test-api.local']
+            assert stats['state'] == CircuitBreaker.OPEN
+            assert stats['rejected'] == 1
+
+    @allure.title("Тест восстановления через half-open")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "circuit-breaker")
+    @pytest.mark.api
+    def test_breaker_half_open_probe(self) -> None:
+        """
+        Тест что после open_duration пропускается один пробный запрос.
+        """
+        now = [0.0]
+        breaker = CircuitBreaker(min_requests=2, window_size=2, open_duration=5, clock=lambda: now[0])
+
+        with allure.step("Разомкнуть breaker двумя ошибками"):
+            breaker.record_failure()
+            breaker.record_failure()
+            assert not breaker.allow_request()
+
+        with allure.step("После open_duration пропускается только один запрос"):
+            now[0] = 5.0
+            probe = breaker.allow_request()
+            assert isinstance(probe, ProbeToken)
+            assert not breaker.allow_request()
+
+        with allure.step("Успешный пробный запрос замыкает breaker"):
+            breaker.record_success(probe)
+            assert breaker.state == CircuitBreaker.CLOSED
+            assert breaker.allow_request() is True
+
+    @allure.title("Тест потерянного пробного запроса")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "circuit-breaker")
+    @pytest.mark.api
+    def test_breaker_lost_probe_released(self) -> None:
+        """
+        Тест что проба без результата не блокирует хост: release_probe или probe_timeout
+        освобождают место пробного запроса.
+        """
+        now = [0.0]
+        breaker = CircuitBreaker(min_requests=2, window_size=2, open_duration=5,
+                                 probe_timeout=2, clock=lambda: now[0])
+        breaker.record_failure()
+        breaker.record_failure()
+
+        with allure.step("release_probe освобождает место пробы"):
+            now[0] = 5.0
+            breaker.release_probe(breaker.allow_request())
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            lost = breaker.allow_request()
+            assert lost
+            assert not breaker.allow_request()
+
+        with allure.step("Проба без результата истекает через probe_timeout"):
+            now[0] = 7.0
+            probe = breaker.allow_request()
+            assert probe and probe is not lost
+            breaker.record_success(lost)
+            breaker.release_probe(lost)
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert not breaker.allow_request()
+            breaker.record_success(probe)
+            assert breaker.state == CircuitBreaker.CLOSED
+
+    @allure.title("Тест результата запроса, начатого до размыкания")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "circuit-breaker", "concurrency")
+    @pytest.mark.api
+    def test_breaker_closed_era_outcome_during_probe(self) -> None:
+        """
+        Тест что результат запроса, пропущенного в замкнутом состоянии, не замыкает
+        half-open breaker и не освобождает место чужой пробы.
+        """
+        now = [0.0]
+        breakers = CircuitBreakerRegistry(min_requests=2, window_size=2, open_duration=5,
+                                          clock=lambda: now[0])
+        breaker = breakers.get('test-api.local')
+        client = BaseAPIClient("http://test-api.local/api/v1", circuit_breakers=breakers)
+        pending = []
+
+        def slow_response(*args, **kwargs) -> Mock:
+            # Пока запрос идет, другие запросы размыкают breaker и начинают пробу
+            breaker.record_failure()
+            breaker.record_failure()
+            now[0] = 5.0
+            pending.append(breaker.allow_request())
+            return Mock(status_code=200, headers={})
+
+        with allure.step("Запрос, начатый в замкнутом состоянии, завершается во время пробы"):
+            with patch.object(client.session, 'request', side_effect=slow_response):
+                client.get("teachers/1")
+            assert isinstance(pending[0], ProbeToken)
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            assert not breaker.allow_request()
+
+        with allure.step("Ошибка запроса без токена тоже не меняет half-open"):
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        with allure.step("Состояние меняет только результат пробы"):
+            breaker.record_failure(pending[0])
+            assert breaker.state == CircuitBreaker.OPEN
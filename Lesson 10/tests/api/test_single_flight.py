@@ -0,0 +1,122 @@
+"""Тесты объединения одновременных одинаковых запросов."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+import allure
+
+from api.single_flight import SingleFlight
+from api.teacher_api import TeacherAPI
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Single Flight")
+class TestSingleFlight:
+    """
+    Класс для тестирования single-flight в API клиенте.
+    """
+
+    @allure.title("Тест одного вызова на группу одновременных")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "concurrency")
+    @pytest.mark.api
+    def test_concurrent_calls_share_result(self) -> None:
+        """
+        Тест что одновременные вызовы с одним ключом выполняют функцию один раз.
+        """
+        group = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch() -> dict:
+            calls.append(None)
+            release.wait(5)
+            return {'teacher_id': 1}
+
+        with allure.step("Запустить 10 одновременных вызовов"):
+            with ThreadPoolExecutor(max_workers=10) as pool:
+                futures = [pool.submit(group.do, 1, fetch) for _ in range(10)]
+                while group.stats['executed'] + group.stats['shared'] < 10:
+                    time.sleep(0.001)
+                release.set()
+                results = [future.result() for future in futures]
+
+        with allure.step("Проверить результаты"):
+            assert len(calls) == 1
+            assert results == [{'teacher_id': 1}] * 10
+            assert all(result is results[0] for result in results)
+            assert group.stats == {'executed': 1, 'shared': 9}
+
+    @allure.title("Тест передачи исключения ожидающим")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "concurrency", "negative")
+    @pytest.mark.api
+    @pytest.mark.negative
+    def test_error_shared(self) -> None:
+        """
+        Тест что исключение получает и выполняющий, и ожидающий поток.
+        """
+        group = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch() -> None:
+            started.set()
+            release.wait(5)
+            raise ConnectionError("reset")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(group.do, 'key', fetch)
+            started.wait(5)
+            follower = pool.submit(group.do, 'key', fetch)
+            while group.stats['shared'] < 1:
+                time.sleep(0.001)
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(ConnectionError):
+                    future.result()
+
+        with allure.step("Следующий вызов выполняется заново"):
+            assert group.do('key', lambda: 'ok') == 'ok'
+            assert group.stats['executed'] == 2
+
+    @allure.title("Тест объединения get_teacher_by_id")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "get", "concurrency")
+    @pytest.mark.api
+    @pytest.mark.performance
+    def test_get_teacher_by_id_coalesced(self) -> None:
+        """
+        Тест что одновременные запросы одного учителя дают один GET,
+        а после изменения учителя запрос выполняется заново.
+        """
+        api = TeacherAPI("http://test-api.local/api/v1", coalesce=True)
+
+        def slow_get(endpoint: str) -> Mock:
+            time.sleep(0.1)
+            return Mock(**{'json.return_value': {'teacher_id': 1, 'email': 'a@test.com'}})
+
+        with patch.object(api, 'get', side_effect=slow_get) as mock_get:
+            with allure.step("Запросить учителя из 16 потоков"):
+                with ThreadPoolExecutor(max_workers=16) as pool:
+                    results = list(pool.map(lambda _: api.get_teacher_by_id(1), range(16)))
+
+            with allure.step("Проверить что GET был один"):
+                assert mock_get.call_count == 1
+                assert all(result['teacher_id'] == 1 for result in results)
+
+        with allure.step("Чтение после изменения не присоединяется к начатому до него"):
+            with patch.object(api, 'get', side_effect=slow_get) as mock_get, \
+                    patch.object(api.session, 'request', return_value=Mock(status_code=204)):
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    before = pool.submit(api.get_teacher_by_id, 1)
+                    while not api.single_flight._calls:
+                        time.sleep(0.001)
+                    api.delete_teacher(1)
+                    after = pool.submit(api.get_teacher_by_id, 1)
+                    before.result(), after.result()
+                assert mock_get.call_count == 2
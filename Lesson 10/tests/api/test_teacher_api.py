@@ -239,20 +239,18 @@ class TestTeacherAPI:
             teacher_api (TeacherAPI): Экземпляр API клиента
         """
         teacher_id = 12345
-        mock_response_data = {
-            'teacher_id': teacher_id,
-            'email': 'teacher@test.com',
-            'group_id': 100
-        }
         
         with allure.step(f"Проверить существование учителя с ID={teacher_id}"):
-            with patch.object(teacher_api, 'get_teacher_by_id') as mock_get:
-                mock_get.return_value = mock_response_data
+            with patch.object(teacher_api.session, 'request') as mock_request:
+                mock_request.return_value = Mock(status_code=200)
                 
                 result = teacher_api.teacher_exists(teacher_id)
         
         with allure.step("Проверить результат"):
             assert result is True, "Учитель должен существовать"
+            method, url = mock_request.call_args.args
+            assert method == "HEAD", "Существование проверяется без тела ответа"
+            assert url.endswith(f"/teachers/{teacher_id}")
     
     @allure.title("Тест проверки несуществующего учителя")
     @allure.description("Проверка метода проверки несуществующего учителя")
@@ -269,14 +267,61 @@ class TestTeacherAPI:
         teacher_id = 999999
         
         with allure.step(f"Проверить существование несуществующего учителя с ID={teacher_id}"):
-            with patch.object(teacher_api, 'get_teacher_by_id') as mock_get:
-                mock_get.return_value = None
+            with patch.object(teacher_api, 'head') as mock_head:
+                mock_head.side_effect = requests.HTTPError(response=Mock(status_code=404))
                 
                 result = teacher_api.teacher_exists(teacher_id)
         
         with allure.step("Проверить результат"):
             assert result is False, "Учитель не должен существовать"
     
+    @allure.title("Тест проверки существования без поддержки HEAD")
+    @allure.description("Проверка перехода на GET, если сервер отвечает 405 на HEAD")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "get", "positive")
+    @pytest.mark.api
+    def test_teacher_exists_head_not_allowed(self, teacher_api: TeacherAPI) -> None:
+        """
+        Тест что при 405 на HEAD используется GET, в том числе для следующих проверок.
+        
+        Args:
+            teacher_api (TeacherAPI): Экземпляр API клиента
+        """
+        with patch.object(teacher_api, 'head') as mock_head, \
+                patch.object(teacher_api, 'get') as mock_get:
+            mock_head.side_effect = requests.HTTPError(response=Mock(status_code=405))
+            mock_get.side_effect = [Mock(), requests.HTTPError(response=Mock(status_code=404))]
+            
+            with allure.step("Проверить существующего и несуществующего учителя"):
+                assert teacher_api.teacher_exists(1) is True
+                assert teacher_api.teacher_exists(2) is False
+        
+        with allure.step("Проверить что HEAD отправлен один раз"):
+            assert mock_head.call_count == 1
+            assert mock_get.call_count == 2
+    
+    @allure.title("Тест ошибки соединения при проверке существования")
+    @allure.description("Ошибка соединения не должна считаться отсутствием учителя")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "get", "negative")
+    @pytest.mark.api
+    @pytest.mark.negative
+    @pytest.mark.parametrize("error", [
+        requests.ConnectionError("connection refused"),
+        requests.HTTPError(response=Mock(status_code=500)),
+    ])
+    def test_teacher_exists_error_raised(self, teacher_api: TeacherAPI, error: Exception) -> None:
+        """
+        Тест что ошибки кроме 404 пробрасываются вызывающему коду.
+        
+        Args:
+            teacher_api (TeacherAPI): Экземпляр API клиента
+            error (Exception): Ошибка HEAD запроса
+        """
+        with patch.object(teacher_api, 'head', side_effect=error):
+            with pytest.raises(type(error)):
+                teacher_api.teacher_exists(1)
+    
     @allure.title("Тест получения учителей по группе")
     @allure.description("Проверка фильтрации учителей по ID группы")
     @allure.severity(allure.severity_level.NORMAL)
@@ -339,6 +384,34 @@ class TestTeacherAPI:
             assert result[0]['email'] == search_email, "Email не совпадает"
             mock_get.assert_called_once_with("teachers", params={"email": search_email})
 
+    
+    @allure.title("Тест постраничного обхода учителей")
+    @allure.description("Проверка keyset пагинации по limit/after_id")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "get", "pagination")
+    @pytest.mark.api
+    def test_iter_teachers_pages(self, teacher_api: TeacherAPI) -> None:
+        """
+        Тест обхода учителей страницами по teacher_id.
+        
+        Args:
+            teacher_api (TeacherAPI): Экземпляр API клиента
+        """
+        pages = [
+            [{'teacher_id': 1, 'email': 'a@test.com', 'group_id': 100},
+             {'teacher_id': 2, 'email': 'b@test.com', 'group_id': 100}],
+            [{'teacher_id': 3, 'email': 'c@test.com', 'group_id': 101}],
+        ]
+        
+        with allure.step("Обойти учителей страницами по 2"):
+            with patch.object(teacher_api, 'get') as mock_get:
+                mock_get.side_effect = [Mock(**{'json.return_value': page}) for page in pages]
+                
+                result = list(teacher_api.iter_teachers(page_size=2))
+        
+        with allure.step("Проверить результат"):
+            assert [teacher['teacher_id'] for teacher in result] == [1, 2, 3]
+            assert mock_get.call_args_list[1].kwargs == {'params': {'limit': 2, 'after_id': 2}}
 
 @allure.epic("SkyPro QA Homework")
 @allure.feature("API Tests")
@@ -410,4 +483,68 @@ class TestBaseAPIClient:
             
             # Проверка без ведущего слеша в endpoint
             url2 = client._build_url("teachers")
-            assert url2 == "http://test-api.local/teachers", f"URL построен неверно: {url2}"
\ No newline at end of file
+            assert url2 == "http://test-api.local/teachers", f"URL построен неверно: {url2}"
+    
+    @allure.title("Тест настройки пула соединений")
+    @allure.description("Проверка HTTPAdapter с заданными размерами пула")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "pool")
+    @pytest.mark.api
+    def test_pool_adapter_configured(self) -> None:
+        """
+        Тест монтирования адаптера с настройками пула.
+        """
+        from api.base_client import BaseAPIClient
+        
+        with allure.step("Создать API клиент с пулом на 50 соединений"):
+            client = BaseAPIClient("http://test-api.local", pool_maxsize=50, pool_block=True)
+        
+        with allure.step("Проверить адаптеры http и https"):
+            for prefix in ("http://", "https://"):
+                adapter = client.session.get_adapter(prefix + "test-api.local")
+                assert adapter._pool_maxsize == 50, "Размер пула не применен"
+                assert adapter._pool_block is True, "pool_block не применен"
+    
+    @allure.title("Тест передачи таймаутов в каждый запрос")
+    @allure.description("Проверка что connect/read таймауты передаются в requests")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "timeout")
+    @pytest.mark.api
+    def test_timeout_passed_to_every_request(self) -> None:
+        """
+        Тест передачи таймаутов во все HTTP методы.
+        """
+        from api.base_client import BaseAPIClient
+        
+        client = BaseAPIClient("http://test-api.local", timeout=7, connect_timeout=2)
+        
+        with allure.step("Выполнить GET, POST, PUT и DELETE"):
+            with patch.object(client.session, 'request') as mock_request:
+                client.get("teachers")
+                client.post("teachers", data={})
+                client.put("teachers/1", data={})
+                client.delete("teachers/1")
+        
+        with allure.step("Проверить таймауты"):
+            assert [call.kwargs['timeout'] for call in mock_request.call_args_list] == [(2, 7)] * 4
+    
+    @allure.title("Тест таймаута чтения при зависшем сервере")
+    @allure.description("Проверка что зависший сервер не блокирует клиента")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "timeout", "negative")
+    @pytest.mark.api
+    def test_read_timeout_on_hung_server(self) -> None:
+        """
+        Тест срабатывания таймаута чтения на сервере, который не отвечает.
+        """
+        import socket
+        from api.base_client import BaseAPIClient
+        
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            client = BaseAPIClient(f"http://127.0.0.1:{server.getsockname()[1]}", timeout=0.2)
+            
+            with allure.step("Проверить что выброшено исключение Timeout"):
+                with pytest.raises(requests.Timeout):
+                    client.get("teachers")
@@ -0,0 +1,91 @@
+"""API тесты пакетных операций с учителями."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import allure
+import requests
+
+from api.teacher_api import TeacherAPI
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Teacher API Bulk Operations")
+class TestTeacherAPIBulk:
+    """
+    Класс для тестирования пакетных операций через пул потоков.
+    """
+    
+    @pytest.fixture
+    def teacher_api(self) -> TeacherAPI:
+        """
+        Фикстура для создания экземпляра TeacherAPI.
+        
+        Returns:
+            TeacherAPI: Экземпляр API клиента
+        """
+        return TeacherAPI(base_url="http://test-api.local/api/v1", pool_maxsize=8)
+    
+    @allure.title("Тест пакетного создания с сохранением порядка")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "post", "bulk")
+    @pytest.mark.api
+    def test_create_teachers_preserves_order(self, teacher_api: TeacherAPI) -> None:
+        """
+        Тест что результаты идут в порядке входных данных, а ошибки собираются.
+        
+        Args:
+            teacher_api (TeacherAPI): Экземпляр API клиента
+        """
+        teachers = [{'email': f't{i}@test.com', 'group_id': 100} for i in range(20)]
+        
+        def fake_post(endpoint, data=None):
+            # Поздние элементы отвечают быстрее, чтобы перемешать порядок завершения
+            time.sleep(0.001 * (20 - int(data['email'][1:].split('@')[0])))
+            if data['email'] == 't7@test.com':
+                raise requests.HTTPError("409 Conflict")
+            return Mock(**{'json.return_value': dict(data, teacher_id=hash(data['email']))})
+        
+        with allure.step("Создать 20 учителей пачкой"):
+            with patch.object(teacher_api, 'post', side_effect=fake_post):
+                report = teacher_api.create_teachers(teachers)
+        
+        with allure.step("Проверить результат"):
+            assert report['succeeded'] == 19 and report['failed'] == 1
+            assert report['errors'][0]['index'] == 7
+            assert "409" in report['errors'][0]['error']
+            assert report['results'][7] is None
+            assert [r['email'] for i, r in enumerate(report['results']) if i != 7] == \
+                [t['email'] for i, t in enumerate(teachers) if i != 7]
+            assert report['throughput'] > 0
+    
+    @allure.title("Тест пакетного обновления и удаления")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "put", "delete", "bulk")
+    @pytest.mark.api
+    def test_update_and_delete_teachers(self, teacher_api: TeacherAPI) -> None:
+        """
+        Тест пакетного обновления и удаления с ошибкой одного элемента.
+        
+        Args:
+            teacher_api (TeacherAPI): Экземпляр API клиента
+        """
+        def fake_delete(endpoint):
+            if endpoint == "teachers/2":
+                raise requests.HTTPError("404 Not Found")
+            return Mock()
+        
+        with allure.step("Обновить и удалить учителей пачкой"):
+            with patch.object(teacher_api, 'put') as mock_put, \
+                    patch.object(teacher_api, 'delete', side_effect=fake_delete):
+                mock_put.return_value.json.return_value = {'teacher_id': 1}
+                updated = teacher_api.update_teachers([(1, {'email': 'a@test.com'})])
+                deleted = teacher_api.delete_teachers([1, 2, 3])
+        
+        with allure.step("Проверить результат"):
+            mock_put.assert_called_once_with("teachers/1", data={'email': 'a@test.com'})
+            assert updated['results'] == [{'teacher_id': 1}]
+            assert deleted['results'] == [True, None, True]
+            assert deleted['errors'][0]['item'] == 2
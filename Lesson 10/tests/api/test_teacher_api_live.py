@@ -0,0 +1,215 @@
+"""API тесты учителей на локальном HTTP сервере без моков."""
+
+from unittest.mock import patch
+
+import pytest
+import allure
+import requests
+from sqlalchemy import create_engine, text
+
+from api.teacher_api import TeacherAPI
+from database.teacher_table import TeacherTable
+from data.test_data import VALID_TEACHERS
+from tools.teacher_server import TableTeacherStore, TeacherServer
+
+
+# Данные без teacher_id: ID назначает сервер
+NEW_TEACHERS = [{'email': t['email'], 'group_id': t['group_id']} for t in VALID_TEACHERS]
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Teacher API Live")
+class TestTeacherAPILive:
+    """
+    Класс для тестирования TeacherAPI через настоящий HTTP: сериализация,
+    статусы и пул соединений проверяются на локальном сервере.
+    """
+
+    @allure.title("Тест CRUD операций через HTTP")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "crud", "live")
+    @pytest.mark.api
+    @pytest.mark.crud
+    def test_crud(self, live_teacher_api: TeacherAPI) -> None:
+        """
+        Тест создания, чтения, обновления и удаления учителя.
+
+        Args:
+            live_teacher_api (TeacherAPI): Клиент локального сервера
+        """
+        with allure.step("Создать учителя"):
+            created = live_teacher_api.create_teacher({'email': 'live@test.com', 'group_id': 100})
+            assert created == {'teacher_id': 1, 'email': 'live@test.com', 'group_id': 100}
+
+        with allure.step("Получить и обновить учителя"):
+            assert live_teacher_api.get_teacher_by_id(1) == created
+            updated = live_teacher_api.update_teacher_email(1, 'new@test.com')
+            assert updated['email'] == 'new@test.com'
+
+        with allure.step("Удалить учителя"):
+            assert live_teacher_api.delete_teacher(1)
+            assert live_teacher_api.get_teacher_by_id(1) is None
+            assert not live_teacher_api.teacher_exists(1)
+
+    @allure.title("Тест пакетной проверки существования через HEAD")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "get", "live")
+    @pytest.mark.api
+    def test_teachers_exist(self, live_teacher_api: TeacherAPI) -> None:
+        """
+        Тест teachers_exist для существующих и удаленных учителей.
+
+        Args:
+            live_teacher_api (TeacherAPI): Клиент локального сервера
+        """
+        with allure.step("Создать трех учителей и удалить второго"):
+            ids = [live_teacher_api.create_teacher(t)['teacher_id'] for t in NEW_TEACHERS]
+            ids.append(live_teacher_api.create_teacher({'email': 'third@test.com', 'group_id': 100})['teacher_id'])
+            live_teacher_api.delete_teacher(ids[1])
+
+        with allure.step("Проверить существование пачкой"):
+            report = live_teacher_api.teachers_exist(ids + [999])
+            assert report['results'] == [True, False, True, False]
+            assert report['failed'] == 0
+
+        with allure.step("Ошибка соединения попадает в errors, а не в False"):
+            offline = TeacherAPI("http://127.0.0.1:9/api/v1", connect_timeout=0.5)
+            report = offline.teachers_exist([1])
+            assert report['results'] == [None]
+            assert report['failed'] == 1
+
+        with allure.step("Получить учителей по списку ID"):
+            report = live_teacher_api.get_teachers_by_ids(ids + [999])
+            assert list(report['teachers']) == [ids[0], ids[2]]
+            assert report['teachers'][ids[2]]['email'] == 'third@test.com'
+            assert report['missing'] == [ids[1], 999]
+            assert report['errors'] == {}
+
+    @allure.title("Тест фильтров и постраничного обхода")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "get", "live")
+    @pytest.mark.api
+    def test_filters_and_paging(self, live_teacher_api: TeacherAPI) -> None:
+        """
+        Тест фильтров group_id/email и keyset-пагинации.
+
+        Args:
+            live_teacher_api (TeacherAPI): Клиент локального сервера
+        """
+        with allure.step("Создать учителей пачкой"):
+            report = live_teacher_api.create_teachers(NEW_TEACHERS, max_workers=1)
+            assert report['failed'] == 0
+
+        with allure.step("Проверить фильтры"):
+            group_id = VALID_TEACHERS[0]['group_id']
+            expected = [t['email'] for t in VALID_TEACHERS if t['group_id'] == group_id]
+            assert sorted(t['email'] for t in live_teacher_api.get_teachers_by_group(group_id)) == sorted(expected)
+            found = live_teacher_api.search_teachers_by_email(VALID_TEACHERS[1]['email'])
+            assert [t['email'] for t in found] == [VALID_TEACHERS[1]['email']]
+
+        with allure.step("Обойти учителей страницами по 2"):
+            teachers = list(live_teacher_api.iter_teachers(page_size=2))
+            assert [t['teacher_id'] for t in teachers] == list(range(1, len(VALID_TEACHERS) + 1))
+
+    @allure.title("Тест ошибок валидации")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "post", "negative", "live")
+    @pytest.mark.api
+    @pytest.mark.negative
+    def test_invalid_teacher_rejected(self, live_teacher_api: TeacherAPI) -> None:
+        """
+        Тест что сервер отвечает 400 на некорректные данные и 409 на повтор ID.
+
+        Args:
+            live_teacher_api (TeacherAPI): Клиент локального сервера
+        """
+        with allure.step("Отправить некорректный email"):
+            with pytest.raises(requests.HTTPError) as error:
+                live_teacher_api.create_teacher({'email': 'invalid', 'group_id': 100})
+            assert error.value.response.status_code == 400
+
+        with allure.step("Повторить существующий teacher_id"):
+            live_teacher_api.create_teacher({'teacher_id': 5, 'email': 'a@test.com', 'group_id': 100})
+            with pytest.raises(requests.HTTPError) as error:
+                live_teacher_api.create_teacher({'teacher_id': 5, 'email': 'b@test.com', 'group_id': 100})
+            assert error.value.response.status_code == 409
+
+    @allure.title("Тест ответа 500 на ошибку хранилища")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "negative", "live")
+    @pytest.mark.api
+    @pytest.mark.negative
+    def test_store_error_returns_500(self, teacher_server: TeacherServer) -> None:
+        """
+        Тест что непредвиденная ошибка хранилища возвращает 500 с JSON телом.
+
+        Args:
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        teacher_server.store.create({'email': 'ok@test.com', 'group_id': 100})
+
+        with allure.step("Сломать чтение хранилища"):
+            with patch.object(teacher_server.store, 'get', side_effect=RuntimeError("диск недоступен")):
+                response = requests.get(f"{teacher_server.url}/teachers/1")
+            assert response.status_code == 500
+            assert response.json() == {'error': "RuntimeError: диск недоступен"}
+
+        with allure.step("Сервер продолжает обслуживать запросы"):
+            assert requests.get(f"{teacher_server.url}/teachers/1").json()['email'] == 'ok@test.com'
+
+    @allure.title("Тест ревалидации кеша по ETag")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "cache", "live")
+    @pytest.mark.api
+    def test_etag_revalidation(self, teacher_server: TeacherServer) -> None:
+        """
+        Тест что сервер отвечает 304 на If-None-Match и кеш клиента это использует.
+
+        Args:
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        api = TeacherAPI(teacher_server.url, cache_size=8)
+        api.create_teacher({'email': 'etag@test.com', 'group_id': 100})
+
+        with allure.step("Запросить учителя дважды"):
+            first = api.get_teacher_by_id(1)
+            second = api.get_teacher_by_id(1)
+
+        with allure.step("Проверить что второй ответ ревалидирован"):
+            assert first == second
+            assert api.cache.stats['revalidated'] == 1
+
+    @allure.title("Тест сервера поверх TeacherTable на SQLite")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "database", "live")
+    @pytest.mark.api
+    @pytest.mark.database
+    def test_table_store(self, tmp_path) -> None:
+        """
+        Тест что сервер работает с TeacherTable в качестве хранилища.
+
+        Args:
+            tmp_path: Временная директория pytest
+        """
+        url = f"sqlite:///{tmp_path / 'teachers.db'}"
+        engine = create_engine(url)
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE teacher (teacher_id INTEGER PRIMARY KEY, "
+                "email VARCHAR(255) NOT NULL, group_id INTEGER NOT NULL)"
+            ))
+        engine.dispose()
+
+        with TeacherServer(TableTeacherStore(TeacherTable(url))) as server:
+            api = TeacherAPI(server.url)
+            with allure.step("Создать и изменить учителей через API"):
+                api.create_teachers(NEW_TEACHERS + [{'email': 'third@test.com', 'group_id': 100}],
+                                    max_workers=1)
+                api.update_teacher_email(2, 'changed@test.com')
+                assert api.delete_teacher(3)
+
+            with allure.step("Проверить данные через API"):
+                teachers = api.get_all_teachers()
+                assert [t['teacher_id'] for t in teachers] == [1, 2]
+                assert teachers[1]['email'] == 'changed@test.com'
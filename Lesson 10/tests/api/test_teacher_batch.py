@@ -0,0 +1,112 @@
+"""Тесты колоночного представления списков учителей."""
+
+import random
+import sys
+
+import pytest
+import allure
+
+from api.teacher_api import TeacherAPI
+from api.teacher_batch import TeacherBatch
+from tools.teacher_server import TeacherServer
+
+
+def make_teachers(count: int, seed: int = 3) -> list:
+    """
+    Сгенерировать учителей с перемешанными группами и не-ASCII email.
+
+    Args:
+        count (int): Количество учителей
+        seed (int): Зерно генератора
+
+    Returns:
+        list: Словари учителей по возрастанию teacher_id
+    """
+    rng = random.Random(seed)
+    return [
+        {'teacher_id': number * 2 + 1, 'email': f'учитель{number}@школа.рф' if number % 7 == 0
+         else f'teacher{number}@test.com', 'group_id': rng.randrange(100, 110)}
+        for number in range(count)
+    ]
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Teacher Batch")
+class TestTeacherBatch:
+    """
+    Класс для тестирования TeacherBatch.
+    """
+
+    @allure.title("Тест совпадения со списком словарей")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "memory")
+    @pytest.mark.api
+    def test_rows_match_dicts(self) -> None:
+        """
+        Тест доступа к строкам, срезов, поиска по ID и фильтра по группе.
+        """
+        teachers = make_teachers(1000)
+        batch = TeacherBatch.from_dicts(iter(teachers))
+
+        with allure.step("Строки и срезы"):
+            assert len(batch) == 1000
+            assert batch == teachers
+            assert batch[-1] == teachers[-1]
+            assert batch.email(7) == teachers[7]['email']
+            assert batch[10:20] == teachers[10:20]
+            assert batch[::-3] == teachers[::-3]
+            with pytest.raises(IndexError):
+                batch[1000]
+
+        with allure.step("Поиск по ID"):
+            assert batch.get(teachers[500]['teacher_id']) == teachers[500]
+            assert batch.get(2) is None
+            assert batch[::-1].get(teachers[3]['teacher_id']) == teachers[3]
+
+        with allure.step("Фильтр и подсчет по группам"):
+            for group_id in range(100, 111):
+                expected = [t for t in teachers if t['group_id'] == group_id]
+                assert batch.filter_by_group(group_id) == expected
+            assert sum(batch.group_counts().values()) == 1000
+
+    @allure.title("Тест памяти на учителя")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "memory", "performance")
+    @pytest.mark.api
+    @pytest.mark.performance
+    def test_memory_per_teacher(self) -> None:
+        """
+        Тест что колонки занимают в разы меньше памяти, чем словари.
+        """
+        teachers = make_teachers(10000)
+        batch = TeacherBatch.from_dicts(teachers)
+        dict_bytes = sum(
+            sys.getsizeof(t) + sum(sys.getsizeof(value) for value in t.values()) for t in teachers
+        )
+
+        allure.attach(f"колонки: {batch.nbytes() / len(batch):.1f} байт/учитель, "
+                      f"словари: {dict_bytes / len(teachers):.1f} байт/учитель",
+                      name="Память", attachment_type=allure.attachment_type.TEXT)
+        assert batch.nbytes() / len(batch) < 60
+        assert batch.nbytes() * 5 < dict_bytes
+
+    @allure.title("Тест получения TeacherBatch через HTTP")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "memory", "live")
+    @pytest.mark.api
+    def test_get_teachers_batch(self, teacher_server: TeacherServer) -> None:
+        """
+        Тест что get_teachers_batch возвращает те же данные, что и get_all_teachers.
+
+        Args:
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        # Сервер принимает только ASCII email
+        for number, teacher in enumerate(make_teachers(300)):
+            teacher_server.store.create({'email': f'batch{number}@test.com', 'group_id': teacher['group_id']})
+        api = TeacherAPI(teacher_server.url)
+
+        batch = api.get_teachers_batch()
+        assert batch == api.get_all_teachers()
+        assert api.get_teachers_batch({'group_id': 105}) == batch.filter_by_group(105)
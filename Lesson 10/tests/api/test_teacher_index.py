@@ -0,0 +1,155 @@
+"""Тесты локальной копии учителей с индексами."""
+
+import random
+
+import pytest
+import allure
+
+from api.teacher_api import TeacherAPI
+from api.teacher_index import TeacherIndex
+from tools.teacher_server import TeacherServer
+
+
+def seed(server: TeacherServer, count: int) -> None:
+    """
+    Создать учителей напрямую в хранилище сервера.
+
+    Args:
+        server (TeacherServer): Локальный сервер учителей
+        count (int): Количество учителей
+    """
+    for number in range(count):
+        server.store.create({'email': f'User{number}@test.com', 'group_id': 100 + number % 5})
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Teacher Index")
+class TestTeacherIndex:
+    """
+    Класс для тестирования локальной копии учителей.
+    """
+
+    @allure.title("Тест запросов к локальной копии")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "index", "live")
+    @pytest.mark.api
+    @pytest.mark.performance
+    def test_queries_served_from_memory(self, teacher_server: TeacherServer) -> None:
+        """
+        Тест что запросы совпадают с сервером и не отправляют HTTP запросов, пока копия свежая.
+
+        Args:
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        seed(teacher_server, 50)
+        api = TeacherAPI(teacher_server.url, index_max_age=60)
+        plain = TeacherAPI(teacher_server.url)
+
+        with allure.step("Первый запрос загружает копию"):
+            assert api.get_teachers_by_group(101) == plain.get_teachers_by_group(101)
+            assert api.stats['requests'] == 1
+
+        with allure.step("Следующие запросы обслуживаются из памяти"):
+            assert api.search_teachers_by_email('User7@test.com') == plain.search_teachers_by_email('User7@test.com')
+            prefix = api.search_teachers_by_email_prefix('user4')
+            assert [t['email'] for t in prefix] == [f'User4{n}@test.com' for n in range(10)] + ['User4@test.com']
+            assert prefix == plain.search_teachers_by_email_prefix('USER4')
+            assert api.get_teachers_by_group(999) == []
+            assert api.stats['requests'] == 1
+
+    @allure.title("Тест синхронизации изменений")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "index", "live")
+    @pytest.mark.api
+    def test_sync_delta(self, teacher_server: TeacherServer) -> None:
+        """
+        Тест условной синхронизации: 304 без изменений и применение разницы.
+
+        Args:
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        seed(teacher_server, 20)
+        api = TeacherAPI(teacher_server.url)
+        index = TeacherIndex(api)
+
+        with allure.step("Загрузить копию и повторить синхронизацию"):
+            assert index.sync() == {'added': 20, 'updated': 0, 'removed': 0}
+            assert index.sync() == {'added': 0, 'updated': 0, 'removed': 0}
+            assert index.stats['not_modified'] == 1
+
+        with allure.step("Изменить данные на сервере в обход клиента"):
+            teacher_server.store.update(3, {'group_id': 200})
+            teacher_server.store.delete(4)
+            created = teacher_server.store.create({'email': 'late@test.com', 'group_id': 200})
+
+        with allure.step("Проверить разницу и индексы"):
+            assert index.sync() == {'added': 1, 'updated': 1, 'removed': 1}
+            assert [t['teacher_id'] for t in index.by_group(200)] == [3, created['teacher_id']]
+            assert index.get(4) is None
+            assert index.by_email_prefix('late') == [created]
+            assert len(index) == 20
+
+    @allure.title("Тест свежести копии и изменений через клиент")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "index", "live")
+    @pytest.mark.api
+    def test_max_age_and_client_writes(self, teacher_server: TeacherServer) -> None:
+        """
+        Тест что копия синхронизируется по max_age, а изменения клиента видны сразу.
+
+        Args:
+            teacher_server (TeacherServer): Локальный сервер учителей
+        """
+        now = [0.0]
+        api = TeacherAPI(teacher_server.url, index_max_age=10)
+        api.index.clock = lambda: now[0]
+        api.index.sync()
+
+        with allure.step("Изменения клиента применяются к копии без синхронизации"):
+            created = api.create_teacher({'email': 'mine@test.com', 'group_id': 100})
+            assert api.get_teachers_by_group(100) == [created]
+            api.update_teacher(created['teacher_id'], {'group_id': 101})
+            assert api.get_teachers_by_group(100) == []
+            assert api.index.stats['syncs'] == 1
+
+        with allure.step("Изменение в обход клиента видно после max_age"):
+            teacher_server.store.create({'email': 'other@test.com', 'group_id': 101})
+            assert len(api.get_teachers_by_group(101)) == 1
+            now[0] = 10.0
+            assert len(api.get_teachers_by_group(101)) == 2
+            assert api.index.stats['syncs'] == 2
+
+    @allure.title("Тест инкрементальных индексов на случайных изменениях")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "index")
+    @pytest.mark.api
+    def test_incremental_matches_rebuild(self) -> None:
+        """
+        Тест что точечные правки индексов дают тот же результат, что и полная перестройка.
+        """
+        rng = random.Random(7)
+        index = TeacherIndex(api=None, max_age=float('inf'))
+        index.synced_at = 0.0
+        expected = {}
+        for _ in range(2000):
+            teacher_id = rng.randrange(100)
+            if rng.random() < 0.3:
+                index.remove(teacher_id)
+                expected.pop(teacher_id, None)
+            else:
+                teacher = {'teacher_id': teacher_id, 'email': f'{rng.choice("abc")}{rng.randrange(50)}@test.com',
+                           'group_id': rng.randrange(5)}
+                index.upsert(teacher)
+                expected[teacher_id] = teacher
+
+        for group_id in range(5):
+            assert index.by_group(group_id) == sorted(
+                (t for t in expected.values() if t['group_id'] == group_id), key=lambda t: t['teacher_id']
+            )
+        for prefix in ('a', 'b1', 'c4', 'z'):
+            assert index.by_email_prefix(prefix) == sorted(
+                (t for t in expected.values() if t['email'].startswith(prefix)),
+                key=lambda t: (t['email'], t['teacher_id'])
+            )
+
@@ -0,0 +1,178 @@
+"""API тесты постраничного обхода учителей."""
+
+import threading
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock, patch
+
+import pytest
+import allure
+
+from api.teacher_api import TeacherAPI
+
+
+def page_response(body: Any, links: Optional[Dict[str, Dict[str, str]]] = None) -> Mock:
+    """
+    Построить мок ответа со страницей учителей.
+    
+    Args:
+        body (Any): Тело ответа
+        links (Optional[Dict[str, Dict[str, str]]]): Разобранный заголовок Link
+        
+    Returns:
+        Mock: Мок ответа
+    """
+    return Mock(**{'json.return_value': body, 'links': links or {}})
+
+
+def teachers(*ids: int) -> List[Dict[str, Any]]:
+    """
+    Построить список учителей с заданными ID.
+    
+    Args:
+        *ids (int): ID учителей
+        
+    Returns:
+        List[Dict[str, Any]]: Данные учителей
+    """
+    return [{'teacher_id': i, 'email': f't{i}@test.com', 'group_id': 100} for i in ids]
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Teacher Pagination")
+class TestTeacherPagination:
+    """
+    Класс для тестирования способов пагинации в iter_teachers.
+    """
+    
+    @pytest.fixture
+    def teacher_api(self) -> TeacherAPI:
+        """
+        Фикстура для создания экземпляра TeacherAPI.
+        
+        Returns:
+            TeacherAPI: Экземпляр API клиента
+        """
+        return TeacherAPI(base_url="http://test-api.local/api/v1")
+    
+    @allure.title("Тест пагинации по заголовку Link")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "pagination")
+    @pytest.mark.api
+    def test_link_header(self, teacher_api: TeacherAPI) -> None:
+        """
+        Тест перехода по rel="next" из заголовка Link.
+        
+        Args:
+            teacher_api (TeacherAPI): Экземпляр API клиента
+        """
+        next_url = "http://test-api.local/api/v1/teachers?page=2"
+        with allure.step("Обойти две страницы по Link"):
+            with patch.object(teacher_api, 'get') as mock_get:
+                mock_get.side_effect = [
+                    page_response(teachers(1, 2), {'next': {'url': next_url}}),
+                    page_response(teachers(3)),
+                ]
+                result = [t['teacher_id'] for t in teacher_api.iter_teachers(page_size=2)]
+        
+        with allure.step("Проверить результат"):
+            assert result == [1, 2, 3]
+            mock_get.assert_called_with(next_url, params=None)
+    
+    @allure.title("Тест пагинации по курсору")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "pagination")
+    @pytest.mark.api
+    def test_cursor_in_body(self, teacher_api: TeacherAPI) -> None:
+        """
+        Тест передачи next_cursor из тела ответа.
+        
+        Args:
+            teacher_api (TeacherAPI): Экземпляр API клиента
+        """
+        with allure.step("Обойти две страницы по курсору"):
+            with patch.object(teacher_api, 'get') as mock_get:
+                mock_get.side_effect = [
+                    page_response({'items': teachers(1, 2), 'next_cursor': 'abc'}),
+                    page_response({'items': teachers(3), 'next_cursor': None}),
+                ]
+                result = [t['teacher_id'] for t in teacher_api.iter_teachers(page_size=2)]
+        
+        with allure.step("Проверить результат"):
+            assert result == [1, 2, 3]
+            mock_get.assert_called_with("teachers", params={'limit': 2, 'cursor': 'abc'})
+    
+    @allure.title("Тест пагинации по номеру страницы")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "pagination")
+    @pytest.mark.api
+    def test_page_numbers(self, teacher_api: TeacherAPI) -> None:
+        """
+        Тест перехода по page/total_pages.
+        
+        Args:
+            teacher_api (TeacherAPI): Экземпляр API клиента
+        """
+        with allure.step("Обойти две страницы по номерам"):
+            with patch.object(teacher_api, 'get') as mock_get:
+                mock_get.side_effect = [
+                    page_response({'teachers': teachers(1), 'page': 1, 'total_pages': 2}),
+                    page_response({'teachers': teachers(2), 'page': 2, 'total_pages': 2}),
+                ]
+                result = [t['teacher_id'] for t in teacher_api.iter_teachers(page_size=1)]
+        
+        with allure.step("Проверить результат"):
+            assert result == [1, 2]
+            mock_get.assert_called_with("teachers", params={'limit': 1, 'page': 2})
+    
+    @allure.title("Тест фоновой загрузки следующей страницы")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("api", "pagination", "performance")
+    @pytest.mark.api
+    def test_next_page_prefetched(self, teacher_api: TeacherAPI) -> None:
+        """
+        Тест что следующая страница запрашивается до обработки текущей.
+        
+        Args:
+            teacher_api (TeacherAPI): Экземпляр API клиента
+        """
+        second_requested = threading.Event()
+        
+        def fake_get(endpoint, params=None):
+            if params.get('after_id'):
+                second_requested.set()
+                return page_response(teachers(3))
+            return page_response(teachers(1, 2))
+        
+        with allure.step("Получить первого учителя и дождаться запроса второй страницы"):
+            with patch.object(teacher_api, 'get', side_effect=fake_get):
+                iterator = teacher_api.iter_teachers(page_size=2)
+                first = next(iterator)
+                assert second_requested.wait(timeout=2), "Следующая страница не запрошена заранее"
+                rest = list(iterator)
+        
+        with allure.step("Проверить результат"):
+            assert [first['teacher_id']] + [t['teacher_id'] for t in rest] == [1, 2, 3]
+    
+    @allure.title("Тест сервера без пагинации")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("api", "pagination")
+    @pytest.mark.api
+    @pytest.mark.parametrize("page_size", [2, 5])
+    def test_server_ignores_keyset(self, teacher_api: TeacherAPI, page_size: int) -> None:
+        """
+        Тест что обход заканчивается, если сервер игнорирует limit/after_id
+        и на каждый запрос возвращает полный список.
+        
+        Args:
+            teacher_api (TeacherAPI): Экземпляр API клиента
+            page_size (int): Размер страницы, не больше размера списка
+        """
+        with allure.step("Обойти список на сервере без пагинации"):
+            with patch.object(teacher_api, 'get') as mock_get:
+                mock_get.side_effect = lambda endpoint, params=None: page_response(teachers(1, 2, 3, 4, 5))
+                result = [t['teacher_id'] for t in teacher_api.iter_teachers(page_size=page_size)]
+        
+        with allure.step("Проверить что учителя не повторяются и запросов два"):
+            assert result == [1, 2, 3, 4, 5]
+            assert mock_get.call_count == 2
@@ -0,0 +1,219 @@
+"""Тесты трассировки вызовов с выборкой и выгрузкой в Allure."""
+
+import threading
+from typing import Any, List, Tuple
+from unittest.mock import patch
+
+import pytest
+import allure
+
+from utils import tracing
+from utils.tracing import Tracer, traced
+
+
+class RecordedStep:
+    """
+    Заглушка шага Allure, записывающая открытие и закрытие.
+    """
+
+    def __init__(self, log: List[Tuple[str, Any]], title: str) -> None:
+        self.log = log
+        self.title = title
+        self.params: dict = {}
+
+    def __enter__(self) -> None:
+        self.log.append(('start', self.title))
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.log.append(('stop', self.title, exc_type))
+
+
+@traced("Родитель: {value}")
+def parent(value: int) -> int:
+    return child(value) + child(value + 1)
+
+
+@traced("Ребенок: {value}")
+def child(value: int) -> int:
+    if value < 0:
+        raise ValueError("отрицательное значение")
+    return value
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("API Tests")
+@allure.story("Tracing")
+class TestTracing:
+    """
+    Класс для тестирования трассировки вызовов.
+    """
+
+    @pytest.fixture
+    def tracer(self) -> Tracer:
+        """
+        Подменить трассировщик процесса на отдельный экземпляр.
+
+        Yields:
+            Tracer: Трассировщик теста
+        """
+        local = Tracer(mode='full', seed=1)
+        with patch.object(tracing, 'tracer', local):
+            yield local
+
+    @allure.title("Тест режима off")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("tracing")
+    @pytest.mark.api
+    @pytest.mark.performance
+    def test_off_records_nothing(self, tracer: Tracer) -> None:
+        """
+        Тест что в режиме off вызовы не записываются.
+
+        Args:
+            tracer (Tracer): Трассировщик теста
+        """
+        tracer.configure(mode='off')
+        assert parent(1) == 3
+        assert len(tracer.buffer) == 0
+        assert tracer.stats['recorded'] == 0
+
+    @allure.title("Тест шагов режима full внутри шага теста")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("tracing")
+    @pytest.mark.api
+    def test_full_live_steps(self, tracer: Tracer) -> None:
+        """
+        Тест что режим full открывает шаги сразу, внутри текущего шага теста, без буфера.
+
+        Args:
+            tracer (Tracer): Трассировщик теста
+        """
+        log: List[Tuple[str, Any]] = []
+        with patch.object(tracing.allure, 'step', side_effect=lambda title: RecordedStep(log, title)):
+            with tracing.allure.step("Шаг теста"):
+                parent(1)
+                with pytest.raises(ValueError):
+                    child(-1)
+
+        assert log == [
+            ('start', 'Шаг теста'),
+            ('start', 'Родитель: 1'),
+            ('start', 'Ребенок: 1'), ('stop', 'Ребенок: 1', None),
+            ('start', 'Ребенок: 2'), ('stop', 'Ребенок: 2', None),
+            ('stop', 'Родитель: 1', None),
+            ('start', 'Ребенок: -1'), ('stop', 'Ребенок: -1', ValueError),
+            ('stop', 'Шаг теста', None),
+        ]
+        assert len(tracer.buffer) == 0
+        assert tracer.stats['recorded'] == 0
+        assert tracer.flush() == 0
+
+    @allure.title("Тест выгрузки вложенных шагов")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("tracing")
+    @pytest.mark.api
+    def test_sampled_flush_nested_steps(self, tracer: Tracer) -> None:
+        """
+        Тест что режим sampled выгружает вложенные шаги с заголовками и ошибками.
+
+        Args:
+            tracer (Tracer): Трассировщик теста
+        """
+        log: List[Tuple[str, Any]] = []
+        tracer.configure(mode='sampled', sample_rate=1.0)
+        parent(1)
+        with pytest.raises(ValueError):
+            parent(-1)
+
+        with patch.object(tracing.allure, 'step', side_effect=lambda title: RecordedStep(log, title)):
+            assert tracer.flush() == 5
+        assert log == [
+            ('start', 'Родитель: 1'),
+            ('start', 'Ребенок: 1'), ('stop', 'Ребенок: 1', None),
+            ('start', 'Ребенок: 2'), ('stop', 'Ребенок: 2', None),
+            ('stop', 'Родитель: 1', None),
+            ('start', 'Родитель: -1'),
+            ('start', 'Ребенок: -1'), ('stop', 'Ребенок: -1', ValueError),
+            ('stop', 'Родитель: -1', ValueError),
+        ]
+        assert len(tracer.buffer) == 0
+
+    @allure.title("Тест выборки деревьев вызовов")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("tracing")
+    @pytest.mark.api
+    def test_sampled_whole_trees(self, tracer: Tracer) -> None:
+        """
+        Тест что в режиме sampled записываются целые деревья вызовов в нужной доле.
+
+        Args:
+            tracer (Tracer): Трассировщик теста
+        """
+        tracer.configure(mode='sampled', sample_rate=0.25)
+        for value in range(1000):
+            parent(value)
+
+        roots = [span for span in tracer.buffer if span.depth == 0]
+        assert 150 < len(roots) < 350
+        assert len(tracer.buffer) == 3 * len(roots)
+
+    @allure.title("Тест кольцевого буфера")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("tracing")
+    @pytest.mark.api
+    def test_ring_buffer_keeps_latest(self, tracer: Tracer) -> None:
+        """
+        Тест что при переполнении буфера вытесняются самые старые записи.
+
+        Args:
+            tracer (Tracer): Трассировщик теста
+        """
+        tracer.configure(mode='sampled', sample_rate=1.0, buffer_size=10)
+        for value in range(25):
+            child(value)
+
+        assert [span.args for span in tracer.buffer] == [(value,) for value in range(15, 25)]
+        assert tracer.stats == {'recorded': 25, 'flushed': 0, 'dropped': 15}
+        with pytest.raises(ValueError):
+            tracer.configure(mode='verbose')
+
+    @allure.title("Тест выгрузки в отчет Allure")
+    @allure.severity(allure.severity_level.MINOR)
+    @allure.tag("tracing")
+    @pytest.mark.api
+    def test_flush_to_allure(self, tracer: Tracer) -> None:
+        """
+        Тест что выгрузка настоящими шагами Allure не падает внутри теста.
+
+        Args:
+            tracer (Tracer): Трассировщик теста
+        """
+        tracer.configure(mode='sampled', sample_rate=1.0)
+        parent(5)
+        step = tracer.buffer[0].to_step()
+        assert step.title == 'Родитель: 5'
+        assert set(step.params) == {'value', 'duration_ms'}
+        assert tracer.flush() == 3
+
+    @allure.title("Тест счетчиков при записи из потоков")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("tracing", "concurrency")
+    @pytest.mark.api
+    def test_stats_thread_safe(self, tracer: Tracer) -> None:
+        """
+        Тест что счетчики и буфер согласованы при записи из нескольких потоков.
+
+        Args:
+            tracer (Tracer): Трассировщик теста
+        """
+        tracer.configure(mode='sampled', sample_rate=1.0, buffer_size=1000)
+        threads = [threading.Thread(target=lambda: [child(value) for value in range(2000)])
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tracer.stats['recorded'] == 16000
+        assert tracer.stats['dropped'] == 15000
+        assert len(tracer.buffer) == 1000
@@ -12,6 +12,8 @@ from selenium.webdriver.firefox.service import Service as FirefoxService
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 
+from utils.tracing import tracer
+
 
 # Загрузка переменных окружения из .env файла
 try:
@@ -217,6 +219,55 @@ def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo) -> Optio
     setattr(item, f"rep_{report.when}", report)
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, None, None]:
+    """
+    Хук выгрузки шагов трассировки в отчёт Allure после тела теста.
+    
+    В режиме sampled размеченные через utils.tracing.traced вызовы копятся
+    в буфере и попадают в отчёт шагами теста одной пачкой. В режиме full
+    шаги открываются сразу при вызове, и буфер пуст.
+    
+    Args:
+        item (pytest.Item): Элемент теста
+    """
+    yield
+    tracer.flush()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: pytest.Item) -> Generator[None, None, None]:
+    """
+    Хук выгрузки шагов трассировки, записанных при завершении фикстур.
+    
+    Args:
+        item (pytest.Item): Элемент теста
+    """
+    yield
+    tracer.flush()
+
+
+@pytest.fixture(autouse=True)
+def performance_trace_mode(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """
+    Фикстура режима sampled для тестов производительности.
+    
+    Тесты с маркером performance гоняют размеченные методы в циклах, и режим
+    full открывал бы шаг Allure на каждый вызов. Явно заданный TRACE_MODE
+    не переопределяется.
+    
+    Args:
+        request (pytest.FixtureRequest): Запрос фикстуры pytest
+    """
+    if "TRACE_MODE" in os.environ or request.node.get_closest_marker("performance") is None:
+        yield
+        return
+    mode = tracer.mode
+    tracer.configure(mode="sampled")
+    yield
+    tracer.configure(mode=mode)
+
+
 @pytest.fixture
 def test_data_generator():
     """
@@ -0,0 +1,63 @@
+"""Фикстуры для тестов БД на SQLite и PostgreSQL."""
+
+import uuid
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+
+from database.drivers import build_connection_string
+
+
+@pytest.fixture
+def sqlite_url(tmp_path) -> str:
+    """
+    Фикстура с файловой SQLite базой и созданной таблицей teacher.
+    
+    Args:
+        tmp_path: Временная директория pytest
+        
+    Returns:
+        str: Строка подключения SQLAlchemy к базе
+    """
+    url = f"sqlite:///{tmp_path / 'teachers.db'}"
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE teacher ("
+            "teacher_id INTEGER PRIMARY KEY, "
+            "email VARCHAR(255) NOT NULL, "
+            "group_id INTEGER NOT NULL)"
+        ))
+    engine.dispose()
+    return url
+
+
+@pytest.fixture
+def postgres_url() -> Iterator[str]:
+    """
+    Фикстура с отдельной схемой в PostgreSQL из конфигурации (DB_HOST и др.).
+    
+    Таблицы теста создаются в своей схеме через search_path и удаляются
+    вместе с ней. Если сервер недоступен, тест пропускается.
+    
+    Yields:
+        str: Строка подключения SQLAlchemy со схемой теста в search_path
+    """
+    url = build_connection_string("psycopg2")
+    engine = create_engine(url)
+    schema = f"test_{uuid.uuid4().hex[:12]}"
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(f"CREATE SCHEMA {schema}"))
+    except OperationalError as error:
+        engine.dispose()
+        pytest.skip(f"PostgreSQL недоступен: {error}")
+    yield make_url(url).update_query_dict(
+        {'options': f'-csearch_path={schema}'}
+    ).render_as_string(hide_password=False)
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+    engine.dispose()
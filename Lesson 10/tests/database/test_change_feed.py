@@ -0,0 +1,135 @@
+"""Тесты ленты изменений таблицы учителей."""
+
+import threading
+
+import pytest
+import allure
+
+from database.change_feed import ChangeFeed
+from database.teacher_table import TeacherTable
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("Database Tests")
+@allure.story("Teacher Change Feed")
+class TestTeacherChangeFeed:
+    """
+    Класс для тестирования ленты изменений на внутрипроцессных хуках.
+    """
+
+    @allure.title("Тест событий INSERT/UPDATE/DELETE")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("database", "change-feed", "positive")
+    @pytest.mark.database
+    def test_feed_receives_changes(self, sqlite_url: str) -> None:
+        """
+        Тест получения событий изменения строк из ленты.
+
+        Args:
+            sqlite_url (str): Строка подключения к SQLite базе
+        """
+        db = TeacherTable(sqlite_url)
+
+        with db.change_feed() as feed:
+            with allure.step("Добавить, обновить и удалить учителя"):
+                db.add_teacher(1, 'one@mail.com', 100)
+                db.update_teacher(1, 'new@mail.com')
+                db.delete(1)
+
+            with allure.step("Проверить события ленты"):
+                events = [feed.get(timeout=1) for _ in range(3)]
+                assert events == [
+                    {'op': 'INSERT', 'teacher_id': 1, 'email': 'one@mail.com', 'group_id': 100},
+                    {'op': 'UPDATE', 'teacher_id': 1, 'email': 'new@mail.com', 'group_id': 100},
+                    {'op': 'DELETE', 'teacher_id': 1, 'email': 'new@mail.com', 'group_id': 100},
+                ]
+                assert feed.get(timeout=0.01) is None
+
+    @allure.title("Тест ожидания учителя, добавленного в другом потоке")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("database", "change-feed", "positive")
+    @pytest.mark.database
+    def test_wait_for_teacher(self, sqlite_url: str) -> None:
+        """
+        Тест пробуждения ожидающего при добавлении учителя.
+
+        Args:
+            sqlite_url (str): Строка подключения к SQLite базе
+        """
+        db = TeacherTable(sqlite_url)
+        writer = threading.Timer(
+            0.05, lambda: TeacherTable(sqlite_url).add_teacher(2, 'two@mail.com', 100)
+        )
+
+        with allure.step("Дождаться учителя, добавленного в другом потоке"):
+            writer.start()
+            assert db.wait_for_teacher(2, timeout=5)
+            writer.join()
+
+    @allure.title("Тест таймаута ожидания учителя")
+    @allure.severity(allure.severity_level.MINOR)
+    @allure.tag("database", "change-feed", "negative")
+    @pytest.mark.database
+    def test_wait_for_teacher_timeout(self, sqlite_url: str) -> None:
+        """
+        Тест возврата False, если учитель не появился до таймаута.
+
+        Args:
+            sqlite_url (str): Строка подключения к SQLite базе
+        """
+        with allure.step("Проверить что ожидание завершилось по таймауту"):
+            assert not TeacherTable(sqlite_url).wait_for_teacher(3, timeout=0.05)
+
+    @allure.title("Тест событий удаления группы из своей секции в PostgreSQL")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("database", "change-feed", "partitioning")
+    @pytest.mark.database
+    def test_postgres_feed_sees_truncated_group(self, postgres_url: str) -> None:
+        """
+        Тест что удаление группы через TRUNCATE ее LIST секции попадает в ленту NOTIFY.
+
+        Args:
+            postgres_url (str): Строка подключения к схеме теста в PostgreSQL
+        """
+        db = TeacherTable(postgres_url)
+        db.create_partitioned_table('list', groups=[100])
+        db.install_change_feed()
+        db.add_teachers([
+            {'teacher_id': 1, 'email': 'one@mail.com', 'group_id': 100},
+            {'teacher_id': 2, 'email': 'two@mail.com', 'group_id': 100},
+            {'teacher_id': 3, 'email': 'three@mail.com', 'group_id': 101},
+        ])
+
+        with db.change_feed() as feed:
+            with allure.step("Удалить группу со своей секцией"):
+                assert db.delete_group(100) == 2
+
+            with allure.step("Проверить события DELETE удаленных учителей"):
+                events = [feed.get(timeout=2) for _ in range(2)]
+                assert sorted(events, key=lambda event: event['teacher_id']) == [
+                    {'op': 'DELETE', 'teacher_id': 1, 'email': 'one@mail.com', 'group_id': 100},
+                    {'op': 'DELETE', 'teacher_id': 2, 'email': 'two@mail.com', 'group_id': 100},
+                ]
+                assert feed.get(timeout=0.05) is None
+
+        with allure.step("Ожидание удаления завершается сразу"):
+            assert db.wait_for_teacher(1, timeout=0.05, deleted=True)
+            assert db.get_teachers_by_group(101) == [(3, 'three@mail.com', 101)]
+
+    @allure.title("Тест абстрактной ленты изменений")
+    @allure.severity(allure.severity_level.MINOR)
+    @allure.tag("database", "change-feed", "negative")
+    @pytest.mark.database
+    def test_feed_requires_get_and_close(self) -> None:
+        """
+        Тест что ленту без get и close нельзя создать.
+        """
+        class PartialFeed(ChangeFeed):
+            def get(self, timeout=None):
+                return None
+
+        with allure.step("Проверить что выброшено исключение TypeError"):
+            with pytest.raises(TypeError):
+                ChangeFeed()
+            with pytest.raises(TypeError, match="close"):
+                PartialFeed()
@@ -0,0 +1,83 @@
+"""Тесты потоковой сверки учителей между БД и API."""
+
+from unittest.mock import Mock
+
+import pytest
+import allure
+
+from database.teacher_table import TeacherTable
+from tools.consistency_check import check_consistency, merge_join
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("Database Tests")
+@allure.story("DB/API Consistency")
+class TestConsistencyCheck:
+    """
+    Класс для тестирования merge-join сверки БД и API.
+    """
+
+    @allure.title("Тест поиска расхождений merge-join")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("database", "api", "consistency")
+    @pytest.mark.database
+    def test_merge_join_reports_differences(self) -> None:
+        """
+        Тест обнаружения отсутствующих, лишних и несовпадающих строк.
+        """
+        db_rows = [(1, 'a@mail.com', 100), (2, 'b@mail.com', 100), (4, 'd@mail.com', 101)]
+        api_rows = [
+            {'teacher_id': 1, 'email': 'a@mail.com', 'group_id': 100},
+            {'teacher_id': 3, 'email': 'c@mail.com', 'group_id': 100},
+            {'teacher_id': 4, 'email': 'x@mail.com', 'group_id': 101},
+        ]
+
+        with allure.step("Сверить потоки"):
+            report = merge_join(iter(db_rows), iter(api_rows))
+
+        with allure.step("Проверить отчет"):
+            assert (report['matched'], report['missing_in_api'], report['extra_in_api'],
+                    report['mismatched']) == (1, 1, 1, 1)
+            assert report['examples']['missing_in_api'] == [2]
+            assert report['examples']['extra_in_api'] == [3]
+            assert report['examples']['mismatched'][0]['teacher_id'] == 4
+            assert not report['consistent']
+
+    @allure.title("Тест неотсортированного потока")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("database", "api", "consistency", "negative")
+    @pytest.mark.database
+    def test_merge_join_requires_sorted_input(self) -> None:
+        """
+        Тест ошибки при нарушении порядка teacher_id.
+        """
+        with allure.step("Проверить что выброшено исключение ValueError"):
+            with pytest.raises(ValueError, match="не отсортированы"):
+                merge_join([(2, 'b@mail.com', 100), (1, 'a@mail.com', 100)], [])
+
+    @allure.title("Тест сверки таблицы и API страницами")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("database", "api", "consistency")
+    @pytest.mark.database
+    def test_check_consistency(self, sqlite_url: str) -> None:
+        """
+        Тест сверки с keyset пагинацией по БД.
+
+        Args:
+            sqlite_url (str): Строка подключения к SQLite базе
+        """
+        db = TeacherTable(sqlite_url)
+        teachers = [
+            {'teacher_id': i, 'email': f't{i}@mail.com', 'group_id': 100} for i in range(1, 6)
+        ]
+        db.add_teachers(teachers)
+        api = Mock()
+        api.iter_teachers.return_value = iter(teachers)
+
+        with allure.step("Сверить БД и API страницами по 2 строки"):
+            report = check_consistency(db, api, db_page_size=2)
+
+        with allure.step("Проверить отчет"):
+            assert report['consistent']
+            assert report['matched'] == 5
+            assert report['db_rows'] == report['api_rows'] == 5
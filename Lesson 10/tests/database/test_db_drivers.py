@@ -0,0 +1,127 @@
+"""Тесты выбора драйвера БД и бенчмарка CRUD нагрузки."""
+
+import pytest
+import allure
+
+from database.drivers import build_connection_string, create_db_engine, get_driver
+from database.teacher_table import TeacherTable
+from tools.db_benchmark import run_benchmark, run_sync_benchmark, format_report
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("Database Tests")
+@allure.story("DB Drivers")
+class TestDbDrivers:
+    """
+    Класс для тестирования подключаемых драйверов PostgreSQL.
+    """
+
+    @allure.title("Тест строки подключения для каждого драйвера")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("database", "driver", "positive")
+    @pytest.mark.database
+    @pytest.mark.parametrize("driver, dialect", [
+        ("psycopg2", "postgresql+psycopg2://"),
+        ("psycopg", "postgresql+psycopg://"),
+        ("asyncpg", "postgresql+asyncpg://"),
+    ])
+    def test_build_connection_string(self, driver: str, dialect: str) -> None:
+        """
+        Тест выбора диалекта SQLAlchemy по имени драйвера.
+
+        Args:
+            driver (str): Имя драйвера
+            dialect (str): Ожидаемый префикс строки подключения
+        """
+        with allure.step(f"Построить строку подключения для {driver}"):
+            assert build_connection_string(driver).startswith(dialect)
+
+    @allure.title("Тест неподдерживаемого драйвера")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("database", "driver", "negative")
+    @pytest.mark.database
+    def test_unknown_driver(self) -> None:
+        """
+        Тест ошибки при выборе неизвестного драйвера.
+        """
+        with allure.step("Проверить что выброшено исключение ValueError"):
+            with pytest.raises(ValueError, match="Неподдерживаемый драйвер"):
+                get_driver("pg8000")
+
+    @allure.title("Тест синхронного движка при асинхронном драйвере")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("database", "driver")
+    @pytest.mark.database
+    def test_async_driver_in_sync_engine(self) -> None:
+        """
+        Тест что синхронный движок для asyncpg создается на psycopg2.
+        """
+        with allure.step("Создать движок по конфигурации"):
+            assert create_db_engine(driver="asyncpg").url.drivername == "postgresql+psycopg2"
+
+        with allure.step("Создать движок по строке подключения asyncpg"):
+            engine = create_db_engine("postgresql+asyncpg://user:secret@db:5432/school",
+                                      driver="asyncpg")
+            assert engine.url.render_as_string(hide_password=False) == \
+                "postgresql+psycopg2://user:secret@db:5432/school"
+
+    @allure.title("Тест пакетного добавления учителей")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("database", "crud", "positive")
+    @pytest.mark.database
+    def test_add_teachers(self, sqlite_url: str) -> None:
+        """
+        Тест добавления нескольких учителей одной транзакцией.
+
+        Args:
+            sqlite_url (str): Строка подключения к SQLite базе
+        """
+        db = TeacherTable(sqlite_url)
+        teachers = [
+            {'teacher_id': 1, 'email': 'one@mail.com', 'group_id': 100},
+            {'teacher_id': 2, 'email': 'two@mail.com', 'group_id': 101},
+        ]
+
+        with allure.step("Добавить учителей пачкой"):
+            added = db.add_teachers(teachers)
+
+        with allure.step("Проверить результат"):
+            assert added == 2
+            assert sorted(db.get_teacher()) == [(1, 'one@mail.com', 100), (2, 'two@mail.com', 101)]
+
+    @allure.title("Тест бенчмарка CRUD нагрузки")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("database", "performance")
+    @pytest.mark.database
+    @pytest.mark.performance
+    def test_sync_benchmark(self, sqlite_url: str) -> None:
+        """
+        Тест прогона CRUD нагрузки и формирования отчета.
+
+        Args:
+            sqlite_url (str): Строка подключения к SQLite базе
+        """
+        with allure.step("Прогнать бенчмарк"):
+            result = run_sync_benchmark("psycopg2", iterations=5, connection_string=sqlite_url)
+
+        with allure.step("Проверить результат"):
+            assert result["operations"] == 20
+            assert result["ops_per_sec"] > 0
+            assert set(result["per_operation"]) == {"add", "exists", "update", "delete"}
+            assert TeacherTable(sqlite_url).get_teacher() == []
+
+    @allure.title("Тест ошибки драйвера в сравнительном бенчмарке")
+    @allure.severity(allure.severity_level.MINOR)
+    @allure.tag("database", "performance", "negative")
+    @pytest.mark.database
+    @pytest.mark.performance
+    def test_benchmark_reports_driver_error(self) -> None:
+        """
+        Тест что ошибка драйвера попадает в отчет, а не прерывает бенчмарк.
+        """
+        with allure.step("Прогнать бенчмарк с неизвестным драйвером"):
+            results = run_benchmark(["pg8000"], iterations=1)
+
+        with allure.step("Проверить результат"):
+            assert "error" in results[0]
+            assert "pg8000" in format_report(results)
@@ -0,0 +1,90 @@
+"""Тесты многопроцессной загрузки и проверки учителей."""
+
+import pytest
+import allure
+
+from database.parallel import parallel_ingest, parallel_verify, shard_by_id_range
+from database.teacher_table import TeacherTable
+
+
+def _teachers(count: int) -> list:
+    """
+    Сгенерировать учителей с последовательными ID.
+
+    Args:
+        count (int): Количество учителей
+
+    Returns:
+        list: Список словарей с данными учителей
+    """
+    return [
+        {'teacher_id': i, 'email': f'teacher{i}@mail.com', 'group_id': 100 + i % 3}
+        for i in range(1, count + 1)
+    ]
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("Database Tests")
+@allure.story("Parallel Ingest")
+class TestParallelIngest:
+    """
+    Класс для тестирования загрузки и проверки в пуле процессов.
+    """
+
+    @allure.title("Тест шардирования по диапазонам teacher_id")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("database", "parallel", "positive")
+    @pytest.mark.database
+    def test_shard_by_id_range(self) -> None:
+        """
+        Тест разбиения на непересекающиеся диапазоны ID.
+        """
+        teachers = list(reversed(_teachers(7)))
+
+        with allure.step("Разбить учителей на 3 шарда"):
+            shards = shard_by_id_range(teachers, 3)
+
+        with allure.step("Проверить диапазоны"):
+            assert [[row['teacher_id'] for row in shard] for shard in shards] == [
+                [1, 2, 3], [4, 5, 6], [7]
+            ]
+
+    @allure.title("Тест параллельной загрузки и проверки")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("database", "parallel", "positive")
+    @pytest.mark.database
+    @pytest.mark.performance
+    def test_parallel_ingest_and_verify(self, sqlite_url: str) -> None:
+        """
+        Тест загрузки с ошибочной строкой и последующей сверки.
+
+        Args:
+            sqlite_url (str): Строка подключения к SQLite базе
+        """
+        teachers = _teachers(20)
+        teachers[4]['email'] = 'invalid_email'
+
+        with allure.step("Загрузить учителей в 2 процессах"):
+            ingest = parallel_ingest(teachers, workers=2, connection_string=sqlite_url, batch_size=4)
+
+        with allure.step("Проверить счетчики загрузки"):
+            assert ingest['processed'] == 20
+            assert ingest['inserted'] == 19
+            assert ingest['shards'] == 2
+            assert [error['teacher_id'] for error in ingest['errors']] == [5]
+
+        with allure.step("Изменить учителя в БД и выполнить сверку"):
+            TeacherTable(sqlite_url).update_teacher(7, 'changed@mail.com')
+            verify = parallel_verify(teachers, workers=2, connection_string=sqlite_url)
+
+        with allure.step("Проверить результат сверки"):
+            assert verify['matched'] == 18
+            assert sorted(error['teacher_id'] for error in verify['errors']) == [5, 7]
+
+        with allure.step("Лишние строки до, между и после шардов находятся при сверке"):
+            expected = [teacher for teacher in teachers if teacher['teacher_id'] not in (1, 11, 20)]
+            verify = parallel_verify(expected, workers=2, connection_string=sqlite_url)
+            assert verify['shards'] == 2
+            extra = sorted(error['teacher_id'] for error in verify['errors']
+                           if error['error'] == "Лишний учитель в БД")
+            assert extra == [1, 11, 20]
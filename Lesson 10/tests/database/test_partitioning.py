@@ -0,0 +1,97 @@
+"""Тесты партиционирования таблицы учителей по group_id."""
+
+import pytest
+import allure
+
+from database.teacher_table import TeacherTable, _parse_partition_bound
+
+
+@allure.epic("SkyPro QA Homework")
+@allure.feature("Database Tests")
+@allure.story("Teacher Table Partitioning")
+class TestTeacherPartitioning:
+    """
+    Класс для тестирования маршрутизации запросов по секциям группы.
+    """
+
+    @allure.title("Тест разбора границ секций")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("database", "partitioning", "positive")
+    @pytest.mark.database
+    @pytest.mark.parametrize("bound, expected", [
+        ("FOR VALUES WITH (modulus 8, remainder 3)", {'kind': 'hash', 'modulus': 8, 'remainder': 3}),
+        ("FOR VALUES IN (100, 101)", {'kind': 'list', 'values': [100, 101]}),
+        ("DEFAULT", {'kind': 'default'}),
+    ], ids=["hash", "list", "default"])
+    def test_parse_partition_bound(self, bound: str, expected: dict) -> None:
+        """
+        Тест разбора границы секции из системного каталога.
+
+        Args:
+            bound (str): Граница секции
+            expected (dict): Ожидаемый результат разбора
+        """
+        with allure.step(f"Разобрать границу: {bound}"):
+            assert _parse_partition_bound(bound) == expected
+
+    @allure.title("Тест построения схемы LIST секций")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("database", "partitioning", "positive")
+    @pytest.mark.database
+    def test_apply_partition_bounds(self) -> None:
+        """
+        Тест заполнения схемы секций по строкам каталога.
+        """
+        layout = {'strategy': 'list', 'modulus': None, 'by_value': {}, 'by_remainder': {}, 'default': None}
+
+        with allure.step("Заполнить схему секций"):
+            TeacherTable._apply_partition_bounds(layout, [
+                ('teacher_g100', 'FOR VALUES IN (100)'),
+                ('teacher_default', 'DEFAULT'),
+            ])
+
+        with allure.step("Проверить результат"):
+            assert layout['by_value'] == {100: 'teacher_g100'}
+            assert layout['default'] == 'teacher_default'
+
+    @allure.title("Тест запросов по группе без партиционирования")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("database", "partitioning", "positive")
+    @pytest.mark.database
+    def test_group_queries_on_plain_table(self, sqlite_url: str) -> None:
+        """
+        Тест чтения и удаления группы в непартиционированной таблице.
+
+        Args:
+            sqlite_url (str): Строка подключения к SQLite базе
+        """
+        db = TeacherTable(sqlite_url)
+        db.add_teachers([
+            {'teacher_id': 1, 'email': 'one@mail.com', 'group_id': 100},
+            {'teacher_id': 2, 'email': 'two@mail.com', 'group_id': 100},
+            {'teacher_id': 3, 'email': 'three@mail.com', 'group_id': 200},
+        ])
+
+        with allure.step("Получить учителей группы 100"):
+            assert sorted(db.get_teachers_by_group(100)) == [
+                (1, 'one@mail.com', 100), (2, 'two@mail.com', 100)
+            ]
+
+        with allure.step("Удалить учителей группы 100"):
+            assert db.delete_group(100) == 2
+            assert db.get_teacher() == [(3, 'three@mail.com', 200)]
+
+    @allure.title("Тест создания партиционированной таблицы вне PostgreSQL")
+    @allure.severity(allure.severity_level.MINOR)
+    @allure.tag("database", "partitioning", "negative")
+    @pytest.mark.database
+    def test_create_partitioned_table_requires_postgres(self, sqlite_url: str) -> None:
+        """
+        Тест ошибки партиционирования для SQLite.
+
+        Args:
+            sqlite_url (str): Строка подключения к SQLite базе
+        """
+        with allure.step("Проверить что выброшено исключение ValueError"):
+            with pytest.raises(ValueError, match="только для PostgreSQL"):
+                TeacherTable(sqlite_url).create_partitioned_table('list', groups=[100])
@@ -0,0 +1 @@
+"""Пакет с утилитами командной строки: бенчмарки и проверки."""
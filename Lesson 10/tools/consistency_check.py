@@ -0,0 +1,150 @@
+"""
+Потоковая сверка учителей между базой данных и REST API.
+
+Обе стороны читаются страницами в порядке teacher_id и сливаются
+merge-join'ом, поэтому память не зависит от количества учителей.
+
+Запуск:
+    python -m tools.consistency_check --base-url http://localhost:8080/api/v1
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+from api.teacher_api import TeacherAPI
+from database.teacher_table import TeacherTable
+
+
+# Поля, которые сравниваются между БД и API
+COMPARED_FIELDS = ("email", "group_id")
+
+
+def _normalize(rows: Iterable[Any], source: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Привести строки к парам (teacher_id, данные) и проверить порядок.
+
+    Args:
+        rows (Iterable[Any]): Строки БД (кортежи) или API (словари)
+        source (str): Название источника для сообщения об ошибке
+
+    Yields:
+        Tuple[int, Dict[str, Any]]: teacher_id и сравниваемые поля
+
+    Raises:
+        ValueError: если строки не отсортированы по возрастанию teacher_id
+    """
+    previous = None
+    for row in rows:
+        if isinstance(row, dict):
+            teacher_id = row["teacher_id"]
+            data = {field: row.get(field) for field in COMPARED_FIELDS}
+        else:
+            teacher_id, email, group_id = row[0], row[1], row[2]
+            data = {"email": email, "group_id": group_id}
+        if previous is not None and teacher_id <= previous:
+            raise ValueError(
+                f"{source}: строки не отсортированы по teacher_id ({previous} -> {teacher_id})"
+            )
+        previous = teacher_id
+        yield teacher_id, data
+
+
+def merge_join(db_rows: Iterable[Any], api_rows: Iterable[Any],
+               max_examples: int = 100) -> Dict[str, Any]:
+    """
+    Слить два отсортированных по teacher_id потока и найти расхождения.
+
+    Args:
+        db_rows (Iterable[Any]): Строки БД (teacher_id, email, group_id)
+        api_rows (Iterable[Any]): Учителя из API
+        max_examples (int): Максимум сохраняемых примеров каждого расхождения
+
+    Returns:
+        Dict[str, Any]: Счетчики matched/missing_in_api/extra_in_api/mismatched,
+            количество строк с каждой стороны, примеры, время и строк/сек
+    """
+    report: Dict[str, Any] = {
+        "db_rows": 0, "api_rows": 0, "matched": 0,
+        "missing_in_api": 0, "extra_in_api": 0, "mismatched": 0,
+        "examples": {"missing_in_api": [], "extra_in_api": [], "mismatched": []},
+    }
+
+    def record(kind: str, example: Any) -> None:
+        report[kind] += 1
+        if len(report["examples"][kind]) < max_examples:
+            report["examples"][kind].append(example)
+
+    started = time.perf_counter()
+    db_iter = _normalize(db_rows, "БД")
+    api_iter = _normalize(api_rows, "API")
+    db_item = next(db_iter, None)
+    api_item = next(api_iter, None)
+    while db_item is not None or api_item is not None:
+        if api_item is None or (db_item is not None and db_item[0] < api_item[0]):
+            report["db_rows"] += 1
+            record("missing_in_api", db_item[0])
+            db_item = next(db_iter, None)
+        elif db_item is None or api_item[0] < db_item[0]:
+            report["api_rows"] += 1
+            record("extra_in_api", api_item[0])
+            api_item = next(api_iter, None)
+        else:
+            report["db_rows"] += 1
+            report["api_rows"] += 1
+            if db_item[1] == api_item[1]:
+                report["matched"] += 1
+            else:
+                record("mismatched", {"teacher_id": db_item[0], "db": db_item[1], "api": api_item[1]})
+            db_item = next(db_iter, None)
+            api_item = next(api_iter, None)
+
+    elapsed = time.perf_counter() - started
+    report["elapsed"] = elapsed
+    total = report["db_rows"] + report["api_rows"]
+    report["rows_per_sec"] = total / elapsed if elapsed else 0.0
+    report["consistent"] = not (
+        report["missing_in_api"] or report["extra_in_api"] or report["mismatched"]
+    )
+    return report
+
+
+def check_consistency(db: TeacherTable, api: TeacherAPI, db_page_size: int = 1000,
+                      api_page_size: int = 100, max_examples: int = 100) -> Dict[str, Any]:
+    """
+    Сверить учителей в БД и в API постранично.
+
+    Args:
+        db (TeacherTable): Подключение к таблице учителей
+        api (TeacherAPI): API клиент учителей
+        db_page_size (int): Размер страницы чтения из БД
+        api_page_size (int): Размер страницы чтения из API
+        max_examples (int): Максимум сохраняемых примеров каждого расхождения
+
+    Returns:
+        Dict[str, Any]: Отчет merge_join
+    """
+    return merge_join(
+        db.iter_teachers(db_page_size), api.iter_teachers(api_page_size), max_examples
+    )
+
+
+def main() -> None:
+    """Точка входа командной строки."""
+    parser = argparse.ArgumentParser(description="Сверка учителей между БД и API")
+    parser.add_argument("--base-url", default="http://localhost:8080/api/v1")
+    parser.add_argument("--connection-string", default=None)
+    parser.add_argument("--db-page-size", type=int, default=1000)
+    parser.add_argument("--api-page-size", type=int, default=100)
+    args = parser.parse_args()
+    report = check_consistency(
+        TeacherTable(args.connection_string), TeacherAPI(args.base_url),
+        args.db_page_size, args.api_page_size
+    )
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    raise SystemExit(0 if report["consistent"] else 1)
+
+
+if __name__ == "__main__":
+    main()
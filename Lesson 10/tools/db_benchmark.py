@@ -0,0 +1,223 @@
+"""
+Сравнительный бенчмарк драйверов PostgreSQL на CRUD нагрузке таблицы teacher.
+
+Все драйверы выполняют одни и те же SQL запросы с commit после каждой
+операции, без валидации и трассировки TeacherTable, поэтому разница
+во времени относится к драйверу, а не к коду вокруг него.
+
+Запуск:
+    python -m tools.db_benchmark --drivers psycopg2 psycopg asyncpg --iterations 500
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from database.drivers import SUPPORTED_DRIVERS, get_driver, create_async_db_engine, create_db_engine
+
+
+# Операции одной итерации CRUD нагрузки
+CRUD_OPERATIONS = ("add", "exists", "update", "delete")
+
+# SQL запросы операций, общие для синхронных и асинхронных драйверов
+CRUD_STATEMENTS = {
+    "add": text("INSERT INTO teacher(teacher_id, email, group_id) "
+                "VALUES (:teacher_id, :email, :group_id)"),
+    "exists": text("SELECT COUNT(*) FROM teacher WHERE teacher_id = :teacher_id"),
+    "update": text("UPDATE teacher SET email = :email WHERE teacher_id = :teacher_id"),
+    "delete": text("DELETE FROM teacher WHERE teacher_id = :teacher_id"),
+}
+
+
+def _crud_params(teacher_id: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Сформировать параметры запросов одной итерации.
+
+    Args:
+        teacher_id (int): teacher_id итерации
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Параметры по имени операции
+    """
+    return {
+        "add": {"teacher_id": teacher_id, "email": f"bench{teacher_id}@mail.com", "group_id": 100},
+        "exists": {"teacher_id": teacher_id},
+        "update": {"teacher_id": teacher_id, "email": f"upd{teacher_id}@mail.com"},
+        "delete": {"teacher_id": teacher_id},
+    }
+
+
+def _result(driver: str, timings: Dict[str, float], iterations: int,
+            elapsed: float) -> Dict[str, Any]:
+    """
+    Сформировать результат бенчмарка одного драйвера.
+
+    Args:
+        driver (str): Имя драйвера
+        timings (Dict[str, float]): Суммарное время по каждой операции, сек
+        iterations (int): Количество итераций
+        elapsed (float): Общее время выполнения, сек
+
+    Returns:
+        Dict[str, Any]: Результат с ops/sec общим и по операциям
+    """
+    total_ops = iterations * len(CRUD_OPERATIONS)
+    return {
+        "driver": driver,
+        "iterations": iterations,
+        "operations": total_ops,
+        "elapsed": elapsed,
+        "ops_per_sec": total_ops / elapsed if elapsed else 0.0,
+        "per_operation": {
+            name: (iterations / spent if spent else 0.0)
+            for name, spent in timings.items()
+        },
+    }
+
+
+def run_sync_benchmark(driver: str, iterations: int = 500, start_id: int = 900000,
+                       connection_string: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Прогнать CRUD нагрузку на синхронном драйвере.
+
+    Args:
+        driver (str): Имя драйвера (psycopg2 или psycopg)
+        iterations (int): Количество итераций add/exists/update/delete
+        start_id (int): Первый teacher_id диапазона бенчмарка
+        connection_string (Optional[str]): Строка подключения к БД.
+            Если не указана, строится из конфигурации.
+
+    Returns:
+        Dict[str, Any]: Результат бенчмарка
+    """
+    engine = create_db_engine(connection_string, driver)
+    timings = dict.fromkeys(CRUD_OPERATIONS, 0.0)
+    started = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            for i in range(iterations):
+                params = _crud_params(start_id + i)
+                for name in CRUD_OPERATIONS:
+                    op_started = time.perf_counter()
+                    conn.execute(CRUD_STATEMENTS[name], params[name])
+                    conn.commit()
+                    timings[name] += time.perf_counter() - op_started
+    finally:
+        engine.dispose()
+    return _result(driver, timings, iterations, time.perf_counter() - started)
+
+
+async def _run_async_crud(driver: str, iterations: int, start_id: int,
+                          connection_string: Optional[str]) -> Dict[str, Any]:
+    """
+    Прогнать CRUD нагрузку на асинхронном движке теми же SQL запросами.
+
+    Args:
+        driver (str): Имя драйвера (asyncpg)
+        iterations (int): Количество итераций
+        start_id (int): Первый teacher_id диапазона бенчмарка
+        connection_string (Optional[str]): Строка подключения к БД
+
+    Returns:
+        Dict[str, Any]: Результат бенчмарка
+    """
+    engine = create_async_db_engine(connection_string, driver)
+    timings = dict.fromkeys(CRUD_OPERATIONS, 0.0)
+    started = time.perf_counter()
+    try:
+        async with engine.connect() as conn:
+            for i in range(iterations):
+                params = _crud_params(start_id + i)
+                for name in CRUD_OPERATIONS:
+                    op_started = time.perf_counter()
+                    await conn.execute(CRUD_STATEMENTS[name], params[name])
+                    await conn.commit()
+                    timings[name] += time.perf_counter() - op_started
+    finally:
+        await engine.dispose()
+    return _result(driver, timings, iterations, time.perf_counter() - started)
+
+
+def run_benchmark(drivers: List[str], iterations: int = 500, start_id: int = 900000,
+                  connection_string: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Прогнать бенчмарк для списка драйверов.
+
+    Ошибка одного драйвера (например, он не установлен) не прерывает
+    остальные: в результате для него заполняется поле error.
+
+    Args:
+        drivers (List[str]): Имена драйверов
+        iterations (int): Количество итераций на драйвер
+        start_id (int): Первый teacher_id диапазона бенчмарка
+        connection_string (Optional[str]): Строка подключения к БД. Диалект
+            в ней заменяется на диалект каждого драйвера.
+
+    Returns:
+        List[Dict[str, Any]]: Результаты, отсортированные по убыванию ops/sec
+    """
+    results = []
+    for driver in drivers:
+        try:
+            spec = get_driver(driver)
+            driver_url = None
+            if connection_string:
+                driver_url = make_url(connection_string).set(
+                    drivername=spec["dialect"]
+                ).render_as_string(hide_password=False)
+            if spec["is_async"]:
+                result = asyncio.run(
+                    _run_async_crud(driver, iterations, start_id, driver_url)
+                )
+            else:
+                result = run_sync_benchmark(driver, iterations, start_id, driver_url)
+        except Exception as e:
+            result = {"driver": driver, "ops_per_sec": 0.0, "error": str(e)}
+        results.append(result)
+    return sorted(results, key=lambda r: r["ops_per_sec"], reverse=True)
+
+
+def format_report(results: List[Dict[str, Any]]) -> str:
+    """
+    Отформатировать результаты бенчмарка в текстовую таблицу.
+
+    Args:
+        results (List[Dict[str, Any]]): Результаты run_benchmark
+
+    Returns:
+        str: Текстовый отчет
+    """
+    header = f"{'driver':<10} {'ops/sec':>10} " + " ".join(
+        f"{name:>9}" for name in CRUD_OPERATIONS
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        if "error" in result:
+            lines.append(f"{result['driver']:<10} {'ошибка':>10} {result['error']}")
+            continue
+        per_op = " ".join(
+            f"{result['per_operation'][name]:>9.1f}" for name in CRUD_OPERATIONS
+        )
+        lines.append(f"{result['driver']:<10} {result['ops_per_sec']:>10.1f} {per_op}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Точка входа командной строки."""
+    parser = argparse.ArgumentParser(description="Бенчмарк драйверов PostgreSQL")
+    parser.add_argument("--drivers", nargs="+", default=list(SUPPORTED_DRIVERS))
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--start-id", type=int, default=900000)
+    parser.add_argument("--connection-string", default=None)
+    args = parser.parse_args()
+    results = run_benchmark(args.drivers, args.iterations, args.start_id,
+                            args.connection_string)
+    print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
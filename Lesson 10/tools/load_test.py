@@ -0,0 +1,426 @@
+"""
+Нагрузочный тест API учителей по открытой модели.
+
+Запросы запускаются с заданной интенсивностью независимо от того,
+успели ли завершиться предыдущие (открытая модель). Задержка считается
+от запланированного момента запуска, поэтому очередь перед перегруженным
+сервером попадает в перцентили (поправка на coordinated omission).
+
+Запуск:
+    python -m tools.load_test --base-url http://localhost:8080/api/v1 --rate 200 --duration 30
+    python -m tools.load_test --local --rate 500 --duration 10 --mix get=70,list=10,create=10,update=10
+"""
+
+import argparse
+import itertools
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from api.teacher_api import TeacherAPI
+from utils.tracing import MODES, configure
+
+
+# Доли операций по умолчанию
+DEFAULT_MIX = {"get": 70, "list": 10, "create": 10, "update": 10}
+
+# Перцентили сводного отчета
+REPORT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class HdrHistogram:
+    """
+    Гистограмма задержек с ограниченной относительной погрешностью.
+
+    Значения хранятся в логарифмических корзинах, ширина которых задается
+    числом значащих цифр: при significant_digits=2 погрешность не больше 1%
+    во всем диапазоне от микросекунд до минут.
+    """
+
+    def __init__(self, significant_digits: int = 2) -> None:
+        """
+        Инициализация гистограммы.
+
+        Args:
+            significant_digits (int): Количество значащих десятичных цифр
+        """
+        self.significant_digits = significant_digits
+        self._log_ratio = math.log1p(10 ** -significant_digits)
+        self._counts: Counter = Counter()
+        self.total = 0
+        self.max = 0.0
+        self._sum = 0.0
+        self._sum_squares = 0.0
+
+    def record(self, seconds: float) -> None:
+        """
+        Учесть значение задержки.
+
+        Args:
+            seconds (float): Задержка в секундах
+        """
+        micros = max(seconds * 1e6, 1.0)
+        self._counts[int(math.log(micros) / self._log_ratio)] += 1
+        self.total += 1
+        self.max = max(self.max, seconds)
+        self._sum += seconds
+        self._sum_squares += seconds * seconds
+
+    def merge(self, other: "HdrHistogram") -> None:
+        """
+        Добавить значения другой гистограммы с той же точностью.
+
+        Args:
+            other (HdrHistogram): Гистограмма для слияния
+        """
+        self._counts.update(other._counts)
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self._sum += other._sum
+        self._sum_squares += other._sum_squares
+
+    def value_at(self, percentile: float) -> float:
+        """
+        Получить значение перцентиля.
+
+        Args:
+            percentile (float): Перцентиль от 0 до 100
+
+        Returns:
+            float: Верхняя граница корзины перцентиля в секундах
+        """
+        if not self.total:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100 * self.total))
+        seen = 0
+        for key in sorted(self._counts):
+            seen += self._counts[key]
+            if seen >= rank:
+                return min(math.exp((key + 1) * self._log_ratio) / 1e6, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.total if self.total else 0.0
+
+    @property
+    def stddev(self) -> float:
+        if not self.total:
+            return 0.0
+        return math.sqrt(max(self._sum_squares / self.total - self.mean ** 2, 0.0))
+
+    def percentile_distribution(self, ticks_per_half: int = 5) -> str:
+        """
+        Сформировать распределение перцентилей в формате .hgrm HdrHistogram.
+
+        Шаг между перцентилями уменьшается вдвое на каждой половине
+        оставшегося хвоста, поэтому хвост распределения виден подробно.
+
+        Args:
+            ticks_per_half (int): Количество строк на каждую половину хвоста
+
+        Returns:
+            str: Таблица Value / Percentile / TotalCount / 1/(1-Percentile), значения в мс
+        """
+        lines = [f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>14}", ""]
+        if self.total:
+            last = 1 - 1 / self.total
+            half = 0
+            while True:
+                low, high = 1 - 0.5 ** half, 1 - 0.5 ** (half + 1)
+                for tick in range(ticks_per_half):
+                    fraction = low + (high - low) * tick / ticks_per_half
+                    if fraction >= last:
+                        break
+                    lines.append(self._distribution_line(fraction))
+                else:
+                    half += 1
+                    continue
+                break
+            lines.append(self._distribution_line(1.0))
+        lines.append(f"#[Mean    = {self.mean * 1e3:12.3f}, StdDeviation   = {self.stddev * 1e3:12.3f}]")
+        lines.append(f"#[Max     = {self.max * 1e3:12.3f}, Total count    = {self.total:12d}]")
+        lines.append(f"#[Buckets = {len(self._counts):12d}, SignificantDigits = {self.significant_digits:9d}]")
+        return "\n".join(lines) + "\n"
+
+    def _distribution_line(self, fraction: float) -> str:
+        """
+        Сформировать строку распределения для доли значений.
+
+        Args:
+            fraction (float): Доля значений от 0 до 1
+
+        Returns:
+            str: Строка таблицы .hgrm
+        """
+        value = self.value_at(fraction * 100)
+        count = min(self.total, max(1, math.ceil(fraction * self.total)))
+        inverse = f"{1 / (1 - fraction):14.2f}" if fraction < 1 else f"{'inf':>14}"
+        return f"{value * 1e3:12.3f} {fraction:14.12f} {count:10d} {inverse}"
+
+
+def run_load(operations: Dict[str, Callable[[], Any]], rate: float, duration: float,
+             mix: Optional[Dict[str, float]] = None, max_workers: int = 64,
+             arrival: str = "poisson", seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Запустить операции с заданной интенсивностью по открытой модели.
+
+    Планировщик назначает каждому запросу момент запуска заранее
+    (равномерно или по пуассоновскому потоку) и отдает его в пул потоков.
+    Скорректированная задержка — от запланированного момента до завершения,
+    время обслуживания — от фактического запуска до завершения.
+
+    Args:
+        operations (Dict[str, Callable[[], Any]]): Операции по именам;
+            исключение операции считается ошибкой
+        rate (float): Целевая интенсивность, запросов в секунду
+        duration (float): Длительность в секундах
+        mix (Optional[Dict[str, float]]): Веса операций, по умолчанию поровну
+        max_workers (int): Размер пула потоков, выполняющих запросы
+        arrival (str): Поток запусков: poisson или constant
+        seed (Optional[int]): Seed генератора для воспроизводимости
+
+    Returns:
+        Dict[str, Any]: Сводка по операциям и всего, интенсивности, отставание
+            планировщика и гистограммы в ключе histograms
+
+    Raises:
+        ValueError: если параметры некорректны
+    """
+    if rate <= 0 or duration <= 0:
+        raise ValueError("rate и duration должны быть положительными числами")
+    if arrival not in ("poisson", "constant"):
+        raise ValueError(f"Неизвестный поток запусков: {arrival}")
+    mix = mix or dict.fromkeys(operations, 1)
+    unknown = set(mix) - set(operations)
+    if unknown:
+        raise ValueError(f"Неизвестные операции: {', '.join(sorted(unknown))}")
+    names = [name for name in mix if mix[name] > 0]
+    weights = [mix[name] for name in names]
+    rng = random.Random(seed)
+    stats = {
+        name: {"corrected": HdrHistogram(), "service": HdrHistogram(), "errors": Counter()}
+        for name in names
+    }
+    lock = threading.Lock()
+
+    def execute(name: str, intended: float) -> None:
+        started = time.perf_counter()
+        error = None
+        try:
+            operations[name]()
+        except Exception as exc:
+            error = type(exc).__name__
+        finished = time.perf_counter()
+        with lock:
+            stats[name]["corrected"].record(finished - intended)
+            stats[name]["service"].record(finished - started)
+            if error is not None:
+                stats[name]["errors"][error] += 1
+
+    scheduled = 0
+    max_lag = 0.0
+    offset = 0.0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while offset < duration:
+            intended = start + offset
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                max_lag = max(max_lag, -delay)
+            pool.submit(execute, rng.choices(names, weights)[0], intended)
+            scheduled += 1
+            offset = offset + rng.expovariate(rate) if arrival == "poisson" else scheduled / rate
+    elapsed = time.perf_counter() - start
+
+    total = {"corrected": HdrHistogram(), "service": HdrHistogram(), "errors": Counter()}
+    for item in stats.values():
+        total["corrected"].merge(item["corrected"])
+        total["service"].merge(item["service"])
+        total["errors"].update(item["errors"])
+    return {
+        "target_rate": rate,
+        "achieved_rate": total["corrected"].total / elapsed if elapsed else 0.0,
+        "duration": elapsed,
+        "scheduled": scheduled,
+        "max_scheduler_lag": max_lag,
+        "operations": {name: _summary(item) for name, item in stats.items()},
+        "total": _summary(total),
+        "histograms": {**{name: item["corrected"] for name, item in stats.items()},
+                       "total": total["corrected"]},
+    }
+
+
+def _summary(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Свести гистограммы и ошибки операции в словарь.
+
+    Args:
+        item (Dict[str, Any]): Гистограммы corrected/service и счетчик ошибок
+
+    Returns:
+        Dict[str, Any]: Количество, доля ошибок и перцентили в миллисекундах
+    """
+    count = item["corrected"].total
+    errors = sum(item["errors"].values())
+
+    def percentiles(histogram: HdrHistogram) -> Dict[str, float]:
+        values = {f"p{p:g}": histogram.value_at(p) * 1e3 for p in REPORT_PERCENTILES}
+        values["max"] = histogram.max * 1e3
+        return values
+
+    return {
+        "count": count,
+        "errors": errors,
+        "error_rate": errors / count if count else 0.0,
+        "error_types": dict(item["errors"]),
+        "latency_ms": percentiles(item["corrected"]),
+        "service_time_ms": percentiles(item["service"]),
+    }
+
+
+def teacher_operations(api: TeacherAPI, seed_teachers: int = 100,
+                       group_id: int = 100) -> Dict[str, Callable[[], Any]]:
+    """
+    Подготовить учителей и операции нагрузки над TeacherAPI.
+
+    Args:
+        api (TeacherAPI): Клиент API учителей
+        seed_teachers (int): Количество учителей, создаваемых перед нагрузкой
+        group_id (int): Группа создаваемых учителей
+
+    Returns:
+        Dict[str, Callable[[], Any]]: Операции get, list, search, create и update
+    """
+    prefix = f"load{int(time.time())}"
+    numbers = itertools.count()
+    seeded = api.create_teachers(
+        [{"email": f"{prefix}_{next(numbers)}@test.com", "group_id": group_id}
+         for _ in range(seed_teachers)]
+    )
+    teachers: List[Dict[str, Any]] = [teacher for teacher in seeded["results"] if teacher]
+    if not teachers:
+        raise RuntimeError("Не удалось создать учителей для нагрузки")
+    ids = [teacher["teacher_id"] for teacher in teachers]
+
+    def get() -> None:
+        if api.get_teacher_by_id(random.choice(ids)) is None:
+            raise LookupError("Учитель не найден")
+
+    def create() -> None:
+        teacher = api.create_teacher({"email": f"{prefix}_{next(numbers)}@test.com",
+                                      "group_id": group_id})
+        ids.append(teacher["teacher_id"])
+
+    return {
+        "get": get,
+        "list": lambda: api.get_teachers_by_group(group_id),
+        "search": lambda: api.search_teachers_by_email(random.choice(teachers)["email"]),
+        "create": create,
+        "update": lambda: api.update_teacher_email(
+            random.choice(ids), f"{prefix}_{next(numbers)}@test.com"
+        ),
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """
+    Сформировать текстовый отчет: сводку по операциям и распределение .hgrm.
+
+    Args:
+        report (Dict[str, Any]): Результат run_load
+
+    Returns:
+        str: Отчет для вывода или записи в файл
+    """
+    lines = [
+        f"Целевая интенсивность: {report['target_rate']:.1f} rps, "
+        f"достигнутая: {report['achieved_rate']:.1f} rps, "
+        f"длительность: {report['duration']:.1f} с, "
+        f"макс. отставание планировщика: {report['max_scheduler_lag'] * 1e3:.1f} мс",
+        "",
+        f"{'Операция':<10}{'Кол-во':>9}{'Ошибки':>9}"
+        + "".join(f"{'p' + format(p, 'g'):>10}" for p in REPORT_PERCENTILES) + f"{'max':>10}",
+    ]
+    for name, item in [*report["operations"].items(), ("total", report["total"])]:
+        latency = item["latency_ms"]
+        lines.append(
+            f"{name:<10}{item['count']:>9}{item['error_rate']:>8.1%} "
+            + "".join(f"{latency[f'p{p:g}']:>10.2f}" for p in REPORT_PERCENTILES)
+            + f"{latency['max']:>10.2f}"
+        )
+    lines += ["", "Распределение скорректированной задержки (мс):", ""]
+    lines.append(report["histograms"]["total"].percentile_distribution())
+    return "\n".join(lines)
+
+
+def _parse_mix(value: str) -> Dict[str, float]:
+    """
+    Разобрать доли операций из строки вида get=70,list=10.
+
+    Args:
+        value (str): Строка с долями
+
+    Returns:
+        Dict[str, float]: Веса операций
+    """
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def main() -> None:
+    """Точка входа командной строки."""
+    parser = argparse.ArgumentParser(description="Нагрузочный тест API учителей (открытая модель)")
+    parser.add_argument("--base-url", default="http://localhost:8080/api/v1")
+    parser.add_argument("--local", action="store_true",
+                        help="Запустить локальный сервер учителей в процессе")
+    parser.add_argument("--rate", type=float, default=100.0)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--mix", type=_parse_mix, default=DEFAULT_MIX)
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--arrival", choices=("poisson", "constant"), default="poisson")
+    parser.add_argument("--seed-teachers", type=int, default=100)
+    parser.add_argument("--output", default=None, help="Файл для распределения .hgrm")
+    parser.add_argument("--json", action="store_true", help="Вывести сводку в JSON")
+    parser.add_argument("--trace-mode", choices=MODES, default="off",
+                        help="Режим трассировки вызовов клиента (по умолчанию выключена)")
+    args = parser.parse_args()
+    configure(mode=args.trace_mode)
+
+    server = None
+    base_url = args.base_url
+    if args.local:
+        from tools.teacher_server import TeacherServer
+        server = TeacherServer().start()
+        base_url = server.url
+    try:
+        api = TeacherAPI(base_url, pool_maxsize=args.workers)
+        report = run_load(teacher_operations(api, args.seed_teachers), args.rate, args.duration,
+                          args.mix, args.workers, args.arrival)
+    finally:
+        if server is not None:
+            server.stop()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(report["histograms"]["total"].percentile_distribution())
+    if args.json:
+        summary = {key: value for key, value in report.items() if key != "histograms"}
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(report))
+    raise SystemExit(0 if report["total"]["error_rate"] == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,564 @@
+"""
+Локальный REST сервер учителей для контрактных и нагрузочных тестов.
+
+Реализует ресурс /api/v1/teachers в том виде, в каком его использует
+TeacherAPI: список с фильтрами group_id/email и keyset-пагинацией
+limit/after_id, получение, создание, обновление и удаление. Данные
+хранятся в памяти или в TeacherTable (например, на SQLite). Тела
+запросов с Content-Encoding распаковываются, а ответы больше
+compress_min_size сжимаются по Accept-Encoding.
+
+Запуск:
+    python -m tools.teacher_server --port 8080
+    python -m tools.teacher_server --port 8080 --connection-string sqlite:///teachers.db
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from api.compression import compress, decompress, negotiate
+from database.teacher_table import TeacherTable
+
+
+class ConflictError(Exception):
+    """
+    Учитель с таким teacher_id уже существует.
+    """
+
+
+class UnsupportedEncodingError(ValueError):
+    """
+    Тело запроса сжато неподдерживаемым способом.
+    """
+
+
+class InMemoryTeacherStore:
+    """
+    Потокобезопасное хранилище учителей в памяти.
+    """
+
+    def __init__(self, teachers: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Инициализация хранилища.
+
+        Args:
+            teachers (Optional[List[Dict[str, Any]]]): Начальные данные учителей
+        """
+        self._teachers: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        for teacher in teachers or []:
+            self.create(teacher)
+
+    def list(self, group_id: Optional[int] = None, email: Optional[str] = None,
+             limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Получить учителей по фильтрам в порядке teacher_id.
+
+        Args:
+            group_id (Optional[int]): ID группы
+            email (Optional[str]): Email
+            limit (Optional[int]): Максимум учителей
+            after_id (Optional[int]): Вернуть учителей с teacher_id больше указанного
+
+        Returns:
+            List[Dict[str, Any]]: Данные учителей
+        """
+        with self._lock:
+            teachers = [dict(self._teachers[key]) for key in sorted(self._teachers)]
+        return _filter(teachers, group_id, email, limit, after_id)
+
+    def get(self, teacher_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Получить учителя по ID.
+
+        Args:
+            teacher_id (int): ID учителя
+
+        Returns:
+            Optional[Dict[str, Any]]: Данные учителя или None
+        """
+        with self._lock:
+            teacher = self._teachers.get(teacher_id)
+            return dict(teacher) if teacher is not None else None
+
+    def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Создать учителя; teacher_id назначается, если не передан.
+
+        Args:
+            data (Dict[str, Any]): Данные учителя
+
+        Returns:
+            Dict[str, Any]: Данные созданного учителя
+
+        Raises:
+            ValueError: если данные некорректны
+            ConflictError: если teacher_id занят
+        """
+        TeacherTable.validate_email(data.get('email'))
+        TeacherTable.validate_group_id(data.get('group_id'))
+        with self._lock:
+            teacher_id = data.get('teacher_id') or max(self._teachers, default=0) + 1
+            if teacher_id in self._teachers:
+                raise ConflictError(f"Учитель {teacher_id} уже существует")
+            teacher = {'teacher_id': teacher_id, 'email': data['email'], 'group_id': data['group_id']}
+            self._teachers[teacher_id] = teacher
+            return dict(teacher)
+
+    def update(self, teacher_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Обновить email и/или группу учителя.
+
+        Args:
+            teacher_id (int): ID учителя
+            data (Dict[str, Any]): Новые значения полей
+
+        Returns:
+            Optional[Dict[str, Any]]: Обновленные данные или None если учитель не найден
+
+        Raises:
+            ValueError: если данные некорректны
+        """
+        if 'email' in data:
+            TeacherTable.validate_email(data['email'])
+        if 'group_id' in data:
+            TeacherTable.validate_group_id(data['group_id'])
+        with self._lock:
+            teacher = self._teachers.get(teacher_id)
+            if teacher is None:
+                return None
+            teacher.update({key: data[key] for key in ('email', 'group_id') if key in data})
+            return dict(teacher)
+
+    def delete(self, teacher_id: int) -> bool:
+        """
+        Удалить учителя.
+
+        Args:
+            teacher_id (int): ID учителя
+
+        Returns:
+            bool: True если учитель был удален
+        """
+        with self._lock:
+            return self._teachers.pop(teacher_id, None) is not None
+
+
+class TableTeacherStore:
+    """
+    Хранилище учителей поверх TeacherTable.
+
+    Сессия TeacherTable не потокобезопасна, поэтому запросы выполняются
+    по одному под блокировкой. Группу существующего учителя TeacherTable
+    менять не умеет, такой запрос отклоняется.
+    """
+
+    def __init__(self, table: TeacherTable) -> None:
+        """
+        Инициализация хранилища.
+
+        Args:
+            table (TeacherTable): Таблица учителей
+        """
+        self.table = table
+        self._lock = threading.Lock()
+
+    def list(self, group_id: Optional[int] = None, email: Optional[str] = None,
+             limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Получить учителей по фильтрам в порядке teacher_id.
+
+        Args:
+            group_id (Optional[int]): ID группы
+            email (Optional[str]): Email
+            limit (Optional[int]): Максимум учителей
+            after_id (Optional[int]): Вернуть учителей с teacher_id больше указанного
+
+        Returns:
+            List[Dict[str, Any]]: Данные учителей
+        """
+        with self._lock:
+            if group_id is not None:
+                rows = sorted(self.table.get_teachers_by_group(group_id))
+            else:
+                rows = list(self.table.iter_teachers())
+        return _filter([_row_to_dict(row) for row in rows], group_id, email, limit, after_id)
+
+    def get(self, teacher_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Получить учителя по ID.
+
+        Args:
+            teacher_id (int): ID учителя
+
+        Returns:
+            Optional[Dict[str, Any]]: Данные учителя или None
+        """
+        with self._lock:
+            rows = self.table.get_teachers_in_range(teacher_id, teacher_id)
+        return _row_to_dict(rows[0]) if rows else None
+
+    def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Создать учителя; teacher_id назначается, если не передан.
+
+        Args:
+            data (Dict[str, Any]): Данные учителя
+
+        Returns:
+            Dict[str, Any]: Данные созданного учителя
+
+        Raises:
+            ValueError: если данные некорректны
+            ConflictError: если teacher_id занят
+        """
+        with self._lock:
+            teacher_id = data.get('teacher_id')
+            if teacher_id is None:
+                teacher_id = max((row[0] for row in self.table.iter_teachers()), default=0) + 1
+            elif self.table.teacher_exists(teacher_id):
+                raise ConflictError(f"Учитель {teacher_id} уже существует")
+            self.table.add_teacher(teacher_id, data.get('email'), data.get('group_id'))
+        return {'teacher_id': teacher_id, 'email': data['email'], 'group_id': data['group_id']}
+
+    def update(self, teacher_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Обновить email учителя.
+
+        Args:
+            teacher_id (int): ID учителя
+            data (Dict[str, Any]): Новые значения полей
+
+        Returns:
+            Optional[Dict[str, Any]]: Обновленные данные или None если учитель не найден
+
+        Raises:
+            ValueError: если данные некорректны или меняется группа
+        """
+        teacher = self.get(teacher_id)
+        if teacher is None:
+            return None
+        if data.get('group_id', teacher['group_id']) != teacher['group_id']:
+            raise ValueError("Изменение group_id не поддерживается TeacherTable")
+        if 'email' in data:
+            with self._lock:
+                self.table.update_teacher(teacher_id, data['email'])
+            teacher['email'] = data['email']
+        return teacher
+
+    def delete(self, teacher_id: int) -> bool:
+        """
+        Удалить учителя.
+
+        Args:
+            teacher_id (int): ID учителя
+
+        Returns:
+            bool: True если учитель был удален
+        """
+        with self._lock:
+            if not self.table.teacher_exists(teacher_id):
+                return False
+            self.table.delete(teacher_id)
+            return True
+
+
+def _row_to_dict(row: Tuple) -> Dict[str, Any]:
+    """
+    Преобразовать строку таблицы teacher в словарь API.
+
+    Args:
+        row (Tuple): Строка (teacher_id, email, group_id)
+
+    Returns:
+        Dict[str, Any]: Данные учителя
+    """
+    return {'teacher_id': row[0], 'email': row[1], 'group_id': row[2]}
+
+
+def _filter(teachers: List[Dict[str, Any]], group_id: Optional[int], email: Optional[str],
+            limit: Optional[int], after_id: Optional[int]) -> List[Dict[str, Any]]:
+    """
+    Применить фильтры и keyset-пагинацию к отсортированному списку учителей.
+
+    Args:
+        teachers (List[Dict[str, Any]]): Учителя в порядке teacher_id
+        group_id (Optional[int]): ID группы
+        email (Optional[str]): Email
+        limit (Optional[int]): Максимум учителей
+        after_id (Optional[int]): Нижняя граница teacher_id, не включительно
+
+    Returns:
+        List[Dict[str, Any]]: Отфильтрованные учителя
+    """
+    result = [
+        teacher for teacher in teachers
+        if (group_id is None or teacher['group_id'] == group_id)
+        and (email is None or teacher['email'] == email)
+        and (after_id is None or teacher['teacher_id'] > after_id)
+    ]
+    return result[:limit] if limit is not None else result
+
+
+class _TeacherRequestHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик запросов к ресурсу teachers.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Заголовки и тело уходят отдельными send: без TCP_NODELAY ответ
+    # задерживается на ~40 мс из-за алгоритма Нейгла и отложенного ACK
+    disable_nagle_algorithm = True
+    server: "TeacherServer"
+
+    def do_GET(self) -> None:
+        self._dispatch('GET')
+
+    def do_HEAD(self) -> None:
+        self._dispatch('HEAD')
+
+    def do_POST(self) -> None:
+        self._dispatch('POST')
+
+    def do_PUT(self) -> None:
+        self._dispatch('PUT')
+
+    def do_DELETE(self) -> None:
+        self._dispatch('DELETE')
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _dispatch(self, method: str) -> None:
+        """
+        Разобрать путь и выполнить операцию над хранилищем.
+
+        Непредвиденная ошибка хранилища отвечает 500 с JSON телом, а не
+        обрывом соединения, чтобы клиент видел статус и мог повторить запрос.
+
+        Args:
+            method (str): HTTP метод
+        """
+        parts = urlsplit(self.path)
+        prefix = self.server.prefix + '/teachers'
+        path = parts.path.rstrip('/')
+        try:
+            body = self._read_body()
+            if path == prefix:
+                self._collection(method, parse_qs(parts.query), body)
+            elif path.startswith(prefix + '/') and path[len(prefix) + 1:].isdigit():
+                self._item(method, int(path[len(prefix) + 1:]), body)
+            else:
+                self._send(404, {'error': 'not found'})
+        except ConflictError as error:
+            self._send(409, {'error': str(error)})
+        except UnsupportedEncodingError as error:
+            self._send(415, {'error': str(error)})
+        except (ValueError, TypeError, KeyError) as error:
+            self._send(400, {'error': str(error)})
+        except Exception as error:
+            self._send(500, {'error': f"{type(error).__name__}: {error}"})
+
+    def _collection(self, method: str, query: Dict[str, List[str]], body: Any) -> None:
+        """
+        Обработать запрос к коллекции учителей.
+
+        Args:
+            method (str): HTTP метод
+            query (Dict[str, List[str]]): Параметры запроса
+            body (Any): Декодированное тело запроса
+        """
+        store = self.server.store
+        if method in ('GET', 'HEAD'):
+            def param(name: str, cast: Any = int) -> Any:
+                return cast(query[name][0]) if name in query else None
+
+            teachers = store.list(param('group_id'), param('email', str),
+                                  param('limit'), param('after_id'))
+            self._send(200, teachers, head=method == 'HEAD')
+        elif method == 'POST':
+            self._send(201, store.create(body or {}))
+        else:
+            self._send(405, {'error': 'method not allowed'})
+
+    def _item(self, method: str, teacher_id: int, body: Any) -> None:
+        """
+        Обработать запрос к учителю по ID.
+
+        Args:
+            method (str): HTTP метод
+            teacher_id (int): ID учителя
+            body (Any): Декодированное тело запроса
+        """
+        store = self.server.store
+        if method in ('GET', 'HEAD'):
+            teacher = store.get(teacher_id)
+        elif method == 'PUT':
+            teacher = store.update(teacher_id, body or {})
+        elif method == 'DELETE':
+            if store.delete(teacher_id):
+                self._send(204, None)
+                return
+            teacher = None
+        else:
+            self._send(405, {'error': 'method not allowed'})
+            return
+        if teacher is None:
+            self._send(404, {'error': f'teacher {teacher_id} not found'}, head=method == 'HEAD')
+        else:
+            self._send(200, teacher, head=method == 'HEAD')
+
+    def _read_body(self) -> Any:
+        """
+        Прочитать, распаковать по Content-Encoding и декодировать JSON тело запроса.
+
+        Returns:
+            Any: Декодированное тело или None
+
+        Raises:
+            UnsupportedEncodingError: если сжатие тела не поддерживается
+        """
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return None
+        body = self.rfile.read(length)
+        encoding = self.headers.get('Content-Encoding', '')
+        try:
+            body = decompress(body, encoding)
+        except ValueError as error:
+            raise UnsupportedEncodingError(str(error)) from error
+        return json.loads(body)
+
+    def _send(self, status: int, payload: Any, head: bool = False) -> None:
+        """
+        Отправить JSON ответ; для 200 добавляется ETag и учитывается If-None-Match.
+
+        Тело больше compress_min_size сжимается первым подходящим сжатием
+        из Accept-Encoding; ETag считается по несжатому телу.
+
+        Args:
+            status (int): HTTP статус
+            payload (Any): Данные для сериализации в JSON
+            head (bool): Отправить только заголовки
+        """
+        body = json.dumps(payload).encode() if payload is not None else b''
+        headers = {'Content-Type': 'application/json'}
+        if status == 200:
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            headers['ETag'] = etag
+            if self.headers.get('If-None-Match') == etag:
+                status, body = 304, b''
+        encoding = negotiate(self.headers.get('Accept-Encoding'))
+        min_size = self.server.compress_min_size
+        if encoding and min_size is not None and len(body) >= min_size:
+            body = compress(body, encoding)
+            headers['Content-Encoding'] = encoding
+            headers['Vary'] = 'Accept-Encoding'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+
+class TeacherServer(ThreadingHTTPServer):
+    """
+    Многопоточный HTTP/1.1 сервер ресурса teachers.
+
+    Каждое соединение обслуживается отдельным потоком и поддерживает
+    keep-alive, поэтому клиенты переиспользуют соединения из пула.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, store: Optional[Any] = None, host: str = '127.0.0.1',
+                 port: int = 0, prefix: str = '/api/v1',
+                 compress_min_size: Optional[int] = 1024) -> None:
+        """
+        Инициализация сервера.
+
+        Args:
+            store (Optional[Any]): Хранилище учителей (InMemoryTeacherStore
+                или TableTeacherStore); по умолчанию пустое в памяти
+            host (str): Адрес для прослушивания
+            port (int): Порт, 0 — свободный порт
+            prefix (str): Префикс пути API
+            compress_min_size (Optional[int]): Размер тела ответа в байтах, начиная
+                с которого ответ сжимается; None — без сжатия
+        """
+        super().__init__((host, port), _TeacherRequestHandler)
+        self.store = store if store is not None else InMemoryTeacherStore()
+        self.prefix = prefix.rstrip('/')
+        self.compress_min_size = compress_min_size
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """
+        Базовый URL API сервера.
+
+        Returns:
+            str: URL вида http://127.0.0.1:port/api/v1
+        """
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{self.prefix}"
+
+    def start(self) -> "TeacherServer":
+        """
+        Запустить сервер в фоновом потоке.
+
+        Returns:
+            TeacherServer: Запущенный сервер
+        """
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Остановить сервер и закрыть сокет.
+        """
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self) -> "TeacherServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """Точка входа командной строки."""
+    parser = argparse.ArgumentParser(description="Локальный REST сервер учителей")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--connection-string", default=None,
+                        help="Хранить учителей в TeacherTable вместо памяти")
+    parser.add_argument("--compress-min-size", type=int, default=1024,
+                        help="Сжимать ответы от этого размера в байтах; отрицательное — без сжатия")
+    args = parser.parse_args()
+    store = TableTeacherStore(TeacherTable(args.connection_string)) if args.connection_string else None
+    compress_min_size = args.compress_min_size if args.compress_min_size >= 0 else None
+    server = TeacherServer(store, args.host, args.port, compress_min_size=compress_min_size)
+    print(f"Сервер учителей: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Пакет со вспомогательными модулями, общими для API, БД и страниц."""
@@ -0,0 +1,265 @@
+"""Трассировка вызовов шагами Allure: полная или с выборкой и отложенной выгрузкой."""
+
+import functools
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar
+
+import allure
+from allure_commons.utils import func_parameters, represent
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+MODES = ('off', 'sampled', 'full')
+
+
+class Span:
+    """
+    Запись об одном вызове размеченной функции.
+
+    Заголовок не форматируется при вызове: функция и аргументы сохраняются,
+    а строка шага строится только при выгрузке в Allure.
+    """
+
+    __slots__ = ('title', 'func', 'args', 'kwargs', 'depth', 'thread', 'duration', 'error')
+
+    def __init__(self, title: str, func: Callable[..., Any], args: tuple,
+                 kwargs: Dict[str, Any], depth: int, thread: int) -> None:
+        self.title = title
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.depth = depth
+        self.thread = thread
+        self.duration: Optional[float] = None
+        self.error: Optional[BaseException] = None
+
+    def to_step(self) -> Any:
+        """
+        Построить шаг Allure с заголовком и параметрами, как у allure.step.
+
+        Returns:
+            Any: Контекст шага Allure
+        """
+        try:
+            params = func_parameters(self.func, *self.args, **self.kwargs)
+            title = self.title.format(*map(represent, self.args), **params)
+        except Exception:
+            params, title = {}, self.title
+        if self.duration is not None:
+            params['duration_ms'] = f"{self.duration * 1000:.3f}"
+        step = allure.step(title)
+        step.params = params
+        return step
+
+
+class Tracer:
+    """
+    Трассировщик с режимами off, sampled и full.
+
+    off — размеченная функция вызывается напрямую после одной проверки флага.
+    full — каждый вызов сразу открывает шаг Allure, как allure.step: шаги
+    попадают внутрь шагов теста, а аргументы не хранятся после вызова.
+    sampled — записывается доля rate деревьев вызовов: решение принимается
+    на внешнем вызове и наследуется вложенными. Записи хранятся в кольцевом
+    буфере на buffer_size вызовов: при переполнении вытесняются самые старые.
+    flush выгружает буфер шагами Allure с вложенностью.
+    Счетчики stats относятся к буферу режима sampled.
+    """
+
+    def __init__(self, mode: str = 'full', sample_rate: float = 0.01,
+                 buffer_size: int = 10000, seed: Optional[int] = None) -> None:
+        """
+        Инициализация трассировщика.
+
+        Args:
+            mode (str): Режим: off, sampled или full
+            sample_rate (float): Доля записываемых деревьев вызовов в режиме sampled
+            buffer_size (int): Размер кольцевого буфера записей
+            seed (Optional[int]): Зерно генератора выборки
+
+        Raises:
+            ValueError: если режим неизвестен
+        """
+        self._local = threading.local()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.configure(mode, sample_rate, buffer_size)
+
+    def configure(self, mode: Optional[str] = None, sample_rate: Optional[float] = None,
+                  buffer_size: Optional[int] = None) -> None:
+        """
+        Изменить настройки; новый размер буфера сбрасывает записи.
+
+        Args:
+            mode (Optional[str]): Режим: off, sampled или full
+            sample_rate (Optional[float]): Доля записываемых деревьев вызовов
+            buffer_size (Optional[int]): Размер кольцевого буфера записей
+
+        Raises:
+            ValueError: если режим неизвестен
+        """
+        if mode is not None:
+            if mode not in MODES:
+                raise ValueError(f"Неизвестный режим трассировки: {mode}")
+            self.mode = mode
+            self.enabled = mode != 'off'
+        if sample_rate is not None:
+            self.sample_rate = sample_rate
+        if buffer_size is not None:
+            with self._lock:
+                self.buffer: Deque[Span] = deque(maxlen=buffer_size)
+                self.stats = {'recorded': 0, 'flushed': 0, 'dropped': 0}
+
+    def run(self, title: str, func: Callable[..., Any], args: tuple,
+            kwargs: Dict[str, Any]) -> Any:
+        """
+        Вызвать функцию: в режиме full внутри шага Allure, в режиме sampled
+        с записью в буфер, если вызов попал в выборку.
+
+        Args:
+            title (str): Шаблон заголовка шага
+            func (Callable[..., Any]): Размеченная функция
+            args (tuple): Позиционные аргументы
+            kwargs (Dict[str, Any]): Именованные аргументы
+
+        Returns:
+            Any: Результат функции
+        """
+        if self.mode == 'full':
+            # Без общих счетчиков: шаг пишет Allure, а блокировка на каждом
+            # вызове сериализовала бы потоки
+            with Span(title, func, args, kwargs, 0, threading.get_ident()).to_step():
+                return func(*args, **kwargs)
+        local = self._local
+        depth = getattr(local, 'depth', 0)
+        if depth == 0:
+            local.sampled = self._random.random() < self.sample_rate
+        local.depth = depth + 1
+        try:
+            if not local.sampled:
+                return func(*args, **kwargs)
+            span = Span(title, func, args, kwargs, depth, threading.get_ident())
+            with self._lock:
+                if len(self.buffer) == self.buffer.maxlen:
+                    self.stats['dropped'] += 1
+                self.buffer.append(span)
+                self.stats['recorded'] += 1
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except BaseException as error:
+                span.error = error
+                raise
+            finally:
+                span.duration = time.perf_counter() - started
+        finally:
+            local.depth = depth
+
+    def flush(self) -> int:
+        """
+        Выгрузить записанные вызовы шагами Allure и очистить буфер.
+
+        Вызовы каждого потока выгружаются отдельной последовательностью,
+        вложенность восстанавливается по глубине; длительность шага
+        передается параметром duration_ms, упавшие вызовы помечаются ошибкой.
+
+        Returns:
+            int: Количество выгруженных шагов
+        """
+        spans: List[Span] = []
+        while True:
+            try:
+                spans.append(self.buffer.popleft())
+            except IndexError:
+                break
+        by_thread: Dict[int, List[Span]] = {}
+        for span in spans:
+            by_thread.setdefault(span.thread, []).append(span)
+        for thread_spans in by_thread.values():
+            self._emit(thread_spans)
+        with self._lock:
+            self.stats['flushed'] += len(spans)
+        return len(spans)
+
+    def clear(self) -> None:
+        """
+        Удалить записанные вызовы без выгрузки.
+        """
+        with self._lock:
+            self.buffer.clear()
+
+    @staticmethod
+    def _emit(spans: List[Span]) -> None:
+        """
+        Выгрузить вызовы одного потока вложенными шагами Allure.
+
+        Args:
+            spans (List[Span]): Вызовы в порядке начала
+        """
+        opened: List[Any] = []
+
+        def close_last() -> None:
+            step, span = opened.pop()
+            error = span.error
+            step.__exit__(type(error) if error else None, error,
+                          error.__traceback__ if error else None)
+
+        for span in spans:
+            # Если родитель вытеснен из буфера, шаг выгружается на верхний уровень
+            while opened and opened[-1][1].depth >= span.depth:
+                close_last()
+            step = span.to_step()
+            step.__enter__()
+            opened.append((step, span))
+        while opened:
+            close_last()
+
+
+# Трассировщик процесса; настраивается переменными окружения TRACE_MODE,
+# TRACE_SAMPLE_RATE и TRACE_BUFFER_SIZE или функцией configure
+tracer = Tracer(
+    mode=os.getenv('TRACE_MODE', 'full'),
+    sample_rate=float(os.getenv('TRACE_SAMPLE_RATE', '0.01')),
+    buffer_size=int(os.getenv('TRACE_BUFFER_SIZE', '10000'))
+)
+
+
+def configure(mode: Optional[str] = None, sample_rate: Optional[float] = None,
+              buffer_size: Optional[int] = None) -> None:
+    """
+    Изменить настройки трассировщика процесса.
+
+    Args:
+        mode (Optional[str]): Режим: off, sampled или full
+        sample_rate (Optional[float]): Доля записываемых деревьев вызовов
+        buffer_size (Optional[int]): Размер кольцевого буфера записей
+    """
+    tracer.configure(mode, sample_rate, buffer_size)
+
+
+def traced(title: str) -> Callable[[F], F]:
+    """
+    Разметить функцию как шаг трассировки вместо @allure.step.
+
+    Заголовок форматируется аргументами функции, как в allure.step;
+    в режиме sampled — только при выгрузке. В режиме off накладные
+    расходы — вызов обертки и проверка одного флага.
+
+    Args:
+        title (str): Шаблон заголовка шага
+
+    Returns:
+        Callable[[F], F]: Декоратор
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            return tracer.run(title, func, args, kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator